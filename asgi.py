@@ -0,0 +1,93 @@
+# ============================================================
+# ASGI entry point (async JSON prediction API + बाकी Flask app)
+# ============================================================
+#
+# चलाएँ: uvicorn asgi:app --host 0.0.0.0 --port 8000 --workers 2
+#
+# POST /api/v1/predict यहीं event loop पर चलता है: bearer token का HMAC check, JSON parse,
+# और cached prediction - कोई DB query, session या template नहीं। एक process इसलिए हज़ारों
+# खुली connections (धीमे mobile clients, keep-alive) संभाल सकता है, जबकि gunicorn sync
+# worker हर connection पर एक पूरा worker रोकता है।
+#
+# बाकी सारे routes (login, pages, /predict/batch, /metrics, ...) पहले की तरह Flask चलाता है,
+# WsgiToAsgi के thread pool में।
+
+import json
+
+from asgiref.wsgi import WsgiToAsgi
+
+import main as app_module
+
+API_PREDICT_PATH = '/api/v1/predict'
+# Symptoms की list के लिए काफी; बड़े batches /predict/batch पर जाएँ
+API_MAX_BODY = 64 * 1024
+
+flask_app = WsgiToAsgi(app_module.main)
+
+
+async def _send_json(send, status, body, headers=()):
+    payload = json.dumps(body).encode()
+    await send({'type': 'http.response.start', 'status': status,
+                'headers': [(b'content-type', b'application/json'),
+                            (b'content-length', str(len(payload)).encode()), *headers]})
+    await send({'type': 'http.response.body', 'body': payload})
+
+
+async def _read_body(receive, limit):
+    # Body limit से बड़ी हो तो None
+    chunks = []
+    size = 0
+    while True:
+        message = await receive()
+        if message['type'] == 'http.disconnect':
+            return None
+        chunk = message.get('body', b'')
+        size += len(chunk)
+        if size > limit:
+            return None
+        chunks.append(chunk)
+        if not message.get('more_body', False):
+            return b''.join(chunks)
+
+
+async def predict_endpoint(scope, receive, send):
+    if scope['method'] != 'POST':
+        await _send_json(send, 405, {'error': "Method not allowed."}, [(b'allow', b'POST')])
+        return
+
+    headers = dict(scope['headers'])
+    if app_module.verify_api_token(headers.get(b'authorization', b'').decode('latin-1')) is None:
+        await _send_json(send, 401, {'error': "Invalid or expired API token."})
+        return
+
+    body = await _read_body(receive, API_MAX_BODY)
+    if body is None:
+        await _send_json(send, 413, {'error': f"Body larger than {API_MAX_BODY} bytes."})
+        return
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        payload = None
+
+    response, status = app_module.api_predict(payload)
+    await _send_json(send, status, response)
+
+
+async def _lifespan(receive, send):
+    # Model import पर ही load हो चुका है; uvicorn को सिर्फ startup/shutdown का जवाब चाहिए
+    while True:
+        message = await receive()
+        if message['type'] == 'lifespan.startup':
+            await send({'type': 'lifespan.startup.complete'})
+        elif message['type'] == 'lifespan.shutdown':
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
+
+
+async def app(scope, receive, send):
+    if scope['type'] == 'lifespan':
+        await _lifespan(receive, send)
+    elif scope['type'] == 'http' and scope['path'] == API_PREDICT_PATH:
+        await predict_endpoint(scope, receive, send)
+    else:
+        await flask_app(scope, receive, send)
@@ -0,0 +1,70 @@
+# Authentication hot path: password hashing cost, login throughput, और authenticated requests
+# (load_user हर बार DB से बनाम user session cache से)। Benchmark एक temp SQLite DB पर चलता है।
+# चलाएँ: python -m benchmarks.bench_auth
+import atexit
+import os
+import shutil
+import tempfile
+import time
+
+_tmpdir = tempfile.mkdtemp(prefix='bench_auth_')
+atexit.register(shutil.rmtree, _tmpdir, ignore_errors=True)
+os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(_tmpdir, 'bench_auth.db')}"
+
+from werkzeug.security import check_password_hash, generate_password_hash  # noqa: E402
+
+import main  # noqa: E402
+from benchmarks.common import measure, report  # noqa: E402
+
+METHODS = ('scrypt:32768:8:1', 'scrypt:16384:8:1', 'pbkdf2:sha256:1000000', 'pbkdf2:sha256:600000',
+           'pbkdf2:sha256:100000')
+EMAIL = 'bench@example.com'
+PASSWORD = 'bench-password'
+
+
+def per_second(fn, seconds=2.0):
+    count = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        fn()
+        count += 1
+    return count / (time.perf_counter() - start)
+
+
+def logged_in_client():
+    client = main.main.test_client()
+    response = client.post('/login', data={'email': EMAIL, 'password': PASSWORD})
+    assert response.status_code == 302, response.status_code
+    return client
+
+
+if __name__ == '__main__':
+    app = main.main
+    with app.app_context():
+        main.db.create_all()
+        user = main.User(username='bench', email=EMAIL)
+        user.set_password(PASSWORD)
+        main.db.session.add(user)
+        main.db.session.commit()
+
+    print("check_password_hash per method:")
+    report([(method, measure(lambda h=generate_password_hash(PASSWORD, method): check_password_hash(h, PASSWORD),
+                             number=3, repeat=3)) for method in METHODS])
+
+    print(f"\nPOST /login (PASSWORD_HASH_METHOD={app.config['PASSWORD_HASH_METHOD']}): "
+          f"{per_second(logged_in_client):,.1f} logins/s")
+
+    client = logged_in_client()
+
+    def authenticated_request():
+        client.post('/symptoms/parse', json={'text': 'fever'})
+
+    cache = main.user_session_cache
+    maxsize = cache.maxsize
+    cache.maxsize = 0
+    uncached = per_second(authenticated_request)
+    cache.maxsize = maxsize
+    cached = per_second(authenticated_request)
+    print("\nAuthenticated POST /symptoms/parse:")
+    print(f"load_user from DB:     {uncached:8,.0f} req/s")
+    print(f"user session cache:    {cached:8,.0f} req/s  ({cache.stats()})")
@@ -0,0 +1,127 @@
+# User store under concurrent workers: कई processes एक ही SQLite file पर signup + login करते हैं।
+#
+#   before: default journal, कोई pragma नहीं, पुराना signup (SELECT email, फिर INSERT)
+#   after:  WAL + synchronous=NORMAL + busy_timeout + mmap (database.py), signup = एक INSERT
+#
+# हर 10वाँ signup किसी और process का email दोबारा इस्तेमाल करता है, ताकि duplicate-email race दिखे।
+# Password hashing सस्ता रखा गया है (pbkdf2:sha256:1000) ताकि database ही bottleneck रहे।
+# चलाएँ: python -m benchmarks.bench_db_concurrency --processes 4 --seconds 5
+import argparse
+import multiprocessing
+import os
+import shutil
+import tempfile
+import time
+
+HASH_METHOD = 'pbkdf2:sha256:1000'
+PRESEEDED_USERS = 200
+
+
+def _import_app(db_path, mode):
+    os.environ['DATABASE_URL'] = f"sqlite:///{db_path}"
+    os.environ['SQLITE_PRAGMAS'] = '1' if mode == 'after' else '0'
+    os.environ['PASSWORD_HASH_METHOD'] = HASH_METHOD
+    import logging
+
+    import main
+
+    # Locked/integrity errors 500 बनते हैं - उन्हें गिनते हैं, log नहीं करते
+    main.main.logger.setLevel(logging.CRITICAL)
+    return main
+
+
+def _add_old_signup_route(app_module):
+    # user-012 से पहले का signup(): पहले SELECT, फिर अलग INSERT
+    from flask import redirect, request, url_for
+
+    def old_signup():
+        User, db = app_module.User, app_module.db
+        email = request.form.get('email')
+        if User.query.filter_by(email=email).first():
+            return redirect(url_for('signup'))
+        user = User(username=request.form.get('username'), email=email)
+        user.set_password(request.form.get('password'))
+        db.session.add(user)
+        db.session.commit()
+        return redirect(url_for('login'))
+
+    app_module.main.add_url_rule('/bench/old-signup', 'bench_old_signup', old_signup, methods=['POST'])
+
+
+def seed(db_path, mode):
+    app_module = _import_app(db_path, mode)
+    with app_module.main.app_context():
+        app_module.db.create_all()
+        for i in range(PRESEEDED_USERS):
+            user = app_module.User(username=f"seed{i}", email=f"seed{i}@example.com")
+            user.set_password('password')
+            app_module.db.session.add(user)
+        app_module.db.session.commit()
+
+
+def worker(db_path, mode, worker_id, start_at, seconds):
+    app_module = _import_app(db_path, mode)
+    signup_url = '/signup'
+    if mode == 'before':
+        _add_old_signup_route(app_module)
+        signup_url = '/bench/old-signup'
+    app = app_module.main
+
+    counts = {'signups': 0, 'duplicates': 0, 'logins': 0, 'errors': 0}
+    time.sleep(max(0.0, start_at - time.time()))
+    deadline = time.time() + seconds
+    i = 0
+    while time.time() < deadline:
+        i += 1
+        # Race: हर 10वाँ signup worker 0 के email से
+        owner = 0 if i % 10 == 0 else worker_id
+        email = f"w{owner}-{i}@example.com"
+        # हर request नए client से - redirect follow नहीं होते, तो flash messages session cookie में जमा होते रहते
+        response = app.test_client().post(signup_url, data={'username': f"w{worker_id}-{i}", 'email': email,
+                                                            'password': 'password'})
+        # सफल signup /login पर जाता है, duplicate वापस /signup पर - सिर्फ 302 देखना दोनों को गिन लेता
+        location = response.headers.get('Location', '') if response.status_code == 302 else ''
+        if location.endswith('/login'):
+            counts['signups'] += 1
+        elif location.endswith('/signup'):
+            counts['duplicates'] += 1
+        else:
+            counts['errors'] += 1
+
+        response = app.test_client().post('/login', data={'email': f"seed{i % PRESEEDED_USERS}@example.com",
+                                                          'password': 'password'})
+        counts['logins' if response.status_code == 302 else 'errors'] += 1
+    return counts
+
+
+def run(mode, processes, seconds):
+    tmpdir = tempfile.mkdtemp(prefix='bench_db_')
+    try:
+        db_path = os.path.join(tmpdir, 'site.db')
+        ctx = multiprocessing.get_context('spawn')
+        with ctx.Pool(1) as pool:
+            pool.apply(seed, (db_path, mode))
+        start_at = time.time() + 5  # सभी workers import पूरा कर लें
+        with ctx.Pool(processes) as pool:
+            results = pool.starmap(worker, [(db_path, mode, w, start_at, seconds) for w in range(processes)])
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+    return {key: sum(result[key] for result in results) for key in results[0]}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Multi-process signup/login load test on SQLite.")
+    parser.add_argument('--processes', type=int, default=4)
+    parser.add_argument('--seconds', type=float, default=5.0)
+    args = parser.parse_args(argv)
+
+    print(f"{args.processes} processes, {args.seconds:g} s each mode")
+    for mode in ('before', 'after'):
+        totals = run(mode, args.processes, args.seconds)
+        print(f"{mode:<7} signups {totals['signups'] / args.seconds:8,.1f}/s   "
+              f"duplicates rejected {totals['duplicates']:6,}   "
+              f"logins {totals['logins'] / args.seconds:8,.1f}/s   errors (5xx) {totals['errors']}")
+
+
+if __name__ == '__main__':
+    main()
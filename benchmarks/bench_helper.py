@@ -0,0 +1,56 @@
+# helper(): पुराना DataFrame scan बनाम precomputed recommendation index
+# चलाएँ: python -m benchmarks.bench_helper
+import os
+
+import pandas as pd
+
+import main
+from benchmarks.common import measure, report
+
+
+def _load(filename):
+    return pd.read_csv(os.path.join(main.DATASETS_PATH, filename))
+
+
+description = _load("description.csv")
+precautions = _load("precautions_df.csv")
+medications = _load("medications.csv")
+diets = _load("diets.csv")
+workout = _load("workout_df.csv")
+
+
+# पुराना helper() - हर call पर पाँच boolean-mask scans
+def helper_dataframe_scan(dis):
+    desc_series = description[description['Disease'] == dis]['Description']
+    dis_des = desc_series.iloc[0] if not desc_series.empty else "No description available."
+
+    pre_data = precautions[precautions['Disease'] == dis][
+        ['Precaution_1', 'Precaution_2', 'Precaution_3', 'Precaution_4']]
+    pre = pre_data.values.tolist() if not pre_data.empty and len(pre_data) > 0 else [[]]
+
+    med = medications[medications['Disease'] == dis]['Medication']
+    medications_list = med.tolist() if not med.empty else []
+
+    die = diets[diets['Disease'] == dis]['Diet']
+    diets_list = die.tolist() if not die.empty else []
+
+    wrkout = workout[workout['disease'] == dis]['workout']
+    workout_list = wrkout.tolist() if not wrkout.empty else []
+
+    return dis_des, pre, medications_list, diets_list, workout_list
+
+
+def all_diseases(fn):
+    def run():
+        for dis in main.diseases_list.values():
+            fn(dis)
+    return run
+
+
+if __name__ == '__main__':
+    count = len(main.diseases_list)
+    scan = measure(all_diseases(helper_dataframe_scan), number=5)
+    indexed = measure(all_diseases(main.helper), number=2000)
+    print(f"helper() over all {count} diseases (per full pass):")
+    report([("dataframe scan", scan), ("recommendation index", indexed)])
+    print(f"speedup: {scan / indexed:.0f}x")
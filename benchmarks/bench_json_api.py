@@ -0,0 +1,66 @@
+# Server-rendered POST /predict बनाम JSON API (POST /api/v1/predict), असली servers पर
+#
+# gunicorn (sync worker) पर page और Flask वाला JSON route, और uvicorn (asgi.py) पर async JSON route -
+# तीनों एक-एक process के साथ। Client asyncio से एक साथ कई connections खोलता है, हर request
+# नई connection पर (sync worker keep-alive नहीं करता)। Temp DB में एक user बनाकर login/token लिया जाता है।
+# चलाएँ: python -m benchmarks.bench_json_api [--clients 50] [--requests 2000]
+import argparse
+import asyncio
+import itertools
+import os
+import shutil
+import sys
+import tempfile
+
+import numpy as np
+
+from benchmarks.loadgen import (api_request, create_user, gunicorn_command, page_request, run_load, session_cookie,
+                                start_server, stop_server)
+
+SYMPTOM_SETS = ('itching, skin_rash, nodal_skin_eruptions', 'cough, high_fever, breathlessness', 'headache',
+                'vomiting, fatigue, nausea, abdominal_pain', 'तेज बुखार, खांसी')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--clients', type=int, default=50)
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--port', type=int, default=8766)
+    args = parser.parse_args(argv)
+
+    tmpdir = tempfile.mkdtemp(prefix='bench_json_api_')
+    try:
+        database_url = f"sqlite:///{os.path.join(tmpdir, 'bench.db')}"
+        token = create_user(database_url)
+        env = dict(os.environ, DATABASE_URL=database_url, MODEL_RELOAD_INTERVAL='0', WEB_CONCURRENCY='1',
+                   PORT=str(args.port), METRICS_DIR=os.path.join(tmpdir, 'metrics'))
+        symptoms = list(itertools.islice(itertools.cycle(SYMPTOM_SETS), args.requests))
+
+        gunicorn = gunicorn_command()
+        uvicorn = [sys.executable, '-m', 'uvicorn', 'asgi:app', '--port', str(args.port), '--log-level', 'warning']
+        runs = [
+            ("gunicorn POST /predict (HTML page)", gunicorn, 'page'),
+            ("gunicorn POST /api/v1/predict", gunicorn, 'api'),
+            ("uvicorn POST /api/v1/predict (ASGI)", uvicorn, 'api'),
+        ]
+        print(f"{args.requests} requests, {args.clients} concurrent clients, 1 server process:")
+        for label, command, kind in runs:
+            proc = start_server(command, env, args.port)
+            try:
+                if kind == 'page':
+                    cookie = session_cookie(args.port)
+                    requests = [page_request(args.port, cookie, s) for s in symptoms]
+                else:
+                    requests = [api_request(args.port, token, s) for s in symptoms]
+                latencies, elapsed, sizes, statuses = asyncio.run(run_load(args.port, requests, args.clients))
+            finally:
+                stop_server(proc)
+            print(f"{label:<38} {args.requests / elapsed:7,.0f} req/s   p50 {np.percentile(latencies, 50):7.1f} ms"
+                  f"   p99 {np.percentile(latencies, 99):7.1f} ms   {np.mean(sizes) / 1024:5.1f} KB/response"
+                  f"   status {sorted(set(statuses))}")
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+# Model hot reload: नया version load करने में कितना समय, और reload के दौरान /predict latency
+#
+# Registry हर reload पर नया version swap करे, इसके लिए loader हर बार एक नया version id देता है।
+# Reload background thread में लगातार चलते हैं, request thread get_prediction_result() चलाता है।
+# चलाएँ: python -m benchmarks.bench_model_reload
+import itertools
+import logging
+import os
+import threading
+import time
+
+os.environ['MODEL_RELOAD_INTERVAL'] = '0'
+
+import numpy as np  # noqa: E402
+
+import main  # noqa: E402
+from benchmarks.common import measure, report  # noqa: E402
+from model_registry import ModelRegistry  # noqa: E402
+
+SYMPTOM_SETS = [['itching', 'skin_rash'], ['cough', 'high_fever', 'breathlessness'], ['headache'],
+                ['vomiting', 'fatigue', 'nausea', 'abdominal_pain']]
+
+
+def request_latencies(seconds):
+    latencies = []
+    sets = itertools.cycle(SYMPTOM_SETS)
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        main.get_prediction_result(next(sets))
+        latencies.append(time.perf_counter() - start)
+    return np.array(latencies) * 1e6
+
+
+def summary(name, latencies):
+    print(f"{name:<22} {len(latencies):8,} requests   p50 {np.percentile(latencies, 50):8.1f} us   "
+          f"p99 {np.percentile(latencies, 99):8.1f} us   max {latencies.max():9.1f} us")
+
+
+if __name__ == '__main__':
+    versions = itertools.count()
+    registry = ModelRegistry(lambda: main.load_model_version()._replace(version=f"bench{next(versions)}"),
+                             validate=main.validate_model_version, check_interval=0)
+    main.model_registry = registry
+    # हर swap की log line नहीं चाहिए
+    logging.getLogger('model_registry').setLevel(logging.ERROR)
+    registry.on_swap(lambda old, new: main.prediction_cache.clear())
+
+    print("Per call:")
+    report([
+        ("registry.current", measure(lambda: registry.current, number=100000)),
+        ("load_model_version", measure(main.load_model_version, number=3, repeat=3)),
+        ("reload + validate + swap", measure(registry.reload, number=3, repeat=3)),
+    ])
+
+    print("\n/predict path (get_prediction_result), 3 s each:")
+    summary("steady", request_latencies(3))
+
+    stop = threading.Event()
+
+    def reload_loop():
+        while not stop.is_set():
+            registry.reload()
+
+    thread = threading.Thread(target=reload_loop)
+    thread.start()
+    latencies = request_latencies(3)
+    stop.set()
+    thread.join()
+    summary("reloading continuously", latencies)
+    print(f"{registry.reloads} swaps during the run, {registry.failures} failures")
@@ -0,0 +1,97 @@
+# Page weight और render time: हर page का HTML + उसकी local assets (CSS, JS, images, favicon)
+#
+# Browser की तरह: Accept-Encoding "br, gzip", 2x screen (srcset में से वह candidate जो img के
+# sizes का दोगुना ढके), <picture> में WebP source। CDN वाली files (bootstrap) नहीं गिनी जातीं।
+# Login बंद (LOGIN_DISABLED) और temp DB; requests सीधे WSGI app को।
+# चलाएँ: python -m benchmarks.bench_page_weight
+import atexit
+import os
+import re
+import shutil
+import tempfile
+from html.parser import HTMLParser
+
+_tmpdir = tempfile.mkdtemp(prefix='bench_pages_')
+atexit.register(shutil.rmtree, _tmpdir, ignore_errors=True)
+os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(_tmpdir, 'bench.db')}"
+os.environ['MODEL_RELOAD_INTERVAL'] = '0'
+
+from flask import render_template  # noqa: E402
+
+import main  # noqa: E402
+from benchmarks.common import measure  # noqa: E402
+
+PAGES = (('/about', 'about.html'), ('/developer', 'developer.html'), ('/blog', 'blog.html'),
+         ('/contact', 'contact.html'), ('/', 'index.html'))
+DEVICE_PIXEL_RATIO = 2
+HEADERS = {'Accept-Encoding': 'br, gzip', 'Accept': 'text/html,image/webp,*/*'}
+
+
+class AssetParser(HTMLParser):
+    # Page के local asset URLs, उसी क्रम में जिसमें browser उन्हें माँगेगा
+    def __init__(self):
+        super().__init__()
+        self.urls = []
+        self._picture_source = None
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == 'source' and attrs.get('type') == 'image/webp':
+            self._picture_source = attrs.get('srcset')
+        elif tag == 'img':
+            srcset = self._picture_source or attrs.get('srcset')
+            self._picture_source = None
+            self.urls.append(pick_candidate(srcset, attrs.get('sizes')) if srcset else attrs.get('src'))
+        elif tag == 'script' and attrs.get('src'):
+            self.urls.append(attrs['src'])
+        elif tag == 'link' and attrs.get('rel') in ('stylesheet', 'icon'):
+            self.urls.append(attrs.get('href'))
+
+
+def pick_candidate(srcset, sizes):
+    candidates = []
+    for item in srcset.split(','):
+        url, _, width = item.strip().rpartition(' ')
+        candidates.append((int(width.rstrip('w')), url))
+    candidates.sort()
+    match = re.search(r'(\d+)px', sizes or '')
+    needed = int(match.group(1)) * DEVICE_PIXEL_RATIO if match else candidates[-1][0]
+    return next((url for width, url in candidates if width >= needed), candidates[-1][1])
+
+
+def page_weight(client, path):
+    response = client.get(path, headers=HEADERS)
+    parser = AssetParser()
+    parser.feed(response.get_data(as_text=True))
+    assets = []
+    for url in parser.urls:
+        if not url or url.startswith(('http://', 'https://', '//')):
+            continue
+        asset = client.get(url, headers=HEADERS)
+        assets.append((url, len(asset.get_data()), asset.headers.get('Cache-Control', '-')))
+        asset.close()
+    return len(response.get_data()), assets
+
+
+def render_time(path, template):
+    # सिर्फ Jinja render (WSGI/Flask का हिस्सा नहीं, जो सब pages पर एक जैसा है)
+    with main.main.test_request_context(path):
+        return measure(lambda: render_template(template), number=2000)
+
+
+if __name__ == '__main__':
+    main.main.config['LOGIN_DISABLED'] = True
+    client = main.main.test_client()
+
+    print(f"{'page':<11} {'HTML':>8} {'assets':>9} {'total':>9} {'render':>11}")
+    details = []
+    for path, template in PAGES:
+        html, assets = page_weight(client, path)
+        asset_bytes = sum(size for _, size, _ in assets)
+        print(f"{path:<11} {html / 1024:6.1f} KB {asset_bytes / 1024:7.1f} KB {(html + asset_bytes) / 1024:7.1f} KB"
+              f" {render_time(path, template):8.1f} us")
+        details.extend(assets)
+
+    print("\nAssets (first visit):")
+    for url, size, cache_control in dict.fromkeys(details):
+        print(f"  {size / 1024:7.1f} KB  {url}  [Cache-Control: {cache_control}]")
@@ -0,0 +1,63 @@
+# POST /predict का समय stages में: /metrics वाले histograms से ही mean निकाले जाते हैं।
+# साथ में instrumentation का अपना खर्च (histogram observe, stage timer, counter inc)।
+# Login बंद (LOGIN_DISABLED) और temp DB; requests सीधे WSGI app को।
+# चलाएँ: python -m benchmarks.bench_predict_stages
+import atexit
+import os
+import shutil
+import tempfile
+import time
+
+_tmpdir = tempfile.mkdtemp(prefix='bench_stages_')
+atexit.register(shutil.rmtree, _tmpdir, ignore_errors=True)
+os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(_tmpdir, 'bench.db')}"
+
+from werkzeug.test import EnvironBuilder  # noqa: E402
+
+import main  # noqa: E402
+from benchmarks.common import measure, report  # noqa: E402
+
+SYMPTOM_SETS = ('itching,skin_rash,nodal_skin_eruptions', 'cough,high_fever,breathlessness', 'headache',
+                'vomiting,fatigue,nausea,abdominal_pain', 'तेज बुखार, खांसी')
+REQUESTS = 3000
+
+
+def predict_environ(symptoms):
+    return EnvironBuilder(method='POST', path='/predict', data={'symptoms': symptoms}).get_environ()
+
+
+def stage_means():
+    values = main.request_metrics.collect()
+    histogram = main.predict_stage_seconds
+    means = []
+    for stage, base in histogram._index.items():
+        count = values[base:base + len(histogram.buckets) + 1].sum()
+        total = values[base + len(histogram.buckets) + 1]
+        means.append((stage, total / count * 1e6 if count else 0.0))
+    return means
+
+
+if __name__ == '__main__':
+    main.main.config['LOGIN_DISABLED'] = True
+    app = main.main.wsgi_app
+    environs = [predict_environ(SYMPTOM_SETS[i % len(SYMPTOM_SETS)]) for i in range(REQUESTS)]
+
+    start = time.perf_counter()
+    for environ in environs:
+        b''.join(app(dict(environ), lambda status, headers, exc_info=None: None))
+    elapsed = time.perf_counter() - start
+
+    print(f"POST /predict: {REQUESTS / elapsed:,.0f} req/s, {elapsed / REQUESTS * 1e6:,.1f} us per request")
+    print("Mean time per stage (from the /metrics histograms):")
+    report(stage_means())
+
+    def timed_stage():
+        with main.predict_stage_seconds.time('encode'):
+            pass
+
+    print("\nInstrumentation cost:")
+    report([
+        ("histogram.observe()", measure(lambda: main.predict_stage_seconds.observe('encode', 1e-5), number=20000)),
+        ("with histogram.time()", measure(timed_stage, number=20000)),
+        ("counter.inc()", measure(lambda: main.predictions_total.inc('ok'), number=20000)),
+    ])
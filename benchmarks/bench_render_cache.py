@@ -0,0 +1,66 @@
+# Static pages और /predict result page: हर request का समय (render cache से पहले/बाद तुलना के लिए)
+#
+# GET /about, /contact, /developer, /blog (और If-None-Match के साथ 304), POST /predict पूरे page के साथ,
+# और सिर्फ /predict का render stage (/metrics histogram से)।
+# Login बंद (LOGIN_DISABLED) और temp DB; requests सीधे WSGI app को।
+# चलाएँ: python -m benchmarks.bench_render_cache
+import atexit
+import os
+import shutil
+import tempfile
+import time
+
+_tmpdir = tempfile.mkdtemp(prefix='bench_render_')
+atexit.register(shutil.rmtree, _tmpdir, ignore_errors=True)
+os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(_tmpdir, 'bench.db')}"
+os.environ['MODEL_RELOAD_INTERVAL'] = '0'
+
+from werkzeug.test import EnvironBuilder  # noqa: E402
+
+import main  # noqa: E402
+from benchmarks.common import measure, report  # noqa: E402
+
+PAGES = ('/about', '/contact', '/developer', '/blog')
+SYMPTOM_SETS = ('itching,skin_rash,nodal_skin_eruptions', 'cough,high_fever,breathlessness', 'headache',
+                'vomiting,fatigue,nausea,abdominal_pain', 'तेज बुखार, खांसी')
+PREDICT_REQUESTS = 3000
+
+
+def wsgi_request(app, environ):
+    status = []
+    b''.join(app(dict(environ), lambda s, headers, exc_info=None: status.append(s)))
+    return status[0]
+
+
+def render_stage_mean():
+    values = main.request_metrics.collect()
+    base = main.predict_stage_seconds._index['render']
+    width = len(main.predict_stage_seconds.buckets) + 1
+    count = values[base:base + width].sum()
+    return values[base + width] / count * 1e6 if count else 0.0
+
+
+if __name__ == '__main__':
+    main.main.config['LOGIN_DISABLED'] = True
+    app = main.main.wsgi_app
+    client = main.main.test_client()
+
+    rows = []
+    for path in PAGES:
+        environ = EnvironBuilder(method='GET', path=path).get_environ()
+        rows.append((f"GET {path}", measure(lambda: wsgi_request(app, environ), number=1000)))
+        etag = client.get(path).headers.get('ETag')
+        if etag:
+            conditional = EnvironBuilder(method='GET', path=path, headers={'If-None-Match': etag}).get_environ()
+            assert wsgi_request(app, conditional).startswith('304')
+            rows.append((f"GET {path} (304)", measure(lambda: wsgi_request(app, conditional), number=1000)))
+
+    # हर request का अपना environ (wsgi.input एक बार ही पढ़ा जा सकता है)
+    environs = [EnvironBuilder(method='POST', path='/predict', data={'symptoms': SYMPTOM_SETS[i % len(SYMPTOM_SETS)]})
+                .get_environ() for i in range(PREDICT_REQUESTS)]
+    start = time.perf_counter()
+    for environ in environs:
+        wsgi_request(app, environ)
+    rows.append(("POST /predict (full page)", (time.perf_counter() - start) / PREDICT_REQUESTS * 1e6))
+    report(rows)
+    print(f"\n/predict render stage (mean, from /metrics): {render_stage_mean():.1f} us")
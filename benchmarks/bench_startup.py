@@ -0,0 +1,46 @@
+# Cold start: CSV path (ingest.py से validate + normalize) बनाम binary snapshot load
+# हर mode के लिए नए Python process में `import main` किया जाता है।
+# चलाएँ: python -m benchmarks.bench_startup [--runs 10]
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = """
+import resource, sys, time
+start = time.perf_counter()
+import main
+elapsed = time.perf_counter() - start
+print(elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, int('pandas' in sys.modules))
+"""
+
+
+def run_once(use_snapshot):
+    env = dict(os.environ, USE_SNAPSHOT='1' if use_snapshot else '0')
+    out = subprocess.run([sys.executable, '-c', PROBE], cwd=BASE_DIR, env=env, check=True,
+                         capture_output=True, text=True).stdout.split()
+    return float(out[-3]), int(out[-2]), bool(int(out[-1]))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--runs', type=int, default=10)
+    args = parser.parse_args(argv)
+
+    rows = []
+    for label, use_snapshot in (("csv (ingest)", False), ("snapshot", True)):
+        results = [run_once(use_snapshot) for _ in range(args.runs)]
+        import_ms = statistics.median(r[0] for r in results) * 1000
+        max_rss_mb = statistics.median(r[1] for r in results) / 1024
+        pandas_loaded = results[0][2]
+        rows.append(import_ms)
+        print(f"{label}: import main {import_ms:.0f} ms, max RSS {max_rss_mb:.0f} MB, pandas imported: {pandas_loaded}")
+
+    print(f"(medians over {args.runs} runs) speedup: {rows[0] / rows[1]:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+# Free-text symptom parsing: Aho-Corasick automaton बनाम हर phrase पर substring search
+# (index.html के पुराने JS mapToValidSymptoms जैसा)। Automaton text पर एक ही pass करता है,
+# इसलिए उसका throughput (chars/us) हर लंबाई पर एक जैसा रहना चाहिए। Substring scan हर phrase
+# के लिए एक C-speed pass करता है और word boundaries / longest match नहीं देखता।
+# चलाएँ: python -m benchmarks.bench_symptom_parser
+import random
+
+import main
+from benchmarks.common import measure, report
+from symptom_parser import normalize
+
+FILLER = ["मुझे", "है", "और", "भी", "कल", "से", "बहुत", "ज़्यादा", "i", "have", "and", "since", "yesterday",
+          "feeling", "some"]
+LENGTHS = (100, 1_000, 10_000, 100_000)
+
+
+def sample_text(length, seed=0):
+    rng = random.Random(seed)
+    phrases = list(main.model_registry.current.symptom_parser.phrases)
+    words = []
+    size = 0
+    while size < length:
+        word = rng.choice(phrases) if rng.random() < 0.2 else rng.choice(FILLER)
+        if rng.random() < 0.1:
+            word += ','
+        words.append(word)
+        size += len(word) + 1
+    return ' '.join(words)[:length]
+
+
+# पुराना तरीका: हर phrase के लिए पूरे text में `in` - phrases x text
+def parse_substring_scan(text):
+    text = normalize(text)
+    return {key for phrase, key in main.model_registry.current.symptom_parser.phrases.items() if phrase in text}
+
+
+if __name__ == '__main__':
+    parser = main.model_registry.current.symptom_parser
+    print(f"{len(parser.phrases)} phrases, {len(parser._goto)} automaton states")
+    for length in LENGTHS:
+        text = sample_text(length)
+        number = max(1, 20_000 // length)
+        automaton = measure(lambda: parser.parse(text), number=number)
+        scan = measure(lambda: parse_substring_scan(text), number=number)
+        print(f"\n{length:,} chars ({len(parser.parse(text)[0])} symptoms found):")
+        report([("aho-corasick parse", automaton), ("substring scan", scan)])
+        print(f"automaton throughput: {length / automaton:.1f} chars/us")
@@ -0,0 +1,57 @@
+# /symptoms/suggest: prefix index lookup और पूरी Flask request (एक worker, एक thread)
+# Keystrokes: हर symptom नाम (English और Hindi) को एक-एक अक्षर करके टाइप करना।
+# Requests सीधे WSGI app को दी जाती हैं (environ पहले से बने), ताकि test client का खर्च न गिना जाए।
+# चलाएँ: python -m benchmarks.bench_symptom_suggest
+import time
+
+from werkzeug.test import EnvironBuilder
+
+import main
+from benchmarks.common import measure, report
+
+
+def keystroke_queries():
+    queries = []
+    for key, entry in main.model_registry.current.symptom_phrases.items():
+        for name in (key.replace('_', ' '), entry['hi']):
+            queries.extend(name[:end] for end in range(1, len(name) + 1))
+    return queries
+
+
+def environ_for(query, etag=None):
+    headers = {'If-None-Match': etag} if etag else {}
+    return EnvironBuilder(path='/symptoms/suggest', query_string={'q': query}, headers=headers).get_environ()
+
+
+def wsgi_get(environ):
+    status = []
+    body = b''.join(main.main.wsgi_app(dict(environ), lambda s, h, e=None: status.append(s)))
+    return status[0], body
+
+
+def requests_per_second(environs):
+    start = time.perf_counter()
+    for environ in environs:
+        wsgi_get(environ)
+    return len(environs) / (time.perf_counter() - start)
+
+
+if __name__ == '__main__':
+    queries = keystroke_queries()
+    index = main.model_registry.current.symptom_suggest
+
+    def lookup_all():
+        for q in queries:
+            index.suggest_json(q)
+
+    print(f"{len(index)} prefixes indexed, {len(queries)} keystroke queries")
+    report([("suggest_json() per keystroke", measure(lookup_all, number=3) / len(queries))])
+
+    fresh = [environ_for(q) for q in queries]
+    client = main.main.test_client()
+    etags = [client.get('/symptoms/suggest', query_string={'q': q}).headers['ETag'] for q in queries]
+    revalidate = [environ_for(q, etag) for q, etag in zip(queries, etags)]
+    assert wsgi_get(revalidate[0])[0].startswith('304')
+
+    print(f"GET /symptoms/suggest (200):        {requests_per_second(fresh):8,.0f} req/s")
+    print(f"GET /symptoms/suggest (304, ETag):  {requests_per_second(revalidate):8,.0f} req/s")
@@ -0,0 +1,66 @@
+# Worker memory: हर worker का अपना app load (PRELOAD_APP=0) बनाम preload + fork
+# gunicorn को दोनों modes में चलाकर हर worker का RSS/PSS/private memory पढ़ा जाता है।
+# चलाएँ (Linux): python -m benchmarks.bench_worker_memory [--workers 4]
+import argparse
+import os
+import signal
+import subprocess
+import sys
+import time
+import urllib.request
+
+from process_memory import child_pids, memory_usage
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def wait_until_up(url, timeout=60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            urllib.request.urlopen(url, timeout=1).read()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"gunicorn did not come up at {url}")
+
+
+def measure(preload, workers, port):
+    env = dict(os.environ, PRELOAD_APP='1' if preload else '0', WEB_CONCURRENCY=str(workers), PORT=str(port))
+    proc = subprocess.Popen([sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py', 'main:main'],
+                            cwd=BASE_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        url = f"http://127.0.0.1:{port}/about"
+        wait_until_up(url)
+        # हर worker तक कुछ requests पहुँचें और सब workers पूरी तरह boot हो जाएँ
+        for _ in range(workers * 5):
+            urllib.request.urlopen(url, timeout=5).read()
+        time.sleep(1)
+        return [memory_usage(pid) for pid in child_pids(proc.pid)]
+    finally:
+        proc.send_signal(signal.SIGTERM)
+        proc.wait(timeout=30)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--port', type=int, default=8765)
+    args = parser.parse_args(argv)
+
+    totals = {}
+    for label, preload in (("per-worker load", False), ("preload + fork", True)):
+        usages = [u for u in measure(preload, args.workers, args.port) if u]
+        print(f"{label}:")
+        for i, usage in enumerate(usages):
+            print(f"  worker {i}: RSS {usage['rss_kb'] / 1024:6.1f} MB  PSS {usage['pss_kb'] / 1024:6.1f} MB  "
+                  f"private {usage['private_kb'] / 1024:6.1f} MB")
+        totals[label] = sum(u['pss_kb'] for u in usages) / 1024
+        print(f"  total worker PSS: {totals[label]:.1f} MB")
+
+    before, after = totals["per-worker load"], totals["preload + fork"]
+    print(f"\nworker PSS saved by preload: {before - after:.1f} MB ({(1 - after / before) * 100:.0f}%)")
+
+
+if __name__ == '__main__':
+    main()
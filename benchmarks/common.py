@@ -0,0 +1,20 @@
+# Benchmarks के लिए छोटे shared helpers
+# Repo root से चलाएँ: python -m benchmarks.<name>
+import time
+
+
+def measure(fn, number=1000, repeat=5):
+    # best-of-repeat, प्रति call microseconds में
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, time.perf_counter() - start)
+    return best / number * 1e6
+
+
+def report(rows):
+    width = max(len(name) for name, _ in rows)
+    for name, usec in rows:
+        print(f"{name:<{width}}  {usec:10.2f} us")
@@ -0,0 +1,126 @@
+# Real-server benchmarks के shared helpers: server start/stop, temp user + login, और asyncio load generator
+#
+# Load generator raw HTTP/1.1 requests पहले से बनाकर रखता है, ताकि client का खर्च कम से कम रहे;
+# हर request नई connection पर (gunicorn sync worker keep-alive नहीं करता)।
+import asyncio
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+
+import numpy as np
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BENCH_EMAIL = 'bench@example.com'
+BENCH_PASSWORD = 'bench-password'
+
+
+def wait_until_up(url, timeout=60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            urllib.request.urlopen(url, timeout=1).read()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"server did not come up at {url}")
+
+
+def create_user(database_url):
+    # Servers से पहले: tables + एक user, और उसका API token
+    os.environ['DATABASE_URL'] = database_url
+    os.environ['MODEL_RELOAD_INTERVAL'] = '0'
+    import main
+
+    with main.main.app_context():
+        main.db.create_all()
+        user = main.User(username='bench', email=BENCH_EMAIL)
+        user.set_password(BENCH_PASSWORD)
+        main.db.session.add(user)
+        main.db.session.commit()
+        return main.issue_api_token(user.id)
+
+
+def session_cookie(port):
+    # POST /login -> session cookie (redirect follow नहीं करना)
+    class NoRedirect(urllib.request.HTTPRedirectHandler):
+        def redirect_request(self, *args, **kwargs):
+            return None
+
+    data = urllib.parse.urlencode({'email': BENCH_EMAIL, 'password': BENCH_PASSWORD}).encode()
+    opener = urllib.request.build_opener(NoRedirect)
+    try:
+        opener.open(f"http://127.0.0.1:{port}/login", data=data, timeout=30)
+    except urllib.error.HTTPError as e:
+        cookies = [value.split(';', 1)[0] for key, value in e.headers.items() if key.lower() == 'set-cookie']
+        return '; '.join(cookies)
+    raise RuntimeError("login did not redirect")
+
+
+def page_request(port, cookie, symptoms):
+    body = urllib.parse.urlencode({'symptoms': symptoms}).encode()
+    return (f"POST /predict HTTP/1.1\r\nHost: 127.0.0.1:{port}\r\nCookie: {cookie}\r\n"
+            f"Content-Type: application/x-www-form-urlencoded\r\nContent-Length: {len(body)}\r\n"
+            f"Connection: close\r\n\r\n").encode() + body
+
+
+def api_request(port, token, symptoms):
+    body = json.dumps({'symptoms': symptoms}).encode()
+    return (f"POST /api/v1/predict HTTP/1.1\r\nHost: 127.0.0.1:{port}\r\nAuthorization: Bearer {token}\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n"
+            f"Connection: close\r\n\r\n").encode() + body
+
+
+async def run_load(port, requests, clients):
+    # requests: पहले से बनी raw HTTP requests; clients connections एक साथ
+    latencies = []
+    sizes = []
+    statuses = []
+    queue = iter(requests)
+
+    async def client():
+        for raw in queue:
+            start = time.perf_counter()
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            writer.write(raw)
+            response = await reader.read()
+            writer.close()
+            latencies.append(time.perf_counter() - start)
+            head, _, body = response.partition(b'\r\n\r\n')
+            statuses.append(int(head.split(b' ', 2)[1]) if head else 0)
+            sizes.append(len(body))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(clients)))
+    elapsed = time.perf_counter() - start
+    return np.array(latencies) * 1000, elapsed, sizes, statuses
+
+
+def summarize(latencies_ms, elapsed, statuses):
+    return {
+        'requests': len(latencies_ms),
+        'rps': round(len(latencies_ms) / elapsed, 1),
+        'p50_ms': round(float(np.percentile(latencies_ms, 50)), 2),
+        'p99_ms': round(float(np.percentile(latencies_ms, 99)), 2),
+        'errors': sum(1 for status in statuses if status != 200),
+    }
+
+
+def start_server(command, env, port):
+    proc = subprocess.Popen(command, cwd=BASE_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    wait_until_up(f"http://127.0.0.1:{port}/about")
+    return proc
+
+
+def stop_server(proc):
+    proc.send_signal(signal.SIGTERM)
+    proc.wait(timeout=30)
+
+
+def gunicorn_command():
+    return [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py', 'main:main']
@@ -0,0 +1,222 @@
+# पूरा benchmark suite: microbenchmarks + असली gunicorn पर load test, नतीजे JSON में
+#
+# Micro: get_predicted_value (cache hit/miss), helper(), encode_symptoms, free-text parsing, triage score
+# (एक request और 2000 rows का batch), related symptoms, model load।
+# Load: हर workers x threads combination पर gunicorn चलाकर login, फिर POST /predict (page) और
+# POST /api/v1/predict, datasets/symtoms_df.csv की rows से sample किए गए symptoms के साथ।
+# नतीजे benchmarks/results/<commit>.json में; दो commits की तुलना --compare से।
+#
+# चलाएँ (repo root से):
+#   python -m benchmarks.suite                                  # सब कुछ, default matrix
+#   python -m benchmarks.suite --workers 1,2,4 --threads 1,4    # अपना matrix
+#   python -m benchmarks.suite --skip-load                      # सिर्फ micro (कुछ seconds)
+#   python -m benchmarks.suite --compare OLD.json NEW.json      # regressions (> --threshold) पर exit 1
+import argparse
+import asyncio
+import atexit
+import csv
+import itertools
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+_tmpdir = tempfile.mkdtemp(prefix='bench_suite_')
+atexit.register(shutil.rmtree, _tmpdir, ignore_errors=True)
+DATABASE_URL = f"sqlite:///{os.path.join(_tmpdir, 'bench.db')}"
+os.environ['DATABASE_URL'] = DATABASE_URL
+os.environ['MODEL_RELOAD_INTERVAL'] = '0'
+
+import main  # noqa: E402
+from benchmarks.common import measure  # noqa: E402
+from benchmarks.loadgen import (BASE_DIR, api_request, create_user, gunicorn_command, page_request,  # noqa: E402
+                                run_load, session_cookie, start_server, stop_server, summarize)
+
+RESULTS_DIR = os.path.join(BASE_DIR, 'benchmarks', 'results')
+SYMPTOMS_CSV = os.path.join(main.DATASETS_PATH, 'symtoms_df.csv')
+FREE_TEXT = "मुझे कल से तेज बुखार है और सिर दर्द, साथ में खांसी भी"
+# Micro: इन नामों के लिए छोटा बेहतर (us); load: rps बड़ा बेहतर, latency छोटी
+LOAD_METRICS = (('rps', True), ('p50_ms', False), ('p99_ms', False))
+
+
+def sample_symptom_sets(count, seed=0):
+    # symtoms_df.csv की rows (हर row एक मरीज़, 1-4 symptoms; नामों में leading spaces होते हैं)
+    with open(SYMPTOMS_CSV, newline='', encoding='utf-8') as f:
+        rows = [[value.strip() for key, value in row.items() if key.startswith('Symptom') and value and value.strip()]
+                for row in csv.DictReader(f)]
+    rows = [row for row in rows if row]
+    rng = random.Random(seed)
+    return [rng.choice(rows) for _ in range(count)]
+
+
+# ============================================================
+# Microbenchmarks
+# ============================================================
+
+def run_micro():
+    sets = sample_symptom_sets(2000, seed=1)
+    hit = sets[0]
+    main.get_predicted_value(hit)
+    misses = itertools.cycle(sets)
+
+    def predict_miss():
+        main.prediction_cache.clear()
+        main.get_predicted_value(next(misses))
+
+    model = main.model_registry.current
+    indices = main.encode_symptoms(hit)[0]
+    matrix = main.encode_symptom_matrix(sets)[0]
+
+    return {
+        'get_predicted_value (cache hit)': measure(lambda: main.get_predicted_value(hit), number=20000),
+        'get_predicted_value (cache miss)': measure(predict_miss, number=2000),
+        'helper()': measure(lambda: main.helper('Fungal infection'), number=20000),
+        'encode_symptoms': measure(lambda: main.encode_symptoms(hit), number=20000),
+        'symptom_parser.parse': measure(lambda: model.symptom_parser.parse(FREE_TEXT), number=5000),
+        'triage_scorer.score': measure(lambda: model.triage_scorer.score(indices), number=20000),
+        'symptom_cooccurrence.related': measure(lambda: model.symptom_cooccurrence.related(indices, 5), number=5000),
+        'triage_scorer.score_matrix (2000 rows)': measure(lambda: model.triage_scorer.score_matrix(matrix), number=200),
+        'load_model_version': measure(main.load_model_version, number=5, repeat=3),
+    }
+
+
+# ============================================================
+# Load test (gunicorn workers x threads)
+# ============================================================
+
+def run_load_matrix(workers_list, threads_list, requests, clients, port):
+    token = create_user(DATABASE_URL)
+    symptom_sets = [', '.join(row) for row in sample_symptom_sets(requests, seed=2)]
+    results = []
+    for workers, threads in itertools.product(workers_list, threads_list):
+        env = dict(os.environ, DATABASE_URL=DATABASE_URL, MODEL_RELOAD_INTERVAL='0', WEB_CONCURRENCY=str(workers),
+                   GUNICORN_THREADS=str(threads), PORT=str(port), METRICS_DIR=os.path.join(_tmpdir, 'metrics'))
+        proc = start_server(gunicorn_command(), env, port)
+        try:
+            cookie = session_cookie(port)
+            targets = (('POST /predict', [page_request(port, cookie, s) for s in symptom_sets]),
+                       ('POST /api/v1/predict', [api_request(port, token, s) for s in symptom_sets]))
+            for target, raw_requests in targets:
+                latencies, elapsed, _, statuses = asyncio.run(run_load(port, raw_requests, clients))
+                result = {'target': target, 'workers': workers, 'threads': threads, 'clients': clients,
+                          **summarize(latencies, elapsed, statuses)}
+                print(f"  {target:<21} workers={workers} threads={threads}: {result['rps']:8,.0f} req/s   "
+                      f"p50 {result['p50_ms']:7.1f} ms   p99 {result['p99_ms']:7.1f} ms   errors {result['errors']}")
+                results.append(result)
+        finally:
+            stop_server(proc)
+    return results
+
+
+# ============================================================
+# Results + comparison
+# ============================================================
+
+def git_revision():
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=BASE_DIR, check=True,
+                                capture_output=True, text=True).stdout.strip()
+        dirty = bool(subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=BASE_DIR,
+                                    check=True, capture_output=True, text=True).stdout.strip())
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown', False
+    return commit, dirty
+
+
+def compare(old, new, threshold):
+    # हर metric का % बदलाव; threshold से ज़्यादा खराब हुआ तो regression
+    regressions = 0
+    print(f"{old.get('commit', '?')} -> {new.get('commit', '?')}")
+
+    def line(name, before, after, higher_is_better):
+        nonlocal regressions
+        change = (after - before) / before * 100 if before else 0.0
+        worse = -change if higher_is_better else change
+        flag = ''
+        if worse > threshold:
+            flag = '  REGRESSION'
+            regressions += 1
+        print(f"  {name:<58} {before:12.2f} -> {after:12.2f}  {change:+7.1f}%{flag}")
+
+    for name in sorted(set(old.get('micro', {})) & set(new.get('micro', {}))):
+        line(f"{name} (us)", old['micro'][name], new['micro'][name], False)
+
+    def load_key(result):
+        return result['target'], result['workers'], result['threads'], result['clients']
+
+    old_load = {load_key(r): r for r in old.get('load', [])}
+    for result in new.get('load', []):
+        before = old_load.get(load_key(result))
+        if before is None:
+            continue
+        target, workers, threads, _ = load_key(result)
+        for metric, higher_is_better in LOAD_METRICS:
+            line(f"{target} w={workers} t={threads} {metric}", before[metric], result[metric], higher_is_better)
+    return regressions
+
+
+def parse_list(value):
+    return [int(item) for item in value.split(',') if item]
+
+
+def main_cli(argv=None):
+    parser = argparse.ArgumentParser(description="Run the benchmark suite and store the results as JSON.")
+    parser.add_argument('--workers', type=parse_list, default=[1, 2])
+    parser.add_argument('--threads', type=parse_list, default=[1, 4])
+    parser.add_argument('--requests', type=int, default=2000, help="requests per load run")
+    parser.add_argument('--clients', type=int, default=32, help="concurrent connections")
+    parser.add_argument('--port', type=int, default=8767)
+    parser.add_argument('--skip-micro', action='store_true')
+    parser.add_argument('--skip-load', action='store_true')
+    parser.add_argument('--output', help="default: benchmarks/results/<commit>.json")
+    parser.add_argument('--compare', nargs=2, metavar=('OLD', 'NEW'), help="compare two result files and exit")
+    parser.add_argument('--threshold', type=float, default=10.0, help="regression threshold in percent")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        results = []
+        for path in args.compare:
+            with open(path, encoding='utf-8') as f:
+                results.append(json.load(f))
+        regressions = compare(*results, threshold=args.threshold)
+        print(f"{regressions} regression(s) above {args.threshold:g}%")
+        return 1 if regressions else 0
+
+    commit, dirty = git_revision()
+    results = {
+        'commit': commit,
+        'dirty': dirty,
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'params': {'workers': args.workers, 'threads': args.threads, 'requests': args.requests,
+                   'clients': args.clients},
+        'micro': {},
+        'load': [],
+    }
+    if not args.skip_micro:
+        print("Microbenchmarks (us per call):")
+        results['micro'] = run_micro()
+        for name, usec in results['micro'].items():
+            print(f"  {name:<40} {usec:12.2f}")
+    if not args.skip_load:
+        print(f"Load test ({args.requests} requests, {args.clients} concurrent connections):")
+        results['load'] = run_load_matrix(args.workers, args.threads, args.requests, args.clients, args.port)
+
+    output = args.output or os.path.join(RESULTS_DIR, f"{commit}{'-dirty' if dirty else ''}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2, ensure_ascii=False)
+        f.write('\n')
+    print(f"Wrote {output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main_cli())
@@ -0,0 +1,37 @@
+# ============================================================
+# Score Calibration (class score -> probability)
+# ============================================================
+#
+# Scorer के ovr class scores (votes + squashed confidence) probabilities नहीं हैं।
+# Offline (python -m scripts.fit_calibration) Training.csv के partial symptom sets पर
+# एक monotone (isotonic) mapping fit की जाती है: "इतने score वाली बीमारी कितनी बार
+# सही निकली"। Serving में यह सिर्फ एक np.interp है - sklearn की ज़रूरत नहीं।
+
+import numpy as np
+
+CALIBRATION_VERSION = 1
+
+
+class ScoreCalibration:
+    def __init__(self, thresholds, probabilities, scorer_sha256=''):
+        self.thresholds = np.asarray(thresholds, dtype=np.float64)
+        self.probabilities = np.asarray(probabilities, dtype=np.float64)
+        self.scorer_sha256 = str(scorer_sha256)
+
+    def __call__(self, scores):
+        return np.interp(scores, self.thresholds, self.probabilities)
+
+    def arrays(self):
+        return {'thresholds': self.thresholds, 'probabilities': self.probabilities,
+                'scorer_sha256': np.array(self.scorer_sha256)}
+
+    def save(self, path):
+        np.savez_compressed(path, version=CALIBRATION_VERSION, **self.arrays())
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path, allow_pickle=False) as data:
+            version = int(data['version'])
+            if version != CALIBRATION_VERSION:
+                raise ValueError(f"Unsupported calibration version {version} (expected {CALIBRATION_VERSION}).")
+            return cls(data['thresholds'], data['probabilities'], data['scorer_sha256'].item())
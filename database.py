@@ -0,0 +1,50 @@
+# ============================================================
+# Database Engine Tuning (SQLite user store)
+# ============================================================
+#
+# कई gunicorn workers एक ही site.db पर लिखते हैं। Default rollback journal में writer
+# पूरे file को lock करता है और readers/writers 'database is locked' पर fail होते हैं।
+# हर नए connection पर ये pragmas लगते हैं:
+#
+#   journal_mode=WAL     readers writer को नहीं रोकते (और writer readers को नहीं)
+#   synchronous=NORMAL   WAL में हर commit पर fsync नहीं, सिर्फ checkpoint पर
+#   busy_timeout         lock मिलने तक इतने ms रुकें, तुरंत error नहीं
+#   mmap_size            reads page cache से सीधे, read() syscalls के बिना
+
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+
+SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'busy_timeout': 5000,
+    'mmap_size': 256 * 1024 * 1024,
+}
+
+
+def _is_memory_sqlite(uri):
+    url = make_url(uri)
+    return url.get_backend_name() == 'sqlite' and url.database in (None, '', ':memory:')
+
+
+def engine_options(uri, pool_size=5, max_overflow=10, pool_timeout=30):
+    # SQLALCHEMY_ENGINE_OPTIONS: हर worker का अपना QueuePool (in-memory SQLite का एक ही
+    # connection होता है, उस पर pool settings लागू नहीं होतीं)
+    if _is_memory_sqlite(uri):
+        return {}
+    return {'pool_size': pool_size, 'max_overflow': max_overflow, 'pool_timeout': pool_timeout}
+
+
+def enable_sqlite_pragmas(engine, pragmas=None):
+    if engine.dialect.name != 'sqlite':
+        return
+    pragmas = SQLITE_PRAGMAS if pragmas is None else pragmas
+
+    @event.listens_for(engine, 'connect')
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
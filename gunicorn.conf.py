@@ -0,0 +1,77 @@
+# ============================================================
+# Production gunicorn configuration (preload + fork)
+# ============================================================
+#
+# चलाएँ: gunicorn -c gunicorn.conf.py main:main   (Procfile यही करता है)
+#
+# Master process model, snapshot और lookup table एक बार load करता है, फिर workers
+# fork होते हैं और ये read-only objects copy-on-write pages के रूप में share करते हैं।
+# gc.freeze() इन objects को GC की permanent generation में डाल देता है, ताकि workers
+# का garbage collector इनके headers लिखकर pages को un-share न करे।
+#
+# Environment:
+#   PORT             bind port (default 8000)
+#   WEB_CONCURRENCY  workers की संख्या (default 2 x CPUs + 1)
+#   GUNICORN_THREADS हर worker में threads (default 1)
+#   PRELOAD_APP=0    पुराना तरीका: हर worker अपना app खुद load करे (memory तुलना के लिए)
+#   METRICS_DIR      workers की metrics files (default: temp dir में, हर port की अलग)
+#
+# Model reload: workers model/dataset files पर खुद नज़र रखते हैं (MODEL_RELOAD_INTERVAL);
+# तुरंत reload के लिए workers को SIGUSR2 भेजें: pkill -USR2 -P <master pid>
+
+import gc
+import multiprocessing
+import os
+import tempfile
+
+from metrics import clear_directory
+from process_memory import format_usage, memory_usage
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.environ.get('GUNICORN_THREADS', 1))
+preload_app = os.environ.get('PRELOAD_APP', '1') != '0'
+
+# हर worker अपने metrics <METRICS_DIR>/<pid>.metrics में लिखता है, /metrics सबको जोड़ता है।
+# App import होने से पहले set होना ज़रूरी है (main.py इसे import पर पढ़ता है)।
+os.environ.setdefault('METRICS_DIR', os.path.join(tempfile.gettempdir(),
+                                                  f"medical-assist-metrics-{os.environ.get('PORT', '8000')}"))
+
+if preload_app:
+    # App load के दौरान GC बंद रखें, ताकि shared objects के बीच कम "holes" बनें
+    gc.disable()
+
+
+def on_starting(server):
+    # पिछले run के workers की files - नहीं तो उनके counters नए run में जुड़ जाते
+    clear_directory(os.environ['METRICS_DIR'])
+
+
+def when_ready(server):
+    if preload_app:
+        # अब तक load हुआ सब कुछ permanent generation में - workers इसे कभी scan नहीं करेंगे
+        gc.freeze()
+        gc.enable()
+        server.log.info("Preloaded app in master, froze %d objects", gc.get_freeze_count())
+    server.log.info("Master memory: %s", format_usage(memory_usage()))
+
+
+def post_fork(server, worker):
+    gc.enable()
+    if not preload_app:
+        return
+    # Master से inherit हुए SQLAlchemy pool connections fork के पार share नहीं होने चाहिए -
+    # हर worker अपने connections पहली query पर खुद खोलेगा
+    import main as app_module
+
+    with app_module.main.app_context():
+        app_module.db.engine.dispose(close=False)
+
+
+def post_worker_init(worker):
+    # gunicorn के अपने signal handlers के बाद: SIGUSR2 (सिर्फ worker pids को, master को नहीं -
+    # master के लिए USR2 = binary upgrade) इस worker में model reload करवाता है
+    import main as app_module
+
+    app_module.model_registry.install_signal_handler()
+    worker.log.info("Worker %s memory after init: %s", worker.pid, format_usage(memory_usage()))
@@ -0,0 +1,208 @@
+# ============================================================
+# Dataset Ingestion (CSV -> validated, normalized records)
+# ============================================================
+#
+# datasets/ की CSVs हाथ से बनी हैं और आपस में मेल नहीं खातीं:
+#   - बीमारियों के नाम: 'Diabetes ' / 'Hypertension ' (trailing space), vertigo में double space,
+#     और description/medications/diets/workout_df में 'Peptic ulcer disease' जबकि
+#     diseases_list (और model) में 'Peptic ulcer diseae'
+#   - symtoms_df.csv के symptoms में leading spaces (' skin_rash')
+#   - medications/diets में Python list की strings ("['A', 'B']")
+#   - precautions_df/workout_df/symtoms_df में pandas के index columns ('', 'Unnamed: 0')
+#   - Training.csv में 'fluid_overload' column दो बार - दूसरा symptoms_dict का 'fluid_overload.1' है
+#
+# यह module हर file को एक बार पढ़कर सब कुछ diseases_list / symptoms_dict के canonical नामों और
+# tuples में बदलता है। कोई भी गड़बड़ी (अनजान बीमारी या symptom, duplicate row, खराब list,
+# किसी बीमारी का data न होना) DatasetError है, जिसमें सारी गलतियाँ file:line के साथ होती हैं।
+# Snapshot build इसी से होता है, इसलिए खराब data build को रोकता है - request पर खाली result नहीं।
+
+import ast
+import csv
+import os
+import re
+
+# CSV में लिखा नाम -> diseases_list का नाम (whitespace normalize करने के बाद भी जो मेल न खाएँ)
+DISEASE_ALIASES = {'Peptic ulcer disease': 'Peptic ulcer diseae'}
+# pandas to_csv() के index columns - इनमें कोई data नहीं
+_INDEX_COLUMN = re.compile(r'^(|Unnamed: \d+(\.\d+)?)$')
+
+
+class DatasetError(ValueError):
+    def __init__(self, errors):
+        self.errors = list(errors)
+        super().__init__(f"{len(self.errors)} dataset error(s):\n  " + "\n  ".join(self.errors))
+
+
+def _normalize(name):
+    return " ".join(str(name).split())
+
+
+def header_names(row):
+    # Stripped column names; दोहराए गए नाम को pandas की तरह '.1', '.2' suffix (model इन्हीं नामों पर train हुआ)
+    seen = {}
+    header = []
+    for name in row:
+        name = name.strip()
+        count = seen.get(name, 0)
+        seen[name] = count + 1
+        header.append(f"{name}.{count}" if count else name)
+    return header
+
+
+class _Reader:
+    # एक CSV: सिर्फ ज़रूरी columns, हर row का line number, errors एक जगह जमा
+    def __init__(self, path, columns, errors):
+        self.name = os.path.basename(path)
+        self.path = path
+        self.columns = columns
+        self.errors = errors
+
+    def error(self, line, message):
+        self.errors.append(f"{self.name}:{line}: {message}" if line else f"{self.name}: {message}")
+
+    def rows(self):
+        try:
+            f = open(self.path, newline='', encoding='utf-8')
+        except OSError as e:
+            self.error(None, f"cannot read: {e.strerror}")
+            return
+        with f:
+            reader = csv.reader(f)
+            header = header_names(next(reader, []))
+            missing = [name for name in self.columns if name not in header]
+            extra = [name for name in header if name not in self.columns and not _INDEX_COLUMN.match(name)]
+            if missing or extra:
+                self.error(1, f"expected columns {list(self.columns)}, missing {missing}, unexpected {extra}")
+                return
+            positions = [header.index(name) for name in self.columns]
+            for line, row in enumerate(reader, start=2):
+                if not any(cell.strip() for cell in row):
+                    continue
+                if len(row) != len(header):
+                    self.error(line, f"has {len(row)} cells, header has {len(header)}")
+                    continue
+                yield line, [row[position].strip() for position in positions]
+
+
+def _disease_resolver(diseases):
+    canonical = {_normalize(name): name for name in diseases}
+    canonical.update((_normalize(alias), name) for alias, name in DISEASE_ALIASES.items() if name in diseases)
+
+    def resolve(reader, line, value):
+        name = canonical.get(_normalize(value))
+        if name is None:
+            reader.error(line, f"unknown disease {value!r}")
+        return name
+    return resolve
+
+
+def _parse_list(reader, line, value):
+    # "['A', 'B']" -> ('A', 'B'); कुछ और हो तो error
+    try:
+        parsed = ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        parsed = None
+    if not isinstance(parsed, (list, tuple)) or not all(isinstance(item, str) for item in parsed):
+        reader.error(line, f"expected a list of strings, got {value[:40]!r}")
+        return ()
+    return tuple(item.strip() for item in parsed if item.strip())
+
+
+def _one_per_disease(reader, resolve, parse):
+    # हर बीमारी की एक row -> {disease: parse(line, cells)}
+    records = {}
+    for line, (disease, *cells) in reader.rows():
+        name = resolve(reader, line, disease)
+        if name is None:
+            continue
+        if name in records:
+            reader.error(line, f"duplicate row for {name!r}")
+            continue
+        records[name] = parse(line, cells)
+    return records
+
+
+def read_recommendations(datasets_path, diseases):
+    # Returns {diseases_list name: (description, precautions, medications, diets, workouts)}
+    # हर field भरा होना ज़रूरी है; कोई भी गलती हो तो DatasetError
+    errors = []
+    resolve = _disease_resolver(diseases)
+
+    def reader(filename, *columns):
+        return _Reader(os.path.join(datasets_path, filename), columns, errors)
+
+    descriptions = reader('description.csv', 'Disease', 'Description')
+    description = _one_per_disease(descriptions, resolve, lambda line, cells: cells[0])
+    precautions = _one_per_disease(reader('precautions_df.csv', 'Disease', *(f'Precaution_{i}' for i in range(1, 5))),
+                                   resolve, lambda line, cells: tuple(cell for cell in cells if cell))
+    medication_reader = reader('medications.csv', 'Disease', 'Medication')
+    medications = _one_per_disease(medication_reader, resolve,
+                                   lambda line, cells: _parse_list(medication_reader, line, cells[0]))
+    diet_reader = reader('diets.csv', 'Disease', 'Diet')
+    diets = _one_per_disease(diet_reader, resolve, lambda line, cells: _parse_list(diet_reader, line, cells[0]))
+
+    # workout_df: हर बीमारी की कई rows, file के क्रम में
+    workout_reader = reader('workout_df.csv', 'disease', 'workout')
+    workouts = {}
+    for line, (disease, workout) in workout_reader.rows():
+        name = resolve(workout_reader, line, disease)
+        if name is not None and workout:
+            workouts.setdefault(name, []).append(workout)
+
+    records = {}
+    for name in diseases:
+        fields = (description.get(name), precautions.get(name), medications.get(name), diets.get(name),
+                  tuple(workouts.get(name, ())))
+        empty = [field for field, value in zip(('description', 'precautions', 'medications', 'diets', 'workouts'),
+                                                fields) if not value]
+        if empty:
+            errors.append(f"{name!r}: no {', '.join(empty)}")
+        records[name] = fields
+    if errors:
+        raise DatasetError(errors)
+    return records
+
+
+def read_symptom_records(training_path, symptom_list_path, symptom_index, diseases):
+    # Training.csv (one-hot) + symtoms_df.csv (Symptom_N names) -> [(disease, symptom indices)]
+    errors = []
+    resolve = _disease_resolver(diseases)
+    records = []
+
+    # Training.csv के columns खुद symptoms_dict keys हैं - header पहले पढ़कर जाँचें
+    try:
+        with open(training_path, newline='', encoding='utf-8') as f:
+            header = header_names(next(csv.reader(f), []))
+    except OSError as e:
+        header = []
+        errors.append(f"{os.path.basename(training_path)}: cannot read: {e.strerror}")
+    training = _Reader(training_path, header, errors)
+    unknown = [name for name in header if name != 'prognosis' and name not in symptom_index]
+    if unknown or 'prognosis' not in header:
+        if header:
+            training.error(1, f"unknown symptom columns {unknown}" if unknown else "no 'prognosis' column")
+    else:
+        disease_column = header.index('prognosis')
+        columns = [(column, symptom_index[name]) for column, name in enumerate(header) if column != disease_column]
+        for line, cells in training.rows():
+            name = resolve(training, line, cells[disease_column])
+            indices = [index for column, index in columns if cells[column] not in ('', '0')]
+            if name is not None and indices:
+                records.append((name, indices))
+
+    symptom_columns = [f'Symptom_{i}' for i in range(1, 5)]
+    symptom_list = _Reader(symptom_list_path, ['Disease', *symptom_columns], errors)
+    for line, (disease, *names) in symptom_list.rows():
+        name = resolve(symptom_list, line, disease)
+        indices = []
+        for symptom in filter(None, names):
+            if symptom not in symptom_index:
+                symptom_list.error(line, f"unknown symptom {symptom!r}")
+                continue
+            indices.append(symptom_index[symptom])
+        if name is not None and indices:
+            records.append((name, indices))
+
+    if errors:
+        raise DatasetError(errors)
+    return records
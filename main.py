@@ -1,14 +1,43 @@
-from flask import Flask, request, render_template, jsonify, redirect, url_for, flash
+from flask import Flask, request, render_template, jsonify, redirect, url_for, flash, Response, stream_with_context, g, \
+    send_from_directory
 import numpy as np
-import pandas as pd
 import pickle
 import os
 import math
+import json
+import hashlib
+import time
+import mimetypes
+import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import NamedTuple
+
+from prediction_cache import PredictionCache, symptom_bitmask
+from session_cache import UserSessionCache
+from calibration import ScoreCalibration
+from database import enable_sqlite_pragmas, engine_options
+from ingest import read_recommendations
+from metrics import MetricsRegistry
+from model_registry import ModelRegistry, ModelVersion
+from sampling_profiler import SamplingProfiler
+from static_assets import AssetManifest, picture_html
+from snapshot import file_sha256, read_snapshot, source_hashes, stale_sources
+from svc_scorer import LinearSVCScorer
+from symptom_lookup import SymptomLookup
+from severity import TRIAGE_LEVELS, TriageScorer, read_severity_weights
+from symptom_parser import SymptomParser
+from symptom_cooccurrence import CooccurrenceIndex
+from symptom_suggest import MAX_SUGGESTIONS, SuggestIndex
 
 # --- NEW IMPORTS FOR AUTHENTICATION ---
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
+from sqlalchemy.exc import IntegrityError
 from flask_login import LoginManager, UserMixin, login_user, login_required, logout_user, current_user
 from werkzeug.security import generate_password_hash, check_password_hash
+from markupsafe import Markup, escape
+from itsdangerous import BadSignature, URLSafeTimedSerializer
 
 # -------------------------------------
 
@@ -17,10 +46,51 @@ from werkzeug.security import generate_password_hash, check_password_hash
 # ============================================================
 main = Flask(__name__)
 main.config['SECRET_KEY'] = 'YourSuperSecretKeyForCollegeProject_12345'
-main.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///site.db'
+main.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get('DATABASE_URL', 'sqlite:///site.db')
 main.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+# हर worker का connection pool; SQLITE_PRAGMAS=0 पुराना बर्ताव (default journal, कोई pragma नहीं)
+main.config['SQLALCHEMY_ENGINE_OPTIONS'] = engine_options(
+    main.config['SQLALCHEMY_DATABASE_URI'],
+    pool_size=int(os.environ.get('DATABASE_POOL_SIZE', 5)),
+    max_overflow=int(os.environ.get('DATABASE_MAX_OVERFLOW', 10)),
+)
+main.config['SQLITE_PRAGMAS'] = os.environ.get('SQLITE_PRAGMAS', '1') != '0'
+# /predict results का LRU cache (0 = बंद)
+main.config['PREDICTION_CACHE_SIZE'] = int(os.environ.get('PREDICTION_CACHE_SIZE', 1024))
+# Model/datasets files बदलीं या नहीं, background thread इतने seconds में एक बार जाँचता है
+# (0 = files पर नज़र नहीं; तब नया version सिर्फ SIGUSR2 से)
+main.config['MODEL_RELOAD_INTERVAL'] = float(os.environ.get('MODEL_RELOAD_INTERVAL', 2.0))
+# /symptoms/suggest responses browser/CDN में इतने seconds cache हो सकते हैं
+main.config['SYMPTOM_SUGGEST_MAX_AGE'] = int(os.environ.get('SYMPTOM_SUGGEST_MAX_AGE', 3600))
+# /dist/ की fingerprinted files (python -m scripts.build_assets) - नाम content से बनता है, इसलिए एक साल
+main.config['ASSET_MAX_AGE'] = int(os.environ.get('ASSET_MAX_AGE', 365 * 24 * 3600))
+# about/contact/developer/blog: memory से, ETag के साथ; 0 = browser हर बार If-None-Match से पूछे (304)
+main.config['STATIC_PAGE_MAX_AGE'] = int(os.environ.get('STATIC_PAGE_MAX_AGE', 0))
+# Password hashing: werkzeug method string, जैसे 'scrypt:32768:8:1' या 'pbkdf2:sha256:600000'।
+# बदलने पर पुराने hashes अगले सफल login पर नए method से दोबारा बनते हैं।
+main.config['PASSWORD_HASH_METHOD'] = os.environ.get('PASSWORD_HASH_METHOD', 'scrypt:32768:8:1')
+# Logged-in user की copy हर process में इतने seconds तक (0 = हर request पर DB query)
+main.config['USER_SESSION_CACHE_TTL'] = float(os.environ.get('USER_SESSION_CACHE_TTL', 60))
+main.config['USER_SESSION_CACHE_SIZE'] = int(os.environ.get('USER_SESSION_CACHE_SIZE', 10000))
+# हर worker के metrics यहाँ mmap files में; /metrics सबको जोड़ता है (न हो तो सिर्फ उसी process के)
+main.config['METRICS_DIR'] = os.environ.get('METRICS_DIR') or None
+# PROFILE_REQUESTS=1 पर '?profile=1' या 'X-Profile: 1' वाले requests sample-profile होते हैं
+main.config['PROFILE_REQUESTS'] = os.environ.get('PROFILE_REQUESTS', '0') != '0'
+main.config['PROFILE_INTERVAL'] = float(os.environ.get('PROFILE_INTERVAL', 0.001))
+main.config['PROFILE_DIR'] = os.environ.get('PROFILE_DIR', os.path.join(main.instance_path, 'profiles'))
+# JSON prediction API (/api/v1/predict) के bearer tokens की उम्र, seconds में
+main.config['API_TOKEN_MAX_AGE'] = int(os.environ.get('API_TOKEN_MAX_AGE', 86400))
+# Triage level के minimum severity scores (Symptom-severity.csv weights का जोड़); इससे कम = 'routine'
+main.config['TRIAGE_PRIORITY_SCORE'] = int(os.environ.get('TRIAGE_PRIORITY_SCORE', 15))
+main.config['TRIAGE_URGENT_SCORE'] = int(os.environ.get('TRIAGE_URGENT_SCORE', 20))
+# इतने weight का कोई एक symptom (coma, chest_pain, ...) जोड़ कम होने पर भी कम से कम 'priority'
+main.config['TRIAGE_CRITICAL_WEIGHT'] = int(os.environ.get('TRIAGE_CRITICAL_WEIGHT', 7))
 
 db = SQLAlchemy(main)
+if main.config['SQLITE_PRAGMAS']:
+    # WAL, synchronous=NORMAL, busy_timeout, mmap_size - हर नए connection पर (database.py)
+    with main.app_context():
+        enable_sqlite_pragmas(db.engine)
 login_manager = LoginManager()
 login_manager.init_app(main)
 login_manager.login_view = 'login'
@@ -31,9 +101,30 @@ login_manager.login_message_category = 'info'
 # User Model for Database (NEW)
 # ============================================================
 
+user_session_cache = UserSessionCache(ttl=main.config['USER_SESSION_CACHE_TTL'],
+                                      maxsize=main.config['USER_SESSION_CACHE_SIZE'])
+
+
+# Configured method का पूरा रूप ('scrypt' -> 'scrypt:32768:8:1'), जैसा वह stored hash में लिखा जाता है
+@lru_cache(maxsize=None)
+def password_hash_prefix(method):
+    return generate_password_hash('', method).split('$', 1)[0]
+
+
 @login_manager.user_loader
 def load_user(user_id):
-    return User.query.get(int(user_id))
+    try:
+        user_id = int(user_id)
+    except ValueError:
+        return None
+    user = user_session_cache.get(user_id)
+    if user is None:
+        row = db.session.get(User, user_id)
+        if row is None:
+            return None
+        user = SessionUser(row.id, row.username, row.email)
+        user_session_cache.put(user_id, user)
+    return user
 
 
 class User(UserMixin, db.Model):
@@ -43,15 +134,38 @@ class User(UserMixin, db.Model):
     password_hash = db.Column(db.String(128))
 
     def set_password(self, password):
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = generate_password_hash(password, main.config['PASSWORD_HASH_METHOD'])
 
     def check_password(self, password):
         return check_password_hash(self.password_hash, password)
 
+    def password_needs_rehash(self):
+        stored_prefix = (self.password_hash or '').split('$', 1)[0]
+        return stored_prefix != password_hash_prefix(main.config['PASSWORD_HASH_METHOD'])
+
     def __repr__(self):
         return f"User('{self.username}', '{self.email}')"
 
 
+# Request path पर current_user: DB row की detached, read-only copy जो user_session_cache में रहती है
+# (किसी SQLAlchemy session से बंधी नहीं, इसलिए threads/requests के बीच share हो सकती है)
+class SessionUser(UserMixin):
+    def __init__(self, id, username, email):
+        self.id = id
+        self.username = username
+        self.email = email
+
+    def __repr__(self):
+        return f"SessionUser('{self.username}', '{self.email}')"
+
+
+# Password change, username बदलना या user delete - इस process की cached copy तुरंत हटाएँ
+@event.listens_for(User, 'after_update')
+@event.listens_for(User, 'after_delete')
+def _invalidate_cached_user(mapper, connection, target):
+    user_session_cache.invalidate(target.id)
+
+
 # ============================================================
 # Load Data & Model
 # ============================================================
@@ -60,67 +174,118 @@ class User(UserMixin, db.Model):
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DATASETS_PATH = os.path.join(BASE_DIR, "datasets")
 MODELS_PATH = os.path.join(BASE_DIR, "models")
+DIST_PATH = os.path.join(main.static_folder, 'dist')
 
 
-# Load datasets safely
-def load_data(filename, default_value=pd.DataFrame()):
-    path = os.path.join(DATASETS_PATH, filename)
-    try:
-        # यहाँ NaN वैल्यू को स्ट्रिंग के रूप में लोड होने से रोकने के लिए keep_default_na=True आवश्यक है
-        return pd.read_csv(path, keep_default_na=True)
-    except FileNotFoundError:
-        print(f"Error: Dataset file '{path}' not found. Using empty DataFrame.")
-        return default_value
+# Serving snapshot: CSV parsing और pandas की जगह एक binary file (python -m scripts.build_snapshot)
+# USE_SNAPSHOT=0 से पुराना CSV path ज़बरदस्ती चलाया जा सकता है (startup benchmark के लिए)
+SNAPSHOT_PATH = os.environ.get('SNAPSHOT_PATH', os.path.join(MODELS_PATH, 'snapshot.bin'))
+USE_SNAPSHOT = os.environ.get('USE_SNAPSHOT', '1') != '0'
 
+# Request path इन्हीं CSVs पर निर्भर है (symtoms_df.csv serving में इस्तेमाल नहीं होती)
+RECOMMENDATION_FILES = ("description.csv", "precautions_df.csv", "medications.csv", "diets.csv", "workout_df.csv")
+# Symptom co-occurrence index (python -m scripts.build_cooccurrence) इन records से बनता है
+COOCCURRENCE_FILES = ("Training.csv", "symtoms_df.csv")
+
+scorer_path = os.path.join(MODELS_PATH, 'svc_linear.npz')
+model_path = os.path.join(MODELS_PATH, 'svc.pkl')
+lookup_table_path = os.path.join(MODELS_PATH, 'symptom_lookup.npy')
+lookup_meta_path = os.path.join(MODELS_PATH, 'symptom_lookup.json')
+calibration_path = os.path.join(MODELS_PATH, 'calibration.npz')
+# Hindi नाम और synonyms - free-text symptom parser इन्हीं से बनता है
+symptom_phrases_path = os.path.join(DATASETS_PATH, 'symptom_phrases.json')
+severity_path = os.path.join(DATASETS_PATH, 'Symptom-severity.csv')
+cooccurrence_path = os.path.join(MODELS_PATH, 'symptom_cooccurrence.npz')
 
-sym_des = load_data("symtoms_df.csv")
-precautions = load_data("precautions_df.csv")
-workout = load_data("workout_df.csv")
-description = load_data("description.csv")
-medications = load_data('medications.csv')
-diets = load_data("diets.csv")
 
 # Load model safely
-svc = None
-model_path = os.path.join(MODELS_PATH, 'svc.pkl')
-try:
-    with open(model_path, 'rb') as f:
-        svc = pickle.load(f)
-except FileNotFoundError:
-    print(f"Error: Model file '{model_path}' not found. Prediction will not work.")
-except Exception as e:
-    print(f"Error loading model: {e}")
+# पहले compiled NumPy scorer (models/svc_linear.npz) - इससे workers को sklearn/scipy import नहीं करना पड़ता।
+# Artifact न हो तो svc.pkl से उसी समय compile करें (इसके लिए sklearn चाहिए)।
+# Artifact बनाएँ: python -m scripts.export_model
+def load_model():
+    try:
+        return LinearSVCScorer.load(scorer_path)
+    except FileNotFoundError:
+        try:
+            with open(model_path, 'rb') as f:
+                return LinearSVCScorer.from_svc(pickle.load(f), file_sha256(model_path))
+        except FileNotFoundError:
+            print(f"Error: Model file '{model_path}' not found. Prediction will not work.")
+        except Exception as e:
+            print(f"Error loading model: {e}")
+    except Exception as e:
+        print(f"Error loading model: {e}")
+    return None
+
+
+# Snapshot किन files से बना है - इनमें से कोई बदले तो snapshot stale है
+def snapshot_sources():
+    sources = {f"datasets/{name}": os.path.join(DATASETS_PATH, name) for name in RECOMMENDATION_FILES}
+    sources["models/svc_linear.npz"] = scorer_path
+    sources["models/calibration.npz"] = calibration_path
+    return sources
+
+
+# Co-occurrence index किन files से बना है - इनमें से कोई बदले तो index stale है
+def cooccurrence_sources():
+    return {f"datasets/{name}": os.path.join(DATASETS_PATH, name) for name in COOCCURRENCE_FILES}
+
+
+# Parser, autocomplete, triage और related symptoms इन files से बनते हैं - ये भी model version का हिस्सा,
+# ताकि इन्हें बदलने पर reload हो और नया version अपने indexes के साथ swap हो (cache key भी बदलती है)
+def symptom_index_sources():
+    return {"datasets/symptom_phrases.json": symptom_phrases_path, "datasets/Symptom-severity.csv": severity_path,
+            "models/symptom_cooccurrence.npz": cooccurrence_path}
+
+
+# Differential के scores -> probabilities (python -m scripts.fit_calibration); न हो तो None
+def load_calibration():
+    if not os.path.exists(calibration_path):
+        return None
+    try:
+        return ScoreCalibration.load(calibration_path)
+    except Exception as e:
+        print(f"Warning: Calibration table not used: {e}")
+        return None
+
+
+def load_fresh_snapshot():
+    if not USE_SNAPSHOT or not os.path.exists(SNAPSHOT_PATH):
+        return None
+    try:
+        payload = read_snapshot(SNAPSHOT_PATH)
+    except Exception as e:
+        print(f"Warning: Snapshot '{SNAPSHOT_PATH}' not used: {e}")
+        return None
+    stale = stale_sources(payload, snapshot_sources())
+    if stale:
+        print(f"Warning: Snapshot is older than {', '.join(stale)}. Loading CSVs instead; "
+              f"rebuild it with: python -m scripts.build_snapshot")
+        return None
+    return payload
 
 
 # ============================================================
 # Helper Functions and Dictionaries
 # ============================================================
 
-def helper(dis):
-    # Description
-    desc_series = description[description['Disease'] == dis]['Description']
-    # FIX for ValueError: .iloc[0] का उपयोग करें
-    dis_des = desc_series.iloc[0] if not desc_series.empty else "No description available."
+# एक बीमारी का पूरा recommendation data - immutable, slotted record (NamedTuple)
+# helper() पहले की तरह 5 values unpack करने देता है
+class Recommendation(NamedTuple):
+    description: str
+    precautions: tuple
+    medications: tuple
+    diets: tuple
+    workouts: tuple
 
-    # Precautions
-    pre_data = precautions[precautions['Disease'] == dis][
-        ['Precaution_1', 'Precaution_2', 'Precaution_3', 'Precaution_4']]
-    # FIX: .values.tolist() का उपयोग करें
-    pre = pre_data.values.tolist() if not pre_data.empty and len(pre_data) > 0 else [[]]
 
-    # Medications
-    med = medications[medications['Disease'] == dis]['Medication']
-    medications_list = med.tolist() if not med.empty else []
+EMPTY_RECOMMENDATION = Recommendation("No description available.", (), (), (), ())
 
-    # Diets
-    die = diets[diets['Disease'] == dis]['Diet']
-    diets_list = die.tolist() if not die.empty else []
 
-    # Workout
-    wrkout = workout[workout['disease'] == dis]['workout']
-    workout_list = wrkout.tolist() if not wrkout.empty else []
-
-    return dis_des, pre, medications_list, diets_list, workout_list
+def helper(dis, model=None):
+    # अब सिर्फ एक dict lookup - सारा data startup पर (या model reload पर) तैयार है
+    model = model_registry.current if model is None else model
+    return model.recommendations.get(dis, EMPTY_RECOMMENDATION)
 
 
 symptoms_dict = {'itching': 0, 'skin_rash': 1, 'nodal_skin_eruptions': 2, 'continuous_sneezing': 3, 'shivering': 4,
@@ -168,28 +333,544 @@ diseases_list = {15: 'Fungal infection', 4: 'Allergy', 16: 'GERD', 9: 'Chronic c
                  35: 'Psoriasis', 27: 'Impetigo'}
 
 
-# Model Prediction function
-def get_predicted_value(patient_symptoms):
-    if svc is None:
-        return "Model Not Loaded"
+# CSV path: datasets validate + normalize करके index बनाएँ (snapshot न होने पर, और snapshot build के समय)
+# Data में कोई गलती हो तो ingest.DatasetError - reload पर पुराना version चलता रहता है
+def load_recommendation_index_from_csv():
+    records = read_recommendations(DATASETS_PATH, list(diseases_list.values()))
+    return {dis: Recommendation(*fields) for dis, fields in records.items()}
 
-    if not patient_symptoms:
-        return "No Symptoms Selected"
 
-    input_vector = np.zeros(len(symptoms_dict))
+# हर symptom का Hindi नाम और synonyms; file न हो तो सिर्फ English keys पहचानी जाती हैं
+def load_symptom_phrases():
+    try:
+        with open(symptom_phrases_path, encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        print(f"Warning: '{symptom_phrases_path}' not found. Only English symptom names will be recognized.")
+        return {}
+
 
-    # Populate vector with 1s for selected symptoms
+# Autocomplete ranking और triage के लिए severity weights; file न हो तो सब बराबर (हर request 'routine')
+def load_severity_weights():
+    try:
+        return read_severity_weights(severity_path, symptoms_dict)
+    except FileNotFoundError:
+        print(f"Warning: '{severity_path}' not found. "
+              "Symptom suggestions will not be ranked by severity and triage scores will be 0.")
+        return {}
+
+
+# "Related symptoms" (/symptoms/related); index न हो या datasets से पुराना हो तो endpoint बंद
+def load_cooccurrence_index():
+    if not os.path.exists(cooccurrence_path):
+        print(f"Warning: '{cooccurrence_path}' not found. /symptoms/related is disabled; "
+              "build it with: python -m scripts.build_cooccurrence")
+        return None
+    try:
+        index = CooccurrenceIndex.load(cooccurrence_path)
+    except Exception as e:
+        print(f"Warning: Co-occurrence index not used: {e}")
+        return None
+    stale = stale_sources({'sources': index.sources}, cooccurrence_sources())
+    if index.symptoms != list(symptoms_dict) or stale:
+        print(f"Warning: Co-occurrence index is older than {', '.join(stale) or 'symptoms_dict'}. "
+              "Rebuild it with: python -m scripts.build_cooccurrence")
+        return None
+    return index
+
+
+# ============================================================
+# Startup: snapshot से load करें, न हो तो CSVs + model artifact से
+# ============================================================
+
+# svc.pkl (~400 KB) का hash सिर्फ तब जब उसका mtime/size बदले - हर reload पर दोबारा पढ़ना नहीं
+@lru_cache(maxsize=1)
+def _model_file_sha256(mtime_ns, size):
+    return file_sha256(model_path)
+
+
+# Snapshot/CSV path दोनों से एक ModelVersion; version = सभी source files के hashes का hash
+def load_model_version():
+    snapshot = load_fresh_snapshot()
+    if snapshot is not None:
+        recommendations = {dis: Recommendation(*fields) for dis, fields in snapshot['recommendations'].items()}
+        scorer = LinearSVCScorer(**snapshot['scorer'])
+        calibration = ScoreCalibration(**snapshot['calibration']) if snapshot.get('calibration') else None
+        sources = snapshot['sources']
+    else:
+        recommendations = load_recommendation_index_from_csv()
+        scorer = load_model()
+        calibration = load_calibration()
+        sources = source_hashes(snapshot_sources())
+    index_sources = source_hashes(symptom_index_sources())
+    sources = {**sources, **index_sources}
+
+    # svc_linear.npz export के बाद svc.pkl बदला हो तो serving अभी भी पुराना (exported) model है
+    if scorer is not None and scorer.model_sha256 and os.path.exists(model_path) \
+            and scorer.model_sha256 != _model_file_sha256(os.stat(model_path).st_mtime_ns, os.path.getsize(model_path)):
+        print(f"Warning: '{model_path}' changed after the scorer artifact was exported; still serving the "
+              "exported model. Re-export it with: python -m scripts.export_model")
+
+    # Calibration किसी और model के scores पर fit हुई हो तो उसके probabilities गलत होंगे
+    if calibration is not None and os.path.exists(scorer_path) \
+            and calibration.scorer_sha256 != file_sha256(scorer_path):
+        print("Warning: Calibration table was fitted for a different model. "
+              "Refit it with: python -m scripts.fit_calibration")
+        calibration = None
+
+    # Optional: छोटे symptom sets (1-3) के पहले से निकाले गए जवाब, mmap'd और सभी workers में shared
+    # Table बनाएँ: python -m scripts.build_lookup
+    lookup = None
+    if scorer is not None and os.path.exists(lookup_meta_path):
+        try:
+            lookup = SymptomLookup.load(lookup_table_path, lookup_meta_path, scorer_path)
+        except Exception as e:
+            print(f"Warning: Symptom lookup table not used: {e}")
+
+    version = hashlib.sha256(json.dumps(sources, sort_keys=True).encode()).hexdigest()[:12]
+    return ModelVersion(version=version, scorer=scorer, recommendations=MappingProxyType(recommendations),
+                        calibration=calibration, lookup=lookup,
+                        **load_symptom_indexes(tuple(sorted(index_sources.items()))), loaded_at=time.time())
+
+
+# Free text / Hindi -> symptoms_dict keys, autocomplete का prefix index, related symptoms, और
+# severity score + triage level (queue में urgent cases आगे)। ModelVersion का हिस्सा, ताकि एक request
+# के parser, triage और cached prediction हमेशा एक ही version के हों।
+# source_digests (इनकी files के hashes) सिर्फ cache key है: बनाने में ~30 ms लगते हैं, इसलिए जिस reload में
+# ये files नहीं बदलीं वह पिछले version के objects ही इस्तेमाल करता है (सब immutable हैं)।
+@lru_cache(maxsize=1)
+def load_symptom_indexes(source_digests):
+    phrases = load_symptom_phrases()
+    weights = load_severity_weights()
+    return {
+        'symptom_phrases': MappingProxyType(phrases),
+        'symptom_parser': SymptomParser.from_phrase_table(symptoms_dict, phrases),
+        'symptom_suggest': SuggestIndex(symptoms_dict, phrases, weights),
+        'symptom_cooccurrence': load_cooccurrence_index(),
+        'triage_scorer': TriageScorer.from_weights(
+            weights, symptoms_dict, (main.config['TRIAGE_PRIORITY_SCORE'], main.config['TRIAGE_URGENT_SCORE']),
+            main.config['TRIAGE_CRITICAL_WEIGHT']),
+    }
+
+
+# Reload पर नया version तभी लगे जब वह इन्हीं symptoms/diseases पर चलता हो
+def validate_model_version(model):
+    if model.scorer is None:
+        raise ValueError("model could not be loaded")
+    if model.scorer.n_features != len(symptoms_dict):
+        raise ValueError(f"model has {model.scorer.n_features} features, symptoms_dict has {len(symptoms_dict)}")
+    if set(model.scorer.classes.tolist()) != set(diseases_list):
+        raise ValueError("model classes do not match diseases_list")
+    missing = [dis for dis in diseases_list.values() if dis not in model.recommendations]
+    if missing:
+        raise ValueError(f"no recommendations for {len(missing)} diseases (first: {missing[0]!r})")
+    if model.scorer.predict_indices([0]) not in diseases_list:
+        raise ValueError("model predicts an unknown class")
+
+
+# Model files या version की sources बदलने पर नया version background में load होकर atomically swap होता है।
+# सिर्फ वही files watch होती हैं जिनसे version बनता है - Training.csv/symtoms_df.csv सिर्फ offline builds
+# (train_model, build_cooccurrence) में पढ़ी जाती हैं। svc.pkl बदलने पर reload सिर्फ ऊपर की warning देता है।
+model_registry = ModelRegistry(
+    load_model_version,
+    validate=validate_model_version,
+    watch_paths=(SNAPSHOT_PATH, model_path, lookup_table_path, lookup_meta_path, *snapshot_sources().values(),
+                 *symptom_index_sources().values()),
+    check_interval=main.config['MODEL_RELOAD_INTERVAL'],
+)
+
+
+
+# Symptom names -> symptoms_dict indices (unknown names अलग से लौटाए जाते हैं)
+# Exact keys सीधे dict से; बाकी (Hindi, free text, 'spotting urination' जैसे टूटे keys) parser से
+def encode_symptoms(patient_symptoms, model=None):
+    parser = (model_registry.current if model is None else model).symptom_parser
+    indices = []
+    unknown = []
     for item in patient_symptoms:
         item = item.strip()
-        if item and item in symptoms_dict:
-            input_vector[symptoms_dict[item]] = 1
-        elif item:
-            print(f"Warning: Symptom '{item}' not found in symptoms_dict.")
+        if not item:
+            continue
+        if item in symptoms_dict:
+            indices.append(symptoms_dict[item])
+            continue
+        keys, item_unknown = parser.parse(item)
+        indices.extend(symptoms_dict[key] for key in keys)
+        unknown.extend(item_unknown)
+    return indices, unknown
+
+
+# Key में model version है; नया version swap होते ही पुराने entries हटा दिए जाते हैं
+prediction_cache = PredictionCache(maxsize=main.config['PREDICTION_CACHE_SIZE'])
+model_registry.on_swap(lambda old, new: prediction_cache.clear())
+
+
+# ============================================================
+# Metrics (/metrics, Prometheus text format)
+# ============================================================
+
+PREDICT_STAGES = ('form_parse', 'encode', 'predict', 'helper', 'render', 'total')
+# resolve_symptoms() के error messages -> outcome label
+PREDICTION_OUTCOMES = {
+    None: 'ok',
+    "No Symptoms Selected": 'no_symptoms',
+    "Not enough valid symptoms selected for prediction.": 'no_valid_symptoms',
+    "Model Not Loaded": 'model_not_loaded',
+}
+
+request_metrics = MetricsRegistry(main.config['METRICS_DIR'])
+predict_stage_seconds = request_metrics.histogram(
+    'medassist_predict_stage_seconds', "Time spent in each stage of POST /predict.", 'stage', PREDICT_STAGES)
+predictions_total = request_metrics.counter(
+    'medassist_predictions_total', "Predictions by outcome.", 'outcome', PREDICTION_OUTCOMES.values())
+predicted_disease_total = request_metrics.counter(
+    'medassist_predicted_disease_total', "Successful predictions by disease.", 'disease',
+    sorted(diseases_list.values()))
+prediction_cache_total = request_metrics.counter(
+    'medassist_prediction_cache_total', "Prediction cache lookups.", 'result', ('hit', 'miss'))
+unknown_symptoms_total = request_metrics.counter(
+    'medassist_unknown_symptoms_total', "Symptom inputs that matched no known symptom.")
+triage_level_total = request_metrics.counter(
+    'medassist_triage_level_total', "Successful predictions by triage level.", 'level', TRIAGE_LEVELS)
+
+
+# छोटे symptom sets का जवाब lookup table से (binary search), बाकी के लिए model
+def predict_class(indices, model):
+    indices = sorted(set(indices))
+    if model.lookup is not None:
+        cls = model.lookup.get(indices)
+        if cls is not None:
+            return cls
+    # सिर्फ active symptom indices पर sparse scoring
+    return model.scorer.predict_indices(indices)
+
+
+# Input symptoms -> (valid indices, None) या ([], error message)
+def resolve_symptoms(patient_symptoms, model):
+    if model.scorer is None:
+        return [], "Model Not Loaded"
+
+    if not patient_symptoms:
+        return [], "No Symptoms Selected"
+
+    indices, unknown = encode_symptoms(patient_symptoms, model)
+    # Metric सिर्फ prediction requests का - encode_symptoms() batch/related/CLI में भी चलता है
+    if unknown:
+        unknown_symptoms_total.inc(amount=len(unknown))
+    for item in unknown:
+        main.logger.warning("Symptom %r not found in symptoms_dict.", item)
+
+    if not indices:
+        return [], "Not enough valid symptoms selected for prediction."
+    return indices, None
+
+
+# /predict का पूरा result: (predicted_disease, Recommendation, (triage score, level)) या (error message, None, None)
+# Result symptom set के bitmask पर cached है, इसलिए repeat combinations पर model और helper() नहीं चलते
+def get_prediction_result(patient_symptoms):
+    # पूरा request एक ही version पर: reload बीच में हो जाए तब भी
+    model = model_registry.current
+    with predict_stage_seconds.time('encode'):
+        indices, error = resolve_symptoms(patient_symptoms, model)
+    predictions_total.inc(PREDICTION_OUTCOMES.get(error))
+    if error:
+        return error, None, None
+
+    key = (model.version, symptom_bitmask(indices))
+    result = prediction_cache.get(key)
+    prediction_cache_total.inc('miss' if result is None else 'hit')
+    if result is None:
+        with predict_stage_seconds.time('predict'):
+            predicted_disease = diseases_list[predict_class(indices, model)]
+        with predict_stage_seconds.time('helper'):
+            result = (predicted_disease, helper(predicted_disease, model), model.triage_scorer.score(indices))
+        prediction_cache.put(key, result)
+    predicted_disease_total.inc(result[0])
+    triage_level_total.inc(result[2][1])
+    return result
+
+
+# Differential diagnosis: top-k बीमारियाँ, एक ही model evaluation से
+# Returns (candidates, None) या (None, error message); हर candidate में score, probability और helper() data
+def get_differential(patient_symptoms, k=5):
+    model = model_registry.current
+    svc = model.scorer
+    indices, error = resolve_symptoms(patient_symptoms, model)
+    if error:
+        return None, error
+
+    indices = sorted(set(indices))
+    decisions = svc.decision_indices(indices)
+    scores = svc.class_scores(decisions)
+    k = max(1, min(k, len(scores)))
+
+    # पूरी sorting नहीं - सिर्फ top-k argpartition से, फिर उन k को sort करें
+    top = np.argpartition(-scores, k - 1)[:k]
+    top = top[np.argsort(-scores[top], kind='stable')]
+    # Votes के tie में score किसी और बीमारी को आगे कर सकता है; पहला नंबर हमेशा /predict वाला जवाब हो
+    predicted = int(svc._vote(decisions))
+    if top[0] != predicted:
+        top = np.concatenate([[predicted], top[top != predicted]])[:k]
+
+    calibration = model.calibration
+    probabilities = calibration(scores[top]) if calibration is not None else [None] * len(top)
+    candidates = []
+    for column, probability in zip(top, probabilities):
+        disease = diseases_list[svc.classes[column]]
+        candidates.append({'disease': disease, 'score': round(float(scores[column]), 4),
+                           'probability': None if probability is None else round(float(probability), 4),
+                           **helper(disease, model)._asdict()})
+    return candidates, None
+
+
+# Model Prediction function
+def get_predicted_value(patient_symptoms):
+    return get_prediction_result(patient_symptoms)[0]
+
+
+# ============================================================
+# Batch Prediction
+# ============================================================
+
+# NDJSON stream को इतनी rows के chunks में score किया जाता है
+BATCH_CHUNK_SIZE = 512
+# एक JSON body में अधिकतम rows (बड़े batches NDJSON से भेजें)
+BATCH_MAX_ROWS = 10000
+
+
+def _batch_row_symptoms(row):
+    # हर row: symptoms की list, comma-separated string, या {"symptoms": ...}
+    if isinstance(row, dict):
+        row = row.get('symptoms')
+    if isinstance(row, str):
+        row = row.split(',')
+    if not isinstance(row, list) or not all(isinstance(item, str) for item in row):
+        return None
+    return row
+
+
+# N symptom lists -> एक (N, 132) matrix, एक ही vectorized assignment में
+def encode_symptom_matrix(rows, model=None):
+    model = model_registry.current if model is None else model
+    row_ids = []
+    col_ids = []
+    unknown = []
+    errors = [None] * len(rows)
+    for i, row in enumerate(rows):
+        symptoms = _batch_row_symptoms(row)
+        if symptoms is None:
+            errors[i] = "Row must be a list of symptom names."
+            unknown.append([])
+            continue
+        indices, row_unknown = encode_symptoms(symptoms, model)
+        unknown.append(row_unknown)
+        if not indices:
+            errors[i] = "No Symptoms Selected" if not row_unknown else \
+                "Not enough valid symptoms selected for prediction."
+            continue
+        row_ids.extend([i] * len(indices))
+        col_ids.extend(indices)
+
+    matrix = np.zeros((len(rows), len(symptoms_dict)), dtype=np.uint8)
+    matrix[row_ids, col_ids] = 1
+    return matrix, errors, unknown
+
+
+def predict_batch(rows):
+    model = model_registry.current
+    return predict_matrix(*encode_symptom_matrix(rows, model), model=model)
+
+
+# (N, 132) symptom matrix -> हर row का result dict (triage score/level के साथ); details=False पर helper() data नहीं जुड़ता
+def predict_matrix(matrix, errors, unknown, details=True, model=None):
+    model = model_registry.current if model is None else model
+    svc = model.scorer
+    valid = [i for i, error in enumerate(errors) if error is None]
+
+    predictions = {}
+    if valid and svc is not None:
+        # पूरे batch के लिए सिर्फ एक svc.predict call, और हर अलग symptom set सिर्फ एक बार
+        # (exports में एक ही combination बार-बार आता है; rows 17 bytes में pack करके unique)
+        unique, inverse = np.unique(np.packbits(matrix[valid], axis=1), axis=0, return_inverse=True)
+        predicted = svc.predict(np.unpackbits(unique, axis=1, count=matrix.shape[1]))
+        predictions = dict(zip(valid, predicted[inverse.ravel()]))
+    # Error rows की matrix row खाली है (score 0) - उनका score इस्तेमाल नहीं होता
+    triage_scores, triage_levels = model.triage_scorer.score_matrix(matrix)
+
+    results = []
+    for i, error in enumerate(errors):
+        if error is None and svc is None:
+            error = "Model Not Loaded"
+        if error is not None:
+            results.append({'row': i, 'error': error, 'unknown_symptoms': unknown[i]})
+            continue
+        disease = diseases_list[predictions[i]]
+        result = {'row': i, 'disease': disease, 'triage_score': int(triage_scores[i]),
+                  'triage_level': str(triage_levels[i]), 'unknown_symptoms': unknown[i]}
+        if details:
+            result.update(helper(disease, model)._asdict())
+        results.append(result)
+    return results
+
+
+def _iter_ndjson_rows(stream):
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError:
+            # खराब line को भी row माना जाता है ताकि row numbers सही रहें
+            yield None
+
+
+def _iter_batch_chunks(rows, size):
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+# बहुत बड़े batches: body को line-by-line पढ़ें और results भी NDJSON में stream करें
+def stream_predict_batch(stream, chunk_size=BATCH_CHUNK_SIZE):
+    offset = 0
+    for chunk in _iter_batch_chunks(_iter_ndjson_rows(stream), chunk_size):
+        for result in predict_batch(chunk):
+            result['row'] += offset
+            yield json.dumps(result, ensure_ascii=False) + '\n'
+        offset += len(chunk)
+
+
+# ============================================================
+# JSON Prediction API (/api/v1/predict)
+# ============================================================
+
+# Session cookie की जगह signed bearer token: verify करने में सिर्फ HMAC, कोई DB query या
+# session load नहीं। इसलिए यही endpoint asgi.py में Flask के बाहर भी चल सकता है।
+api_token_serializer = URLSafeTimedSerializer(main.config['SECRET_KEY'], salt='api-token')
+
+
+def issue_api_token(user_id):
+    return api_token_serializer.dumps({'uid': int(user_id)})
+
+
+# index.html का token; LOGIN_DISABLED (benchmarks) में कोई user नहीं - page तब form POST ही करता है
+def page_api_token():
+    return issue_api_token(current_user.id) if current_user.is_authenticated else None
+
+
+# "Bearer <token>" header -> user id, या None (token गलत/expired)
+def verify_api_token(authorization):
+    scheme, _, token = (authorization or '').partition(' ')
+    if scheme.lower() != 'bearer' or not token:
+        return None
+    try:
+        data = api_token_serializer.loads(token.strip(), max_age=main.config['API_TOKEN_MAX_AGE'])
+    except BadSignature:
+        return None
+    return data.get('uid') if isinstance(data, dict) else None
+
+
+# Page और API दोनों पर एक ही user-facing message
+def prediction_error_message(error):
+    if error == "Model Not Loaded":
+        return "AI मॉडल लोड नहीं हो सका। कृपया अपनी 'models' फ़ोल्डर की जाँच करें।"
+    if error == "No Symptoms Selected":
+        return "कृपया बीमारी का अनुमान लगाने के लिए कम से कम एक लक्षण चुनें।"
+    return error + " कृपया अधिक वैध लक्षण चुनें।"
+
 
-    if np.sum(input_vector) == 0:
-        return "Not enough valid symptoms selected for prediction."
+# Body {"symptoms": [...] या "a, b"} -> (response dict, HTTP status); Flask route और asgi.py दोनों यही चलाते हैं
+def api_predict(payload):
+    symptoms = _batch_row_symptoms(payload)
+    if symptoms is None:
+        return {'error': "Body must be {\"symptoms\": [...]}."}, 400
+    symptoms = [symptom.strip() for symptom in symptoms if symptom.strip()]
 
-    return diseases_list[svc.predict([input_vector])[0]]
+    predicted_disease, recommendation, triage = get_prediction_result(symptoms)
+    if recommendation is None:
+        status = 503 if predicted_disease == "Model Not Loaded" else 422
+        return {'error': predicted_disease, 'message': prediction_error_message(predicted_disease)}, status
+    return {'disease': predicted_disease, 'triage_score': triage[0], 'triage_level': triage[1],
+            **recommendation._asdict()}, 200
+
+
+# ============================================================
+# Rendered Output Cache (static pages, /predict result fragment)
+# ============================================================
+
+# Templates सिर्फ deploy पर बदलते हैं। जिस output में कोई per-request value नहीं, वह एक बार
+# render होकर यहाँ रहता है: static pages (HTML + ETag) और हर बीमारी का result fragment।
+# Debug / TEMPLATES_AUTO_RELOAD में cache बंद रहता है, ताकि template edits तुरंत दिखें।
+rendered_cache = {}
+# Model swap पर पुराने version के fragments हटें (वरना हर reload के साथ entries बढ़तीं)
+model_registry.on_swap(lambda old, new: rendered_cache.clear())
+
+
+def render_cached(key, template, **context):
+    if main.jinja_env.auto_reload:
+        return render_template(template, **context)
+    html = rendered_cache.get(key)
+    if html is None:
+        html = rendered_cache[key] = render_template(template, **context)
+    return html
+
+
+# templates/_result.html: key में पूरा Recommendation है, इसलिए reload के बीच चल रहा request
+# पुराने version का HTML नए version के नाम से cache नहीं कर सकता
+def render_result_fragment(predicted_disease=None, recommendation=None):
+    if recommendation is None:
+        return Markup(render_cached(('result', None), '_result.html'))
+    dis_des, my_precautions, medications_list, rec_diet, workout = recommendation
+    return Markup(render_cached(('result', predicted_disease, recommendation), '_result.html',
+                                predicted_disease=predicted_disease, dis_des=dis_des, my_precautions=my_precautions,
+                                medications=medications_list, my_diet=rec_diet, workout=workout))
+
+
+# Per-user shell: index.html एक बार markers के साथ render होता है (हर per-request value की जगह
+# \x00name\x00), फिर हर request पर सिर्फ pieces जोड़े जाते हैं - values escape होकर markers की जगह।
+# Template में इन values पर {% if %} नहीं होना चाहिए (marker हमेशा truthy है)।
+_SHELL_SLOT = re.compile(r'\x00(\w+)\x00')
+
+
+def render_shell(template, **values):
+    if main.jinja_env.auto_reload:
+        return render_template(template, **values)
+    key = ('shell', template, request.script_root, current_user.is_authenticated)
+    parts = rendered_cache.get(key)
+    if parts is None:
+        html = render_template(template, **{name: Markup(f"\x00{name}\x00") for name in values})
+        parts = rendered_cache[key] = _SHELL_SLOT.split(html)
+    pieces = parts.copy()
+    for i in range(1, len(parts), 2):
+        pieces[i] = escape(values[parts[i]])
+    return ''.join(pieces)
+
+
+def render_index(message=None, predicted_disease=None, recommendation=None):
+    username = current_user.username if current_user.is_authenticated else ''
+    return render_shell('index.html', api_token=page_api_token() or '', username=username, message=message or '',
+                        result_html=render_result_fragment(predicted_disease, recommendation))
+
+
+def static_page(template):
+    key = ('page', template, request.script_root)
+    page = rendered_cache.get(key)
+    if page is None:
+        html = render_template(template).encode()
+        page = (html, hashlib.sha1(html).hexdigest())
+        if not main.jinja_env.auto_reload:
+            rendered_cache[key] = page
+    response = Response(page[0], mimetype='text/html')
+    response.set_etag(page[1])
+    response.cache_control.public = True
+    response.cache_control.max_age = main.config['STATIC_PAGE_MAX_AGE']
+    return response.make_conditional(request)
 
 
 # ============================================================
@@ -206,17 +887,29 @@ def signup():
         username = request.form.get('username')
         email = request.form.get('email')
         password = request.form.get('password')
-
-        user_exists = User.query.filter_by(email=email).first()
-        if user_exists:
-            flash('यह ईमेल पहले से पंजीकृत है। कृपया लॉगिन करें या दूसरा ईमेल उपयोग करें।', 'danger')
+        if not username or not email or not password:
+            flash('कृपया यूज़रनेम, ईमेल और पासवर्ड तीनों भरें।', 'danger')
             return redirect(url_for('signup'))
 
         new_user = User(username=username, email=email)
         new_user.set_password(password)
 
+        # सिर्फ एक INSERT - duplicate email/username को unique constraints पकड़ते हैं
+        # (पहले SELECT करके फिर INSERT करने में दो workers के बीच race था)
         db.session.add(new_user)
-        db.session.commit()
+        try:
+            db.session.commit()
+        except IntegrityError:
+            db.session.rollback()
+            # कौन-सा value पहले से है, यह rollback के बाद पूछें - error text हर database में अलग है
+            # और NOT NULL जैसी दूसरी failures में भी column का नाम होता है
+            if User.query.filter_by(username=username).first() is not None:
+                flash('यह यूज़रनेम पहले से लिया जा चुका है। कृपया दूसरा यूज़रनेम चुनें।', 'danger')
+            elif User.query.filter_by(email=email).first() is not None:
+                flash('यह ईमेल पहले से पंजीकृत है। कृपया लॉगिन करें या दूसरा ईमेल उपयोग करें।', 'danger')
+            else:
+                flash('पंजीकरण नहीं हो सका। कृपया दोबारा कोशिश करें।', 'danger')
+            return redirect(url_for('signup'))
 
         flash('पंजीकरण सफल रहा! अब आप लॉगिन कर सकते हैं।', 'success')
         return redirect(url_for('login'))
@@ -236,6 +929,10 @@ def login():
         user = User.query.filter_by(email=email).first()
 
         if user and user.check_password(password):
+            # PASSWORD_HASH_METHOD बदला हो तो password अभी हमारे पास है - नए method से दोबारा hash करें
+            if user.password_needs_rehash():
+                user.set_password(password)
+                db.session.commit()
             login_user(user, remember=True)
             flash(f'आप सफलतापूर्वक लॉगिन हो गए हैं! {user.username} जी, आपका स्वागत है।', 'success')
             next_page = request.args.get('next')
@@ -249,6 +946,7 @@ def login():
 @main.route('/logout')
 @login_required
 def logout():
+    user_session_cache.invalidate(current_user.id)
     logout_user()
     flash('आप सफलतापूर्वक लॉगआउट हो गए हैं।', 'info')
     return redirect(url_for('index')) # 'home' को 'index' से बदला गया
@@ -260,19 +958,32 @@ def logout():
 @main.route("/", methods=['GET']) # सुनिश्चित करें कि यह केवल GET है
 @login_required
 def index():
-    return render_template("index.html")
+    return render_index()
 
 
 @main.route('/predict', methods=['POST']) # सुनिश्चित करें कि यह केवल POST है
 @login_required
 def home():
+    with predict_stage_seconds.time('total'):
+        return predict_page()
+
+
+# Jinja rendering का समय भी /predict के stages में गिना जाता है
+# Result वाला हिस्सा cached fragment है, और बाकी page cached shell में सिर्फ token/message भरना
+def render_predict_page(**context):
+    with predict_stage_seconds.time('render'):
+        return render_index(**context)
+
+
+def predict_page():
     # यह फंक्शन अब सिर्फ POST रिक्वेस्ट संभालेगा
-    symptoms = request.form.get('symptoms', '').strip()
+    with predict_stage_seconds.time('form_parse'):
+        symptoms = request.form.get('symptoms', '').strip()
 
     # 1. Empty input check
     if not symptoms:
-        message = "कृपया बीमारी का अनुमान लगाने के लिए कम से कम एक लक्षण चुनें।"
-        return render_template('index.html', message=message)
+        predictions_total.inc('no_symptoms')
+        return render_predict_page(message=prediction_error_message("No Symptoms Selected"))
 
     # 2. Convert input to list
     user_symptoms = [s.strip() for s in symptoms.split(',')]
@@ -280,57 +991,233 @@ def home():
     # 3. Clean up the list
     user_symptoms = [symptom for symptom in user_symptoms if symptom]
 
-    # 4. Prediction
-    predicted_disease = get_predicted_value(user_symptoms)
+    # 4. Prediction (cached - disease और helper() data एक साथ)
+    predicted_disease, recommendation, _ = get_prediction_result(user_symptoms)
 
     # 5. Check Prediction status
-    if predicted_disease in ["No Symptoms Selected", "Not enough valid symptoms selected for prediction.",
-                             "Model Not Loaded"]:
-        message = predicted_disease + " कृपया अधिक वैध लक्षण चुनें।"
-        if predicted_disease == "Model Not Loaded":
-            message = "AI मॉडल लोड नहीं हो सका। कृपया अपनी 'models' फ़ोल्डर की जाँच करें।"
-        return render_template('index.html', message=message)
-
-    # 6. Get additional information
-    dis_des, precautions_data, medications_list, rec_diet, workout = helper(predicted_disease)
-
-    my_precautions = []
-    # FIX for Attribute Error: Checking if item is a string before calling .strip()
-    # precautions_data is a list of lists: [['pre1', 'pre2', 'pre3', 'pre4']]
-    if len(precautions_data) > 0 and len(precautions_data[0]) > 0:
-        for i in precautions_data[0]:
-            # FIX: Check for string type before using .strip() to avoid 'float' object error
-            # यह FIX आपके Attribute Error को हल करता है
-            if isinstance(i, str) and i.strip():
-                my_precautions.append(i.strip())
-
-    return render_template('index.html', predicted_disease=predicted_disease, dis_des=dis_des,
-                           my_precautions=my_precautions, medications=medications_list, my_diet=rec_diet,
-                           workout=workout)
+    if recommendation is None:
+        return render_predict_page(message=prediction_error_message(predicted_disease))
+
+    # 6. Page: shell + इस बीमारी का cached result fragment
+    return render_predict_page(predicted_disease=predicted_disease, recommendation=recommendation)
+
+
+# Page पूरा reload करने की जगह यहीं से result लेता है (templates/index.html)
+@main.route('/api/v1/predict', methods=['POST'])
+def predict_json_api():
+    if verify_api_token(request.headers.get('Authorization')) is None:
+        return jsonify(error="Invalid or expired API token."), 401
+    body, status = api_predict(request.get_json(silent=True))
+    return jsonify(body), status
+
+
+# Browser session से, या {"email": ..., "password": ...} से token (scripts/mobile clients के लिए)
+@main.route('/api/v1/token', methods=['POST'])
+def api_token_endpoint():
+    if current_user.is_authenticated:
+        user_id = current_user.id
+    else:
+        payload = request.get_json(silent=True) or {}
+        # दोनों strings न हों तो query तक न पहुँचे (list email पर SQLAlchemy ProgrammingError -> 500)
+        if not isinstance(payload, dict) or not isinstance(payload.get('email'), str) or \
+                not isinstance(payload.get('password'), str):
+            return jsonify(error="Body must be {\"email\": ..., \"password\": ...}."), 400
+        user = User.query.filter_by(email=payload['email']).first()
+        if user is None or not user.check_password(payload['password']):
+            return jsonify(error="Invalid email or password."), 401
+        user_id = user.id
+    return jsonify(token=issue_api_token(user_id), expires_in=main.config['API_TOKEN_MAX_AGE'])
+
+
+@main.route('/predict/batch', methods=['POST'])
+@login_required
+def predict_batch_api():
+    # NDJSON: हर line एक patient - response भी NDJSON में stream होता है
+    if request.mimetype in ('application/x-ndjson', 'application/jsonl'):
+        return Response(stream_with_context(stream_predict_batch(request.stream)),
+                        mimetype='application/x-ndjson')
+
+    payload = request.get_json(silent=True)
+    rows = payload.get('patients') if isinstance(payload, dict) else payload
+    if not isinstance(rows, list):
+        return jsonify(error="Body must be a JSON list of patients or {\"patients\": [...]}."), 400
+    if len(rows) > BATCH_MAX_ROWS:
+        return jsonify(error=f"Too many rows ({len(rows)}). Send more than {BATCH_MAX_ROWS} rows as NDJSON."), 413
+
+    return jsonify(results=predict_batch(rows))
+
+
+@main.route('/predict/differential', methods=['POST'])
+@login_required
+def predict_differential_api():
+    # Body: {"symptoms": [...] या "a, b", "k": 5}
+    payload = request.get_json(silent=True) or {}
+    symptoms = _batch_row_symptoms(payload) if isinstance(payload, dict) else None
+    if symptoms is None:
+        return jsonify(error="Body must be {\"symptoms\": [...]}."), 400
+    try:
+        k = int(payload.get('k', 5))
+    except (TypeError, ValueError):
+        return jsonify(error="k must be an integer."), 400
+
+    candidates, error = get_differential(symptoms, k=k)
+    if error:
+        return jsonify(error=error), 422
+    return jsonify(differential=candidates)
+
+
+@main.route('/symptoms/parse', methods=['POST'])
+@login_required
+def parse_symptoms_api():
+    # Body: {"text": "मुझे बुखार है और सर दर्द"} -> {"symptoms": [...], "names": [...], "unknown": [...]}
+    payload = request.get_json(silent=True) or {}
+    text = payload.get('text') if isinstance(payload, dict) else None
+    if not isinstance(text, str):
+        return jsonify(error="Body must be {\"text\": \"...\"}."), 400
+    model = model_registry.current
+    symptoms, unknown = model.symptom_parser.parse(text)
+    names = [model.symptom_phrases.get(key, {}).get('hi', key.replace('_', ' ')) for key in symptoms]
+    return jsonify(symptoms=symptoms, names=names, unknown=unknown)
+
+
+# Autocomplete: हर keystroke पर आता है, इसलिए login/session नहीं - सिर्फ public symptom names लौटते हैं
+@main.route('/symptoms/suggest')
+def suggest_symptoms_api():
+    limit = min(max(request.args.get('limit', 10, type=int), 1), MAX_SUGGESTIONS)
+    response = Response(model_registry.current.symptom_suggest.suggest_json(request.args.get('q', ''), limit),
+                        mimetype='application/json')
+    response.add_etag()
+    response.cache_control.public = True
+    response.cache_control.max_age = main.config['SYMPTOM_SUGGEST_MAX_AGE']
+    return response.make_conditional(request)
+
+
+# चुने गए symptoms के बाद अगला कौन-सा पूछें: candidate बीमारियों को सबसे बराबर बाँटने वाले symptoms
+# Output सिर्फ datasets पर निर्भर (कोई user data नहीं), इसलिए suggest की तरह public और cacheable
+@main.route('/symptoms/related')
+def related_symptoms_api():
+    # ?symptoms=itching,skin_rash&k=5 -> {"symptoms", "unknown", "candidates", "related": [...]}
+    model = model_registry.current
+    cooccurrence = model.symptom_cooccurrence
+    if cooccurrence is None:
+        return jsonify(error="Co-occurrence index is not built."), 503
+    k = min(max(request.args.get('k', 5, type=int), 1), MAX_SUGGESTIONS)
+    indices, unknown = encode_symptoms(request.args.get('symptoms', '').split(','), model)
+    candidates, related = cooccurrence.related(indices, k)
+    for item in related:
+        label = item['symptom'].replace('_', ' ')
+        item.update(label=label, hi=model.symptom_phrases.get(item['symptom'], {}).get('hi', label))
+    response = jsonify(symptoms=[cooccurrence.symptoms[index] for index in sorted(set(indices))],
+                       unknown=unknown, candidates=candidates, related=related)
+    response.add_etag()
+    response.cache_control.public = True
+    response.cache_control.max_age = main.config['SYMPTOM_SUGGEST_MAX_AGE']
+    return response.make_conditional(request)
+
+
+# ============================================================
+# Static assets (fingerprinted, precompressed - static_assets.py)
+# ============================================================
+
+asset_manifest = AssetManifest.load(DIST_PATH)
+# dist_asset route का prefix; URLs हर render पर url_for() से नहीं बनते (एक page पर 20+ होते हैं)
+DIST_URL_PREFIX = '/dist/'
+
+
+# Templates: {{ asset_url('src/index.css') }}; build न हुआ हो तो /static/<name>
+@main.template_global()
+def asset_url(name):
+    hashed = asset_manifest.files.get(name)
+    if hashed is None:
+        return url_for('static', filename=name)
+    return request.script_root + DIST_URL_PREFIX + hashed
+
+
+# Templates: {{ picture('img.png', alt, css_class, sizes) }} - responsive <picture>, build न हुआ हो तो सादा <img>
+@main.template_global()
+def picture(name, alt='', css_class='', sizes=''):
+    return _picture(name, alt, css_class, sizes, request.script_root)
+
+
+# एक page पर हर बार वही कुछ images - बनी हुई markup cached
+@lru_cache(maxsize=256)
+def _picture(name, alt, css_class, sizes, script_root):
+    image = asset_manifest.images.get(name)
+    if image is None:
+        return Markup('<img src="{}" alt="{}" class="{}">').format(url_for('static', filename=name), alt, css_class)
+    return picture_html(image, script_root + DIST_URL_PREFIX, alt, css_class, sizes)
+
+
+@main.route(DIST_URL_PREFIX + '<path:filename>')
+def dist_asset(filename):
+    path, encoding = asset_manifest.resolve(filename, request.accept_encodings)
+    response = send_from_directory(DIST_PATH, path, mimetype=mimetypes.guess_type(filename)[0],
+                                   max_age=main.config['ASSET_MAX_AGE'])
+    if asset_manifest.encodings.get(filename):
+        response.vary.add('Accept-Encoding')
+    if encoding is not None:
+        response.content_encoding = encoding
+    response.cache_control.public = True
+    response.cache_control.immutable = True
+    return response
+
+
+# Prometheus scrape endpoint - सभी gunicorn workers का जोड़
+@main.route('/metrics')
+def metrics_endpoint():
+    return Response(request_metrics.render(), mimetype='text/plain; version=0.0.4')
+
+
+# On-demand sampling profiler: PROFILE_REQUESTS=1 होने पर ही, और सिर्फ माँगे गए requests पर
+@main.before_request
+def start_request_profiler():
+    if main.config['PROFILE_REQUESTS'] and '1' in (request.args.get('profile'), request.headers.get('X-Profile')):
+        g.profiler = SamplingProfiler(interval=main.config['PROFILE_INTERVAL']).start()
+
+
+@main.after_request
+def stop_request_profiler(response):
+    profiler = g.pop('profiler', None)
+    if profiler is not None:
+        profiler.stop()
+        name = f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}-{request.endpoint}"
+        path = profiler.save(main.config['PROFILE_DIR'], name)
+        response.headers['X-Profile-File'] = os.path.basename(path)
+        main.logger.info("Profiled %s %s: %d samples in %.1f ms -> %s", request.method, request.path,
+                         sum(profiler.samples.values()), profiler.elapsed * 1000, path)
+    return response
+
+
+@main.teardown_request
+def discard_request_profiler(exc):
+    # Exception पर after_request नहीं चलता - sampling thread फिर भी बंद हो
+    profiler = g.pop('profiler', None)
+    if profiler is not None:
+        profiler.stop()
 
 
 # about view funtion and path
 @main.route('/about')
 def about():
-    return render_template("about.html")
+    return static_page('about.html')
 
 
 # contact view funtion and path
 @main.route('/contact')
 def contact():
-    return render_template("contact.html")
+    return static_page('contact.html')
 
 
 # developer view funtion and path
 @main.route('/developer')
 def developer():
-    return render_template("developer.html")
+    return static_page('developer.html')
 
 
 # about view funtion and path
 @main.route('/blog')
 def blog():
-    return render_template("blog.html")
+    return static_page('blog.html')
 
 
 if __name__ == '__main__':
@@ -338,6 +1225,9 @@ if __name__ == '__main__':
     with main.app_context():
         db.create_all()
 
+    # kill -USR2 <pid>: model/datasets तुरंत दोबारा load करें
+    model_registry.install_signal_handler()
+
     # main.run() को ब्लॉक के बाहर होना चाहिए!
     main.run(debug=True)
 
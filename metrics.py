@@ -0,0 +1,211 @@
+# ============================================================
+# Request Metrics (per-worker histograms/counters, Prometheus text format)
+# ============================================================
+#
+# हर metric का layout पहले से तय है (stages, buckets, label values), इसलिए सारे values
+# float64 slots के एक flat array में रहते हैं। Observe = एक bisect + दो additions,
+# कोई allocation नहीं।
+#
+# METRICS_DIR set हो (gunicorn.conf.py यही करता है) तो हर worker process का array
+# <METRICS_DIR>/<pid>.metrics में mmap होता है। /metrics किसी भी worker पर आए, वह
+# directory की सारी files जोड़कर सभी workers का total लौटाता है। बंद हो चुके workers
+# की files भी जुड़ती रहती हैं, ताकि counters कभी पीछे न जाएँ।
+
+import bisect
+import glob
+import mmap
+import os
+import threading
+import time
+import zlib
+
+import numpy as np
+
+# Seconds; /predict के stages microseconds से milliseconds तक के होते हैं
+DEFAULT_BUCKETS = (5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3, 2.5e-3, 5e-3, 1e-2, 2.5e-2, 5e-2,
+                   0.1, 0.25, 0.5, 1.0)
+
+_FILE_SUFFIX = '.metrics'
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_value(value):
+    return repr(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Counter:
+    def __init__(self, registry, name, documentation, label=None, label_values=()):
+        self.registry = registry
+        self.name = name
+        self.documentation = documentation
+        self.label = label
+        self.label_values = tuple(label_values) if label else (None,)
+        self.offset = registry._allocate(len(self.label_values))
+        self._index = {value: self.offset + i for i, value in enumerate(self.label_values)}
+
+    def inc(self, label_value=None, amount=1):
+        slot = self._index.get(label_value)
+        if slot is None:
+            return
+        registry = self.registry
+        with registry._lock:
+            values = registry._values or registry._open()
+            values[slot] += amount
+
+    def render(self, values):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        for value, slot in self._index.items():
+            labels = f'{{{self.label}="{_escape(value)}"}}' if self.label else ''
+            lines.append(f"{self.name}{labels} {_format_value(values[slot])}")
+        return lines
+
+
+class Histogram:
+    def __init__(self, registry, name, documentation, label, label_values, buckets=DEFAULT_BUCKETS):
+        self.registry = registry
+        self.name = name
+        self.documentation = documentation
+        self.label = label
+        self.label_values = tuple(label_values)
+        self.buckets = tuple(buckets)
+        # हर label value: len(buckets) + 1 (+Inf) bucket counts, फिर sum
+        self._width = len(self.buckets) + 2
+        self.offset = registry._allocate(self._width * len(self.label_values))
+        self._index = {value: self.offset + i * self._width for i, value in enumerate(self.label_values)}
+
+    def observe(self, label_value, seconds):
+        base = self._index[label_value]
+        registry = self.registry
+        with registry._lock:
+            values = registry._values or registry._open()
+            values[base + bisect.bisect_left(self.buckets, seconds)] += 1
+            values[base + self._width - 1] += seconds
+
+    def time(self, label_value):
+        return _Timer(self, label_value)
+
+    def render(self, values):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        for value, base in self._index.items():
+            label = f'{self.label}="{_escape(value)}"'
+            cumulative = 0.0
+            for i, bound in enumerate(self.buckets + (float('inf'),)):
+                cumulative += values[base + i]
+                le = '+Inf' if bound == float('inf') else repr(bound)
+                lines.append(f'{self.name}_bucket{{{label},le="{le}"}} {_format_value(cumulative)}')
+            lines.append(f"{self.name}_sum{{{label}}} {repr(float(values[base + self._width - 1]))}")
+            lines.append(f"{self.name}_count{{{label}}} {_format_value(cumulative)}")
+        return lines
+
+
+class _Timer:
+    __slots__ = ('histogram', 'label_value', 'start')
+
+    def __init__(self, histogram, label_value):
+        self.histogram = histogram
+        self.label_value = label_value
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.histogram.observe(self.label_value, time.perf_counter() - self.start)
+
+
+class MetricsRegistry:
+    def __init__(self, directory=None):
+        self.directory = directory
+        self._metrics = []
+        self._size = 1  # slot 0: layout id - दूसरे layout वाली (पुरानी) files जोड़ी नहीं जातीं
+        self._values = None
+        self._lock = threading.Lock()
+        os.register_at_fork(after_in_child=self._after_fork)
+
+    def counter(self, *args, **kwargs):
+        return self._register(Counter(self, *args, **kwargs))
+
+    def histogram(self, *args, **kwargs):
+        return self._register(Histogram(self, *args, **kwargs))
+
+    def _register(self, metric):
+        if self._values is not None:
+            raise RuntimeError("Metrics must be registered before the first observation.")
+        self._metrics.append(metric)
+        return metric
+
+    def _allocate(self, slots):
+        offset = self._size
+        self._size += slots
+        return offset
+
+    @property
+    def layout_id(self):
+        # Metric names + label values + buckets का checksum (float64 में exact)
+        layout = repr([(m.name, m.label_values, getattr(m, 'buckets', None)) for m in self._metrics])
+        return float(zlib.crc32(layout.encode()))
+
+    # --------------------------------------------------------
+    # Per-process storage
+    # --------------------------------------------------------
+
+    def _after_fork(self):
+        # Parent का array (या mmap) child में नहीं - पहले observe पर child अपनी file खोलेगा
+        self._values = None
+        self._lock = threading.Lock()
+
+    def _open(self):
+        nbytes = self._size * 8
+        if self.directory is None:
+            values = memoryview(bytearray(nbytes)).cast('d')
+        else:
+            os.makedirs(self.directory, exist_ok=True)
+            path = os.path.join(self.directory, f"{os.getpid()}{_FILE_SUFFIX}")
+            with open(path, 'wb') as f:
+                f.write(b'\0' * nbytes)
+            with open(path, 'r+b') as f:
+                values = memoryview(mmap.mmap(f.fileno(), nbytes)).cast('d')
+        values[0] = self.layout_id
+        self._values = values
+        return values
+
+    # --------------------------------------------------------
+    # Aggregation + exposition
+    # --------------------------------------------------------
+
+    def collect(self):
+        # सभी workers के values का जोड़ (METRICS_DIR न हो तो सिर्फ यह process)
+        if self.directory is None:
+            with self._lock:
+                values = self._values or self._open()
+                return np.array(values, dtype=np.float64)
+
+        total = np.zeros(self._size, dtype=np.float64)
+        layout_id = self.layout_id
+        for path in glob.glob(os.path.join(self.directory, f"*{_FILE_SUFFIX}")):
+            try:
+                values = np.fromfile(path, dtype=np.float64)
+            except OSError:
+                continue
+            if len(values) == self._size and values[0] == layout_id:
+                total += values
+        return total
+
+    def render(self):
+        values = self.collect()
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render(values))
+        return '\n'.join(lines) + '\n'
+
+
+def clear_directory(directory):
+    # नए server start पर पिछले run की files हटाएँ (gunicorn on_starting)
+    for path in glob.glob(os.path.join(directory, f"*{_FILE_SUFFIX}")):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -0,0 +1,162 @@
+# ============================================================
+# Model Registry (hot reload without restarting workers)
+# ============================================================
+#
+# Request path को जो कुछ चाहिए - scorer, recommendations, calibration, lookup table, और symptom
+# parser/autocomplete/related/triage indexes - वह एक immutable ModelVersion में रहता है, और
+# registry उसका सिर्फ एक reference रखती है।
+# Request शुरू में registry.current एक बार पढ़ता है और आखिर तक उसी version पर चलता है।
+#
+# Background thread model/dataset files पर नज़र रखता है (या admin signal पर जागता है),
+# नया version load + validate करता है, और फिर सिर्फ reference बदलता है - एक attribute
+# assignment, जिसके लिए readers को कभी lock नहीं लेना पड़ता। Load या validation fail हो
+# तो पुराना version चलता रहता है।
+
+import logging
+import os
+import signal
+import threading
+from typing import NamedTuple
+
+logger = logging.getLogger(__name__)
+
+
+class ModelVersion(NamedTuple):
+    version: str
+    scorer: object
+    recommendations: object
+    calibration: object
+    lookup: object
+    symptom_phrases: object
+    symptom_parser: object
+    symptom_suggest: object
+    symptom_cooccurrence: object
+    triage_scorer: object
+    loaded_at: float
+
+
+def source_fingerprint(paths):
+    # हर watched file (या directory की हर file) का (path, mtime, size)
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(os.path.join(path, name) for name in sorted(os.listdir(path)))
+        else:
+            files.append(path)
+
+    fingerprint = []
+    for path in files:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            fingerprint.append((path, None, None))
+            continue
+        fingerprint.append((path, stat.st_mtime_ns, stat.st_size))
+    return tuple(fingerprint)
+
+
+class ModelRegistry:
+    def __init__(self, loader, validate=None, watch_paths=(), check_interval=2.0):
+        # loader() -> ModelVersion; validate(version) गलत version पर ValueError उठाता है
+        self._loader = loader
+        self._validate = validate
+        self.watch_paths = tuple(watch_paths)
+        self.check_interval = check_interval
+        self.reloads = 0
+        self.failures = 0
+        self._swap_callbacks = []
+        self._reload_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._watcher = None
+        self._fingerprint = source_fingerprint(self.watch_paths)
+        # पहला version synchronously - startup पर model न मिले तो भी app उठे ("Model Not Loaded")
+        self._current = loader()
+        # Fork के बाद (gunicorn workers) हर process अपना watcher thread चलाता है
+        os.register_at_fork(after_in_child=self._after_fork)
+
+    @property
+    def current(self):
+        if self._watcher is None and self.check_interval > 0:
+            self._start_watcher()
+        return self._current
+
+    def on_swap(self, callback):
+        # callback(old, new) - swap के बाद background thread में चलता है
+        self._swap_callbacks.append(callback)
+        return callback
+
+    def reload(self):
+        # नया version load + validate करें और swap करें; swap हुआ तो True
+        with self._reload_lock:
+            old = self._current
+            try:
+                new = self._loader()
+                if self._validate is not None:
+                    self._validate(new)
+            except Exception as e:
+                self.failures += 1
+                logger.error("Model reload failed, keeping version %s: %s", old.version, e)
+                return False
+            if new.version == old.version:
+                return False
+
+            self._current = new
+            self.reloads += 1
+            logger.warning("Model version %s -> %s", old.version, new.version)
+            for callback in self._swap_callbacks:
+                try:
+                    callback(old, new)
+                except Exception:
+                    logger.exception("Model swap callback failed")
+            return True
+
+    def request_reload(self):
+        # Signal handler से भी safe: सिर्फ watcher thread को जगाता है
+        self._wake.set()
+
+    def install_signal_handler(self, signum=signal.SIGUSR2):
+        # Main thread से बुलाएँ (gunicorn: post_worker_init)
+        signal.signal(signum, lambda signum, frame: self.request_reload())
+        if self._watcher is None:
+            self._start_watcher()
+
+    def stats(self):
+        current = self._current
+        return {'version': current.version, 'loaded_at': current.loaded_at, 'reloads': self.reloads,
+                'failures': self.failures}
+
+    def _after_fork(self):
+        self._watcher = None
+        self._reload_lock = threading.Lock()
+        self._wake = threading.Event()
+
+    def _start_watcher(self):
+        with self._reload_lock:
+            if self._watcher is not None:
+                return
+            self._watcher = threading.Thread(target=self._watch, name='model-registry', daemon=True)
+            self._watcher.start()
+
+    def _watch(self):
+        interval = self.check_interval if self.check_interval > 0 else None
+        pending = None
+        while True:
+            requested = self._wake.wait(interval)
+            self._wake.clear()
+            if requested:
+                pending = None
+                self._fingerprint = source_fingerprint(self.watch_paths)
+                self.reload()
+                continue
+
+            fingerprint = source_fingerprint(self.watch_paths)
+            if fingerprint == self._fingerprint:
+                pending = None
+            elif fingerprint != pending:
+                # Files अभी लिखी जा रही हो सकती हैं (train_model कई artifacts एक-एक कर लिखता है) -
+                # एक interval तक कुछ न बदले, तब reload
+                pending = fingerprint
+            else:
+                pending = None
+                self._fingerprint = fingerprint
+                self.reload()
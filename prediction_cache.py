@@ -0,0 +1,60 @@
+# ============================================================
+# Prediction Result Cache
+# ============================================================
+#
+# /predict के पूरे results (disease + helper data) का LRU cache, key = (model version,
+# symptom set का canonical bitmask)। Model registry नया version swap करते ही cache
+# साफ़ कर देती है; key में version होने से swap के दौरान चल रहे requests भी पुराने
+# version का जवाब नए version के नाम से cache नहीं कर पाते।
+
+import threading
+from collections import OrderedDict
+
+
+# symptoms_dict indices -> canonical int bitmask (क्रम और duplicates से फ़र्क नहीं पड़ता)
+def symptom_bitmask(indices):
+    mask = 0
+    for index in indices:
+        mask |= 1 << index
+    return mask
+
+
+class PredictionCache:
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        if self.maxsize <= 0:
+            return None
+        with self._lock:
+            value = self._data.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.invalidations += 1
+
+    def stats(self):
+        with self._lock:
+            return {'size': len(self._data), 'maxsize': self.maxsize, 'hits': self.hits,
+                    'misses': self.misses, 'invalidations': self.invalidations}
@@ -0,0 +1,44 @@
+# ============================================================
+# Process Memory (Linux /proc/<pid>/smaps_rollup)
+# ============================================================
+#
+# RSS अकेले shared pages को हर worker में दोबारा गिनता है। PSS shared pages को
+# उन्हें share करने वाले processes में बाँटकर गिनता है, और Private वह memory है जो
+# सिर्फ उसी process की है - preload+fork से यही घटनी चाहिए।
+
+_FIELDS = {
+    'Rss': 'rss_kb',
+    'Pss': 'pss_kb',
+    'Shared_Clean': 'shared_kb',
+    'Shared_Dirty': 'shared_kb',
+    'Private_Clean': 'private_kb',
+    'Private_Dirty': 'private_kb',
+}
+
+
+def memory_usage(pid='self'):
+    usage = {'rss_kb': 0, 'pss_kb': 0, 'shared_kb': 0, 'private_kb': 0}
+    try:
+        with open(f'/proc/{pid}/smaps_rollup', encoding='ascii') as f:
+            for line in f:
+                name, _, rest = line.partition(':')
+                if name in _FIELDS:
+                    usage[_FIELDS[name]] += int(rest.split()[0])
+    except OSError:
+        return None
+    return usage
+
+
+def format_usage(usage):
+    if usage is None:
+        return "memory usage unavailable"
+    return ("RSS {rss_kb:,} KB, PSS {pss_kb:,} KB, shared {shared_kb:,} KB, "
+            "private {private_kb:,} KB").format(**usage)
+
+
+def child_pids(pid):
+    try:
+        with open(f'/proc/{pid}/task/{pid}/children', encoding='ascii') as f:
+            return [int(child) for child in f.read().split()]
+    except OSError:
+        return []
@@ -0,0 +1,64 @@
+# ============================================================
+# Sampling Profiler (एक request के लिए, on demand)
+# ============================================================
+#
+# cProfile हर function call पर hook लगाता है और request को कई गुना धीमा कर देता है।
+# यह profiler एक अलग thread से हर interval पर request वाले thread का stack पढ़ता है
+# (sys._current_frames), इसलिए request का code बिना बदलाव के चलता है।
+#
+# Output "collapsed stacks" format में: हर line "root;caller;...;leaf <samples>",
+# जिसे flamegraph.pl या speedscope सीधे पढ़ लेते हैं।
+
+import os
+import sys
+import threading
+import time
+from collections import Counter
+
+
+def _frame_label(frame):
+    code = frame.f_code
+    return f"{os.path.basename(code.co_filename)}:{code.co_name}:{frame.f_lineno}"
+
+
+class SamplingProfiler:
+    def __init__(self, thread_id=None, interval=0.001):
+        self.thread_id = threading.get_ident() if thread_id is None else thread_id
+        self.interval = interval
+        self.samples = Counter()
+        self.started_at = None
+        self.elapsed = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self.started_at = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name='sampling-profiler', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        self.elapsed = time.perf_counter() - self.started_at
+        return self
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                stack.append(_frame_label(frame))
+                frame = frame.f_back
+            if stack:
+                self.samples[';'.join(reversed(stack))] += 1
+
+    def collapsed(self):
+        return ''.join(f"{stack} {count}\n" for stack, count in self.samples.most_common())
+
+    def save(self, directory, name):
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"{name}.collapsed")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(self.collapsed())
+        return path
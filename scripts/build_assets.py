@@ -0,0 +1,205 @@
+# Static assets को serving के लिए तैयार करें: छोटी images, hashed नाम, precompressed CSS/JS
+#
+# Input:  static/ की images (team photos, logo, favicon) और static/src/ की CSS/JS
+# Output: static/dist/ - हर file का नाम उसके content hash से (img-160.1a2b3c4d.webp),
+#         CSS/JS के साथ .br और .gz, और manifest.json (source name -> hashed files)
+#
+# Photos pages पर 50-150 CSS px में दिखती हैं, इसलिए हर image के 160 और 320 px चौड़े
+# variants (2x screens के लिए 320) WebP और JPEG (transparency हो तो PNG) में बनते हैं।
+# Templates इन्हें picture() template global से <picture> + srcset में डालते हैं।
+#
+# चलाएँ (repo root से):
+#   python -m scripts.build_assets           # static/ या static/src/ बदलने के बाद
+#   python -m scripts.build_assets --check   # static/dist/ अपने sources से मेल खाता है या नहीं
+import argparse
+import gzip
+import hashlib
+import io
+import json
+import os
+import re
+import shutil
+import sys
+
+import brotli
+from PIL import Image, ImageOps
+
+from static_assets import MANIFEST_NAME
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STATIC_PATH = os.path.join(BASE_DIR, 'static')
+DIST_PATH = os.path.join(STATIC_PATH, 'dist')
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg')
+TEXT_EXTENSIONS = ('.css', '.js')
+# Manifest में दर्ज; इनमें से कुछ बदले तो --check stale बताता है
+PARAMS = {'widths': [160, 320], 'webp_quality': 80, 'jpeg_quality': 82, 'brotli_quality': 11, 'gzip_level': 9}
+
+
+def source_files():
+    # static/ के सापेक्ष नाम: images सीधे static/ में, CSS/JS static/src/ में
+    names = sorted(name for name in os.listdir(STATIC_PATH) if name.lower().endswith(IMAGE_EXTENSIONS))
+    src = os.path.join(STATIC_PATH, 'src')
+    names += sorted(f"src/{name}" for name in os.listdir(src) if name.endswith(TEXT_EXTENSIONS))
+    return names
+
+
+def source_hashes(names):
+    hashes = {}
+    for name in names:
+        with open(os.path.join(STATIC_PATH, name), 'rb') as f:
+            hashes[name] = hashlib.sha256(f.read()).hexdigest()
+    return hashes
+
+
+def hashed_name(stem, data, extension):
+    stem = re.sub(r'[^A-Za-z0-9_-]+', '-', stem).strip('-').lower()
+    return f"{stem}.{hashlib.sha256(data).hexdigest()[:8]}{extension}"
+
+
+def _has_transparency(image):
+    if image.mode in ('RGBA', 'LA'):
+        # पूरी तरह opaque alpha channel (PNG export में आम) - transparency नहीं
+        return image.getchannel('A').getextrema()[0] < 255
+    return image.mode == 'P' and 'transparency' in image.info
+
+
+def _encode(image, image_format):
+    buffer = io.BytesIO()
+    if image_format == 'WEBP':
+        image.save(buffer, 'WEBP', quality=PARAMS['webp_quality'], method=6)
+    elif image_format == 'JPEG':
+        image.convert('RGB').save(buffer, 'JPEG', quality=PARAMS['jpeg_quality'], optimize=True, progressive=True)
+    else:
+        image.save(buffer, 'PNG', optimize=True)
+    return buffer.getvalue()
+
+
+def build_image(name, outputs):
+    # outputs: hashed name -> bytes; manifest की image entry लौटाता है
+    stem = os.path.splitext(name)[0]
+    with Image.open(os.path.join(STATIC_PATH, name)) as original:
+        image = ImageOps.exif_transpose(original)
+        image.load()
+
+    transparent = _has_transparency(image)
+    image = image.convert('RGBA' if transparent else 'RGB')
+    fallback_format, fallback_extension = ('PNG', '.png') if transparent else ('JPEG', '.jpg')
+
+    # Original से बड़ा variant नहीं; बहुत छोटी images (favicon) सिर्फ एक बार
+    widths = sorted({min(width, image.width) for width in PARAMS['widths']})
+    entry = {'width': image.width, 'height': image.height, 'srcset': [], 'webp': []}
+    for width in widths:
+        height = max(1, round(image.height * width / image.width))
+        variant = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+        for key, image_format, extension in (('srcset', fallback_format, fallback_extension),
+                                             ('webp', 'WEBP', '.webp')):
+            data = _encode(variant, image_format)
+            filename = hashed_name(f"{stem}-{width}", data, extension)
+            outputs[filename] = data
+            entry[key].append([width, filename])
+    entry['src'] = entry['srcset'][-1][1]
+    return entry
+
+
+def build_favicon(name, outputs):
+    # Favicon जैसा है वैसा, सिर्फ hashed नाम से
+    with open(os.path.join(STATIC_PATH, name), 'rb') as f:
+        data = f.read()
+    stem, extension = os.path.splitext(name)
+    filename = hashed_name(stem, data, extension)
+    outputs[filename] = data
+    return filename
+
+
+def build_text(name, outputs, encodings):
+    with open(os.path.join(STATIC_PATH, name), 'rb') as f:
+        data = f.read()
+    stem, extension = os.path.splitext(os.path.basename(name))
+    filename = hashed_name(stem, data, extension)
+    outputs[filename] = data
+
+    # mtime=0: वही input, वही .gz bytes
+    compressed = {'br': brotli.compress(data, quality=PARAMS['brotli_quality']),
+                  'gzip': gzip.compress(data, compresslevel=PARAMS['gzip_level'], mtime=0)}
+    encodings[filename] = []
+    for encoding, suffix in (('br', '.br'), ('gzip', '.gz')):
+        if len(compressed[encoding]) < len(data):
+            outputs[filename + suffix] = compressed[encoding]
+            encodings[filename].append(encoding)
+    return filename
+
+
+def build_manifest(names):
+    outputs = {}
+    manifest = {'sources': source_hashes(names), 'params': PARAMS, 'files': {}, 'images': {}, 'encodings': {}}
+    for name in names:
+        if name.startswith('src/'):
+            manifest['files'][name] = build_text(name, outputs, manifest['encodings'])
+        elif name.startswith('favicon'):
+            manifest['files'][name] = build_favicon(name, outputs)
+        else:
+            entry = build_image(name, outputs)
+            manifest['images'][name] = entry
+            manifest['files'][name] = entry['src']
+    return manifest, outputs
+
+
+def stale_sources(manifest, names):
+    # बदली, जुड़ी या हटाई गई source files (और build params) के नाम
+    if manifest is None:
+        return ['manifest']
+    current = source_hashes(names)
+    recorded = manifest.get('sources', {})
+    stale = sorted(name for name in set(current) | set(recorded) if current.get(name) != recorded.get(name))
+    if manifest.get('params') != PARAMS:
+        stale.append('build params')
+    missing = [f for f in manifest.get('files', {}).values() if not os.path.exists(os.path.join(DIST_PATH, f))]
+    return stale + [f"{f} (missing)" for f in missing]
+
+
+def read_manifest(directory):
+    try:
+        with open(os.path.join(directory, MANIFEST_NAME), encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def write_dist(directory, manifest, outputs):
+    # पुरानी hashed files हटाएँ - dist में सिर्फ इस build की files रहें
+    shutil.rmtree(directory, ignore_errors=True)
+    os.makedirs(directory)
+    for filename, data in outputs.items():
+        with open(os.path.join(directory, filename), 'wb') as f:
+            f.write(data)
+    # Manifest आखिर में: बीच में रुक जाए तो app को अधूरा build नहीं दिखता
+    with open(os.path.join(directory, MANIFEST_NAME), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+        f.write('\n')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Resize, fingerprint and precompress static assets.")
+    parser.add_argument('--check', action='store_true', help="only check that static/dist/ is up to date")
+    args = parser.parse_args(argv)
+
+    names = source_files()
+    if args.check:
+        stale = stale_sources(read_manifest(DIST_PATH), names)
+        if stale:
+            print(f"static/dist is stale: {', '.join(stale)} changed", file=sys.stderr)
+            return 1
+        print(f"OK: {DIST_PATH} is up to date")
+        return 0
+
+    manifest, outputs = build_manifest(names)
+    write_dist(DIST_PATH, manifest, outputs)
+    before = sum(os.path.getsize(os.path.join(STATIC_PATH, name)) for name in names)
+    after = sum(len(data) for filename, data in outputs.items() if not filename.endswith(('.br', '.gz')))
+    print(f"Wrote {len(outputs)} files to {DIST_PATH} ({before / 1024:.1f} KB of sources -> {after / 1024:.1f} KB)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,56 @@
+# "Related symptoms" के लिए co-occurrence index बनाएँ (GET /symptoms/related)
+#
+# Input:  datasets/Training.csv (one-hot, 'prognosis' column) और datasets/symtoms_df.csv
+#         (Disease + Symptom_1..4) - हर row एक record, ingest.py से validate/normalize होकर
+# Output: models/symptom_cooccurrence.npz - sparse 132 x 132 counts/lift, हर बीमारी का symptom
+#         bitset और दोनों CSVs के hashes (कोई बदले तो app index को stale मानकर नहीं चलाता)
+#
+# चलाएँ (repo root से):
+#   python -m scripts.build_cooccurrence           # datasets बदलने के बाद
+#   python -m scripts.build_cooccurrence --check   # index अपने sources से मेल खाता है या नहीं
+import argparse
+import os
+import sys
+
+import main as app_module
+from ingest import DatasetError, read_symptom_records
+from snapshot import source_hashes, stale_sources
+from symptom_cooccurrence import CooccurrenceIndex
+
+
+def build_index():
+    sources = app_module.cooccurrence_sources()
+    diseases = list(app_module.diseases_list.values())
+    records = read_symptom_records(sources['datasets/Training.csv'], sources['datasets/symtoms_df.csv'],
+                                   app_module.symptoms_dict, diseases)
+    return CooccurrenceIndex.build(records, list(app_module.symptoms_dict), diseases, source_hashes(sources))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the symptom co-occurrence index.")
+    parser.add_argument('--output', default=app_module.cooccurrence_path)
+    parser.add_argument('--check', action='store_true', help="only check that the index is up to date")
+    args = parser.parse_args(argv)
+
+    if args.check:
+        index = CooccurrenceIndex.load(args.output)
+        stale = stale_sources({'sources': index.sources}, app_module.cooccurrence_sources())
+        if stale:
+            print(f"Co-occurrence index is stale: {', '.join(stale)} changed", file=sys.stderr)
+            return 1
+        print(f"OK: {args.output} is up to date")
+        return 0
+
+    try:
+        index = build_index()
+    except DatasetError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    index.save(args.output)
+    print(f"Wrote {args.output} ({index.records} records, {len(index.counts)} symptom pairs, "
+          f"{os.path.getsize(args.output) / 1024:.1f} KB)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
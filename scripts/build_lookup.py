@@ -0,0 +1,94 @@
+# 1..N symptoms के सभी combinations का जवाब पहले से निकालकर lookup table बनाएँ
+#
+# Output: models/symptom_lookup.npy (sorted uint64 entries) + models/symptom_lookup.json (metadata)
+# Table models/svc_linear.npz के hash से बंधा होता है - model बदलने पर दोबारा बनाएँ।
+#
+# चलाएँ (repo root से):
+#   python -m scripts.build_lookup                 # 1-3 symptoms (~383k entries, ~3 MB)
+#   python -m scripts.build_lookup --max-size 4    # 1-4 symptoms (~12.6M entries, ~100 MB)
+import argparse
+import itertools
+import json
+import math
+import os
+import sys
+import time
+
+import numpy as np
+
+from snapshot import file_sha256
+from svc_scorer import LinearSVCScorer
+from symptom_lookup import LOOKUP_VERSION, MAX_PACKED_SYMPTOMS, pack_keys
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCORER_PATH = os.path.join(BASE_DIR, "models", "svc_linear.npz")
+TABLE_PATH = os.path.join(BASE_DIR, "models", "symptom_lookup.npy")
+META_PATH = os.path.join(BASE_DIR, "models", "symptom_lookup.json")
+
+
+def iter_combination_chunks(n_features, size, chunk_rows):
+    combos = itertools.combinations(range(n_features), size)
+    while True:
+        flat = np.fromiter(itertools.chain.from_iterable(itertools.islice(combos, chunk_rows)),
+                           dtype=np.intp)
+        if not len(flat):
+            return
+        yield flat.reshape(-1, size)
+
+
+def build_entries(scorer, max_size, chunk_rows):
+    n_features = scorer.n_features
+    total = sum(math.comb(n_features, size) for size in range(1, max_size + 1))
+    entries = np.empty(total, dtype=np.uint64)
+    filled = 0
+    started = time.perf_counter()
+
+    for size in range(1, max_size + 1):
+        for combos in iter_combination_chunks(n_features, size, chunk_rows):
+            X = np.zeros((len(combos), n_features), dtype=np.uint8)
+            X[np.arange(len(combos))[:, None], combos] = 1
+            classes = scorer.predict(X).astype(np.uint64)
+
+            entries[filled:filled + len(combos)] = (pack_keys(combos) << np.uint64(8)) | classes
+            filled += len(combos)
+            rate = filled / (time.perf_counter() - started)
+            print(f"\r  {filled}/{total} combinations ({rate:,.0f}/s)", end='', file=sys.stderr)
+    print(file=sys.stderr)
+
+    entries.sort()
+    return entries
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Precompute predictions for every small symptom set.")
+    parser.add_argument('--max-size', type=int, default=3, help="largest symptom set to precompute (default 3)")
+    parser.add_argument('--chunk-rows', type=int, default=8192, help="rows per vectorized model call")
+    parser.add_argument('--scorer', default=SCORER_PATH)
+    parser.add_argument('--output', default=TABLE_PATH)
+    parser.add_argument('--meta', default=META_PATH)
+    args = parser.parse_args(argv)
+
+    if not 1 <= args.max_size <= MAX_PACKED_SYMPTOMS:
+        parser.error(f"--max-size must be between 1 and {MAX_PACKED_SYMPTOMS}")
+
+    scorer = LinearSVCScorer.load(args.scorer)
+    if scorer.classes.max() > 0xFF:
+        print("Error: class ids do not fit in one byte.", file=sys.stderr)
+        return 1
+
+    entries = build_entries(scorer, args.max_size, args.chunk_rows)
+    np.save(args.output, entries)
+    meta = {
+        'version': LOOKUP_VERSION,
+        'max_size': args.max_size,
+        'entries': len(entries),
+        'scorer_sha256': file_sha256(args.scorer),
+    }
+    with open(args.meta, 'w', encoding='utf-8') as f:
+        json.dump(meta, f, indent=2)
+    print(f"Wrote {args.output} ({len(entries)} entries, {os.path.getsize(args.output) / 1e6:.1f} MB)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
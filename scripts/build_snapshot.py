@@ -0,0 +1,60 @@
+# Request path के लिए सब कुछ एक binary snapshot में compile करें
+#
+# Output: models/snapshot.bin - हर बीमारी का recommendation record + compiled scorer arrays।
+# Serving process सिर्फ यही file पढ़ता है, CSVs और pandas को नहीं छूता।
+# Datasets ingest.py से validate होते हैं - कोई गलती हो तो build fail (exit 1) और सारी गलतियाँ print।
+#
+# चलाएँ (repo root से):
+#   python -m scripts.build_snapshot           # CSVs/model बदलने के बाद दोबारा बनाएँ
+#   python -m scripts.build_snapshot --check   # snapshot अपने sources से मेल खाता है या नहीं
+import argparse
+import os
+import sys
+
+os.environ['USE_SNAPSHOT'] = '0'
+
+import main as app_module
+from ingest import DatasetError
+from snapshot import read_snapshot, source_hashes, stale_sources, write_snapshot
+from svc_scorer import LinearSVCScorer
+
+
+def build_payload():
+    sources = app_module.snapshot_sources()
+    recommendations = app_module.load_recommendation_index_from_csv()
+    scorer = LinearSVCScorer.load(app_module.scorer_path)
+    calibration = app_module.load_calibration()
+    return {
+        'sources': source_hashes(sources),
+        'recommendations': {dis: tuple(record) for dis, record in recommendations.items()},
+        'scorer': scorer.arrays(),
+        'calibration': calibration.arrays() if calibration is not None else None,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compile datasets and model into the serving snapshot.")
+    parser.add_argument('--output', default=app_module.SNAPSHOT_PATH)
+    parser.add_argument('--check', action='store_true', help="only check that the snapshot is up to date")
+    args = parser.parse_args(argv)
+
+    if args.check:
+        stale = stale_sources(read_snapshot(args.output), app_module.snapshot_sources())
+        if stale:
+            print(f"Snapshot is stale: {', '.join(stale)} changed", file=sys.stderr)
+            return 1
+        print(f"OK: {args.output} is up to date")
+        return 0
+
+    try:
+        payload = build_payload()
+    except DatasetError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    write_snapshot(args.output, payload)
+    print(f"Wrote {args.output} ({os.path.getsize(args.output) / 1024:.1f} KB)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
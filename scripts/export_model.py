@@ -0,0 +1,89 @@
+# models/svc.pkl -> models/svc_linear.npz (pure-NumPy scorer artifact)
+#
+# Export के बाद artifact को datasets/Training.csv की हर row पर svc.predict से
+# मिलाया जाता है - एक भी mismatch हो तो artifact नहीं लिखा जाता। Artifact में svc.pkl का
+# sha256 भी रहता है; बाद में svc.pkl बदले तो app warning देता है और --check fail होता है।
+#
+# चलाएँ (repo root से):
+#   python -m scripts.export_model           # export + equivalence check
+#   python -m scripts.export_model --check   # मौजूदा artifact सिर्फ verify करें
+import argparse
+import os
+import pickle
+import sys
+
+import numpy as np
+import pandas as pd
+
+from snapshot import file_sha256
+from svc_scorer import LinearSVCScorer
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODEL_PATH = os.path.join(BASE_DIR, "models", "svc.pkl")
+ARTIFACT_PATH = os.path.join(BASE_DIR, "models", "svc_linear.npz")
+TRAINING_PATH = os.path.join(BASE_DIR, "datasets", "Training.csv")
+
+
+def load_training_features():
+    df = pd.read_csv(TRAINING_PATH)
+    return df.drop(columns=['prognosis'])
+
+
+def check_equivalence(svc, scorer, features):
+    X = features.to_numpy(dtype=np.float64)
+    expected = svc.predict(features)
+
+    mismatches = np.flatnonzero(scorer.predict(X) != expected)
+    if len(mismatches):
+        return f"matrix predict differs on {len(mismatches)} rows, first row {mismatches[0]}"
+
+    for row, vector in enumerate(X):
+        got = scorer.predict_indices(np.flatnonzero(vector))
+        if got != expected[row]:
+            return f"sparse predict differs on row {row}: {got} != {expected[row]}"
+
+    if scorer.feature_names and list(scorer.feature_names) != list(features.columns):
+        return "feature names differ from Training.csv columns"
+    return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compile models/svc.pkl into a pure-NumPy scorer artifact.")
+    parser.add_argument('--model', default=MODEL_PATH)
+    parser.add_argument('--output', default=ARTIFACT_PATH)
+    parser.add_argument('--check', action='store_true', help="verify the existing artifact instead of exporting")
+    args = parser.parse_args(argv)
+
+    with open(args.model, 'rb') as f:
+        svc = pickle.load(f)
+    features = load_training_features()
+
+    model_sha256 = file_sha256(args.model)
+    if args.check:
+        scorer = LinearSVCScorer.load(args.output)
+        if scorer.model_sha256 != model_sha256:
+            print(f"Error: {args.output} was not exported from {args.model}; "
+                  f"re-export it with: python -m scripts.export_model", file=sys.stderr)
+            return 1
+    else:
+        scorer = LinearSVCScorer.from_svc(svc, model_sha256)
+    error = check_equivalence(svc, scorer, features)
+    if error:
+        print(f"Error: scorer does not match svc.predict: {error}", file=sys.stderr)
+        return 1
+
+    if not args.check:
+        scorer.save(args.output)
+        # लिखी गई file को दोबारा load करके भी जाँचें
+        error = check_equivalence(svc, LinearSVCScorer.load(args.output), features)
+        if error:
+            print(f"Error: saved artifact does not match svc.predict: {error}", file=sys.stderr)
+            return 1
+        print(f"Wrote {args.output} ({os.path.getsize(args.output) / 1024:.1f} KB)")
+
+    print(f"OK: scorer matches svc.predict on all {len(features)} rows of Training.csv")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
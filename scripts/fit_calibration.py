@@ -0,0 +1,91 @@
+# Class scores -> calibrated probabilities: Training.csv पर isotonic calibration fit करें
+#
+# Training.csv की हर row में सारे symptoms होते हैं और model उन पर लगभग हमेशा सही है,
+# जबकि users आमतौर पर 1-4 symptoms चुनते हैं। इसलिए हर unique row से random
+# partial symptom sets बनाकर उन पर calibration fit की जाती है।
+#
+# Output: models/calibration.npz (models/svc_linear.npz के hash से बंधा)
+#
+# चलाएँ (repo root से):
+#   python -m scripts.fit_calibration [--subsets-per-row 20] [--seed 0]
+import argparse
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+from sklearn.isotonic import IsotonicRegression
+
+from calibration import ScoreCalibration
+from main import diseases_list
+from snapshot import file_sha256
+from svc_scorer import LinearSVCScorer
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCORER_PATH = os.path.join(BASE_DIR, "models", "svc_linear.npz")
+TRAINING_PATH = os.path.join(BASE_DIR, "datasets", "Training.csv")
+OUTPUT_PATH = os.path.join(BASE_DIR, "models", "calibration.npz")
+
+
+def partial_symptom_sets(X, labels, subsets_per_row, rng):
+    rows = []
+    row_labels = []
+    for vector, label in zip(X, labels):
+        active = np.flatnonzero(vector)
+        rows.append(vector)
+        row_labels.append(label)
+        for _ in range(subsets_per_row):
+            size = rng.integers(1, len(active) + 1)
+            subset = np.zeros_like(vector)
+            subset[rng.choice(active, size=size, replace=False)] = 1
+            rows.append(subset)
+            row_labels.append(label)
+    return np.array(rows), np.array(row_labels)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fit the score -> probability calibration table.")
+    parser.add_argument('--subsets-per-row', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--scorer', default=SCORER_PATH)
+    parser.add_argument('--output', default=OUTPUT_PATH)
+    args = parser.parse_args(argv)
+
+    scorer = LinearSVCScorer.load(args.scorer)
+    df = pd.read_csv(TRAINING_PATH).drop_duplicates()
+    X = df.drop(columns=['prognosis']).to_numpy(dtype=np.uint8)
+    labels = df['prognosis'].to_numpy()
+
+    # prognosis नाम -> diseases_list id -> scorer class column
+    name_to_class = {name: cls for cls, name in diseases_list.items()}
+    class_column = {cls: i for i, cls in enumerate(scorer.classes)}
+    targets = np.array([class_column[name_to_class[name]] for name in labels])
+
+    rng = np.random.default_rng(args.seed)
+    samples, sample_targets = partial_symptom_sets(X, targets, args.subsets_per_row, rng)
+    scores = scorer.class_scores(scorer.decision_matrix(samples))
+    is_true = np.zeros_like(scores)
+    is_true[np.arange(len(samples)), sample_targets] = 1
+
+    iso = IsotonicRegression(y_min=0.0, y_max=1.0, out_of_bounds='clip')
+    iso.fit(scores.ravel(), is_true.ravel())
+    calibration = ScoreCalibration(iso.X_thresholds_, iso.y_thresholds_, file_sha256(args.scorer))
+    calibration.save(args.output)
+
+    # Top-1 reliability: predicted probability बनाम असल accuracy
+    top = scores.argmax(axis=1)
+    top_prob = calibration(scores[np.arange(len(scores)), top])
+    correct = top == sample_targets
+    print(f"Fitted on {len(samples)} partial symptom sets from {len(X)} unique Training.csv rows")
+    print(f"top-1 accuracy {correct.mean():.3f}, mean top-1 probability {top_prob.mean():.3f}")
+    for low, high in ((0, .25), (.25, .5), (.5, .75), (.75, 1.01)):
+        in_bin = (top_prob >= low) & (top_prob < high)
+        if in_bin.any():
+            print(f"  p in [{low:.2f}, {min(high, 1):.2f}): n={in_bin.sum():6d}  "
+                  f"mean p={top_prob[in_bin].mean():.3f}  accuracy={correct[in_bin].mean():.3f}")
+    print(f"Wrote {args.output} ({len(calibration.thresholds)} thresholds)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,256 @@
+# Historical intake exports को model से दोबारा score करें (Flask form के बिना)
+#
+# Input (format अपने-आप पहचाना जाता है):
+#   - one-hot CSV: हर symptom का 0/1 column (datasets/Training.csv जैसा)
+#   - symptom-list CSV: Symptom_1..Symptom_N columns में symptom names (datasets/symtoms_df.csv जैसा),
+#     या एक 'symptoms' column में comma-separated names / free text
+#   - JSONL (.jsonl/.ndjson): हर line एक list, string या {"symptoms": ...}
+# Output: CSV या JSONL (output file के extension से), rows input के ही क्रम में; हर row के साथ
+# disease और triage score/level (datasets/Symptom-severity.csv weights से)।
+#
+# File fixed-size chunks में पढ़ी जाती है। हर chunk एक (rows x 132) matrix बनकर एक ही
+# svc.predict call में score होता है, chunks process pool में बँटते हैं और results
+# आते ही लिखे जाते हैं। एक समय पर ज़्यादा से ज़्यादा 2 x processes chunks memory में रहते हैं।
+#
+# चलाएँ (repo root से):
+#   python -m scripts.score_patients datasets/Training.csv -o scored.csv
+#   python -m scripts.score_patients intake.jsonl -o scored.jsonl --processes 8 --details
+import argparse
+import contextlib
+import csv
+import io
+import itertools
+import json
+import operator
+import multiprocessing
+import os
+import re
+import sys
+import time
+from collections import deque
+
+# पूरा run एक ही model version से - बीच में files बदलें तो भी reload नहीं
+os.environ.setdefault('MODEL_RELOAD_INTERVAL', '0')
+
+import numpy as np
+
+import main as app_module
+from ingest import header_names
+
+# Symptom_1, symptom 2, ... या 'symptoms'
+SYMPTOM_LIST_COLUMN = re.compile(r'^(symptom[_ ]?\d+|symptoms)$', re.IGNORECASE)
+# One-hot cell जिसे "symptom नहीं है" माना जाता है
+_INACTIVE_VALUES = ('', '0', '0.0', 'false', 'False')
+DETAIL_FIELDS = app_module.Recommendation._fields
+
+
+# --------------------------------------------------------
+# Input layout
+# --------------------------------------------------------
+
+def csv_layout(header):
+    # Returns ('onehot', [(column, symptom index)]) या ('list', [column, ...])
+    # दोहराए गए नाम ingest की तरह '.1' suffix से - Training.csv का दूसरा fluid_overload = 'fluid_overload.1'
+    names = header_names(header)
+    list_columns = [i for i, name in enumerate(names) if SYMPTOM_LIST_COLUMN.match(name)]
+    onehot_columns = [(i, app_module.symptoms_dict[name]) for i, name in enumerate(names)
+                      if name in app_module.symptoms_dict]
+    if len(onehot_columns) > len(list_columns):
+        return 'onehot', onehot_columns
+    if list_columns:
+        return 'list', list_columns
+    raise ValueError("CSV header has neither symptom columns (one-hot) nor Symptom_N / symptoms columns.")
+
+
+def iter_csv_chunks(f, chunk_size, id_column):
+    reader = csv.reader(f)
+    header = next(reader, None)
+    if header is None:
+        return
+    layout, columns = csv_layout(header)
+    id_index = None
+    if id_column is not None:
+        # Feature columns जैसे ही normalized नामों में (strip, दोहराए नामों पर '.1')
+        names = header_names(header)
+        if id_column not in names:
+            raise ValueError(f"--id-column '{id_column}' is not in the CSV header.")
+        id_index = names.index(id_column)
+
+    offset = 0
+    while True:
+        rows = list(itertools.islice(reader, chunk_size))
+        if not rows:
+            return
+        if id_index is None:
+            ids = list(range(offset, offset + len(rows)))
+        else:
+            ids = [row[id_index] if id_index < len(row) else None for row in rows]
+        offset += len(rows)
+        yield {'layout': layout, 'columns': columns, 'width': len(header), 'ids': ids, 'rows': rows}
+
+
+def iter_jsonl_chunks(f, chunk_size, id_column):
+    offset = 0
+    for rows in app_module._iter_batch_chunks(app_module._iter_ndjson_rows(f), chunk_size):
+        if id_column is None:
+            ids = list(range(offset, offset + len(rows)))
+        else:
+            ids = [row.get(id_column) if isinstance(row, dict) else None for row in rows]
+        offset += len(rows)
+        yield {'layout': 'jsonl', 'ids': ids, 'rows': rows}
+
+
+# --------------------------------------------------------
+# Scoring (pool workers में चलता है)
+# --------------------------------------------------------
+
+def onehot_matrix(rows, columns, width):
+    errors = [None] * len(rows)
+    matrix = np.zeros((len(rows), len(app_module.symptoms_dict)), dtype=np.uint8)
+    complete = [i for i, row in enumerate(rows) if len(row) == width]
+    for i in set(range(len(rows))) - set(complete):
+        errors[i] = f"Row has {len(rows[i])} columns, header has {width}."
+
+    if complete:
+        pick = operator.itemgetter(*[column for column, _ in columns])
+        cells = np.char.strip(np.array([pick(rows[i]) for i in complete], dtype=str).reshape(len(complete), -1))
+        active = np.ones(cells.shape, dtype=bool)
+        for value in _INACTIVE_VALUES:
+            active &= cells != value
+        matrix[np.ix_(complete, [index for _, index in columns])] = active
+        for i in np.asarray(complete)[~active.any(axis=1)]:
+            errors[i] = "No Symptoms Selected"
+    return matrix, errors, [[] for _ in rows]
+
+
+def symptom_list_rows(rows, columns):
+    if len(columns) == 1:
+        # एक 'symptoms' column: comma-separated names / free text
+        return [row[columns[0]] if columns[0] < len(row) else '' for row in rows]
+    return [[row[column] for column in columns if column < len(row)] for row in rows]
+
+
+def _csv_line(result, details):
+    values = [result['row'], result.get('disease', ''), result.get('triage_score', ''), result.get('triage_level', ''),
+              '; '.join(result['unknown_symptoms']), result.get('error', '')]
+    if details:
+        values.append(result.get('description', ''))
+        values.extend('; '.join(result.get(field, ())) for field in DETAIL_FIELDS[1:])
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(values)
+    return buffer.getvalue()
+
+
+def score_chunk(chunk, output_format, details):
+    # Returns (rows, errors, serialized output text)
+    layout = chunk['layout']
+    if layout == 'onehot':
+        encoded = onehot_matrix(chunk['rows'], chunk['columns'], chunk['width'])
+    elif layout == 'list':
+        encoded = app_module.encode_symptom_matrix(symptom_list_rows(chunk['rows'], chunk['columns']))
+    else:
+        encoded = app_module.encode_symptom_matrix(chunk['rows'])
+
+    results = app_module.predict_matrix(*encoded, details=details)
+    lines = []
+    errors = 0
+    for result, row_id in zip(results, chunk['ids']):
+        result['row'] = row_id
+        errors += 'error' in result
+        if output_format == 'jsonl':
+            lines.append(json.dumps(result, ensure_ascii=False) + '\n')
+        else:
+            lines.append(_csv_line(result, details))
+    return len(results), errors, ''.join(lines)
+
+
+# --------------------------------------------------------
+# Driver
+# --------------------------------------------------------
+
+def scored_chunks(chunks, processes, output_format, details):
+    # Input के क्रम में (rows, errors, text); pool में एक समय पर 2 x processes chunks से ज़्यादा नहीं
+    if processes <= 1:
+        for chunk in chunks:
+            yield score_chunk(chunk, output_format, details)
+        return
+
+    with multiprocessing.Pool(processes) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.apply_async(score_chunk, (chunk, output_format, details)))
+            if len(pending) >= 2 * processes:
+                yield pending.popleft().get()
+        while pending:
+            yield pending.popleft().get()
+
+
+def _is_jsonl(path):
+    return path.lower().endswith(('.jsonl', '.ndjson'))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Score a CSV/JSONL file of patients with the disease model.")
+    parser.add_argument('input', help="one-hot CSV, symptom-list CSV, or JSONL (.jsonl/.ndjson)")
+    parser.add_argument('-o', '--output', default='-', help="output .csv or .jsonl (default: CSV on stdout)")
+    parser.add_argument('--chunk-size', type=int, default=10000, help="rows per chunk (default 10000)")
+    parser.add_argument('--processes', type=int, default=os.cpu_count() or 1,
+                        help="worker processes (default: CPU count, 1 = no pool)")
+    parser.add_argument('--id-column', help="input column/key copied to the output 'row' field "
+                                            "(default: 0-based row number)")
+    parser.add_argument('--details', action='store_true',
+                        help="include description, precautions, medications, diets and workouts")
+    args = parser.parse_args(argv)
+
+    if app_module.model_registry.current.scorer is None:
+        print("Error: Model could not be loaded.", file=sys.stderr)
+        return 1
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be at least 1")
+
+    output_format = 'jsonl' if _is_jsonl(args.output) else 'csv'
+    started = time.perf_counter()
+    total_rows = 0
+    total_errors = 0
+
+    # '-' पर sys.stdout - उसे with बंद न करे, इसलिए nullcontext
+    with open(args.input, newline='', encoding='utf-8-sig') as f_in, \
+            (open(args.output, 'w', newline='', encoding='utf-8') if args.output != '-'
+             else contextlib.nullcontext(sys.stdout)) as f_out:
+        if _is_jsonl(args.input):
+            chunks = iter_jsonl_chunks(f_in, args.chunk_size, args.id_column)
+        else:
+            chunks = iter_csv_chunks(f_in, args.chunk_size, args.id_column)
+
+        try:
+            # पहला chunk पहले पढ़ें, ताकि header/--id-column की गलती output लिखने से पहले दिखे
+            first = next(chunks, None)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        chunks = itertools.chain([first] if first is not None else [], chunks)
+
+        if output_format == 'csv':
+            header = ['row', 'disease', 'triage_score', 'triage_level', 'unknown_symptoms', 'error'] + \
+                (list(DETAIL_FIELDS) if args.details else [])
+            csv.writer(f_out).writerow(header)
+
+        try:
+            for rows, errors, text in scored_chunks(chunks, args.processes, output_format, args.details):
+                f_out.write(text)
+                total_rows += rows
+                total_errors += errors
+                rate = total_rows / (time.perf_counter() - started)
+                print(f"\r  {total_rows:,} rows ({rate:,.0f} rows/s)", end='', file=sys.stderr)
+        except ValueError as e:
+            print(f"\nError: {e}", file=sys.stderr)
+            return 1
+
+    elapsed = time.perf_counter() - started
+    print(f"\nScored {total_rows:,} rows ({total_errors:,} errors) in {elapsed:.1f} s "
+          f"({total_rows / max(elapsed, 1e-9):,.0f} rows/s)", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
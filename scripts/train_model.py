@@ -0,0 +1,210 @@
+# datasets/Training.csv से models/svc.pkl दोबारा train करें (notebook के बिना, reproducible)
+#
+# - Training.csv सीधे uint8 matrix में पढ़ी जाती है (float64 DataFrame नहीं)
+# - 4920 rows में सिर्फ ~300 अलग (symptoms, prognosis) patterns हैं: हर pattern एक बार,
+#   उसकी गिनती sample_weight बनती है। SVC में weight = C x गिनती, तो duplicates पर train
+#   करने जैसा ही optimum, लेकिन libsvm को ~16x कम rows
+# - Stratified k-fold CV unique patterns पर, folds parallel (joblib)। Raw rows पर CV
+#   में हर test row की copies train में होतीं और score हमेशा 1.0 आता
+# - Class order (LabelEncoder = sorted names) main.diseases_list से मिलाया जाता है
+#
+# Output: models/svc.pkl + models/svc.json (version, checksums, params, CV scores)।
+# Training data, params और sklearn version न बदले हों तो कुछ नहीं होता (--force से दोबारा)।
+# नया model लिखने के बाद बाकी artifacts उसी क्रम में दोबारा बनते हैं:
+#   export_model -> fit_calibration -> build_lookup -> build_snapshot
+#
+# चलाएँ (repo root से):
+#   python -m scripts.train_model              # dataset बदला हो तो retrain + artifacts
+#   python -m scripts.train_model --force --jobs 4
+#   python -m scripts.train_model --output /tmp/svc.pkl   # सिर्फ model, artifacts नहीं
+import argparse
+import csv
+import hashlib
+import json
+import os
+import pickle
+import sys
+import time
+
+os.environ['USE_SNAPSHOT'] = '0'
+
+import numpy as np
+import pandas as pd
+import sklearn
+from sklearn.model_selection import StratifiedKFold, cross_validate
+from sklearn.svm import SVC
+
+from ingest import header_names
+from main import diseases_list
+from snapshot import file_sha256
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TRAINING_PATH = os.path.join(BASE_DIR, "datasets", "Training.csv")
+MODEL_PATH = os.path.join(BASE_DIR, "models", "svc.pkl")
+MANIFEST_VERSION = 1
+# Notebook वाला model: SVC(kernel='linear'), बाकी sklearn defaults
+SVC_PARAMS = {'kernel': 'linear', 'C': 1.0}
+
+
+def manifest_path(model_path):
+    return os.path.splitext(model_path)[0] + '.json'
+
+
+def load_training_matrix(path=TRAINING_PATH):
+    # Returns (feature names, uint8 matrix, prognosis labels)
+    with open(path, newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        # Header में 'fluid_overload' दो बार है - pandas की तरह दूसरा 'fluid_overload.1'
+        # (svc.pkl के feature_names_in_, symptoms_dict और serving के ingest.py यही नाम इस्तेमाल करते हैं)
+        header = header_names(next(reader))
+        label_column = header.index('prognosis')
+        rows = list(reader)
+    features = header[:label_column] + header[label_column + 1:]
+    labels = np.array([row[label_column] for row in rows])
+    X = np.array([row[:label_column] + row[label_column + 1:] for row in rows], dtype=np.uint8)
+    return features, X, labels
+
+
+def deduplicate(X, y):
+    # (symptoms, class) के हर अलग pattern की एक row + उसकी गिनती
+    patterns = np.column_stack([X, y.astype(np.uint8)])
+    unique, counts = np.unique(patterns, axis=0, return_counts=True)
+    return unique[:, :-1], unique[:, -1].astype(np.int64), counts.astype(np.float64)
+
+
+def encode_labels(labels):
+    # LabelEncoder जैसा: class id = sorted नामों में position; diseases_list से मेल ज़रूरी
+    names = sorted(set(labels.tolist()))
+    expected = [diseases_list.get(i) for i in range(len(names))]
+    if len(names) != len(diseases_list) or names != expected:
+        mismatched = [(i, name, diseases_list.get(i)) for i, name in enumerate(names) if name != diseases_list.get(i)]
+        raise ValueError(f"Training.csv prognosis names do not match diseases_list "
+                         f"({len(names)} vs {len(diseases_list)} classes; first mismatch: "
+                         f"{mismatched[0] if mismatched else 'extra classes in diseases_list'}).")
+    index = {name: i for i, name in enumerate(names)}
+    return np.array([index[name] for name in labels.tolist()], dtype=np.int64), names
+
+
+def model_version(training_sha256, params):
+    # Inputs का hash: वही data + params + sklearn version -> वही version
+    key = json.dumps({'training': training_sha256, 'params': params, 'sklearn': sklearn.__version__},
+                     sort_keys=True)
+    return hashlib.sha256(key.encode()).hexdigest()[:12]
+
+
+def read_manifest(model_path):
+    try:
+        with open(manifest_path(model_path), encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def is_up_to_date(model_path, version):
+    manifest = read_manifest(model_path)
+    return (manifest is not None and manifest.get('version') == version and os.path.exists(model_path)
+            and manifest.get('model_sha256') == file_sha256(model_path))
+
+
+def _write_atomic(path, data):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def train(features, X, y, params, folds, jobs, seed):
+    X_unique, y_unique, weights = deduplicate(X, y)
+    frame = pd.DataFrame(X_unique, columns=features)
+
+    cv = StratifiedKFold(n_splits=folds, shuffle=True, random_state=seed)
+    scores = cross_validate(SVC(**params), frame, y_unique, cv=cv, n_jobs=jobs,
+                            params={'sample_weight': weights})['test_score']
+
+    # DataFrame पर fit ताकि feature_names_in_ बने (export_model इन्हें Training.csv से मिलाता है)
+    svc = SVC(**params).fit(frame, y_unique, sample_weight=weights)
+    return svc, scores, len(X_unique)
+
+
+def rebuild_artifacts(model_path):
+    from scripts import build_lookup, build_snapshot, export_model, fit_calibration
+
+    steps = (
+        ('export_model', lambda: export_model.main(['--model', model_path])),
+        ('fit_calibration', lambda: fit_calibration.main([])),
+        ('build_lookup', lambda: build_lookup.main([])),
+        ('build_snapshot', lambda: build_snapshot.main([])),
+    )
+    for name, step in steps:
+        print(f"\n== {name}")
+        if step():
+            print(f"Error: {name} failed; later artifacts were not rebuilt.", file=sys.stderr)
+            return 1
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Retrain models/svc.pkl from datasets/Training.csv.")
+    parser.add_argument('--training', default=TRAINING_PATH)
+    parser.add_argument('--output', default=MODEL_PATH)
+    parser.add_argument('--C', type=float, default=SVC_PARAMS['C'])
+    parser.add_argument('--folds', type=int, default=5)
+    parser.add_argument('--jobs', type=int, default=-1, help="parallel CV folds (default: all cores)")
+    parser.add_argument('--seed', type=int, default=0, help="CV shuffle seed")
+    parser.add_argument('--force', action='store_true', help="retrain even if the model is up to date")
+    parser.add_argument('--no-artifacts', action='store_true',
+                        help="only write the model, don't rebuild scorer/calibration/lookup/snapshot")
+    args = parser.parse_args(argv)
+
+    params = {**SVC_PARAMS, 'C': args.C}
+    training_sha256 = file_sha256(args.training)
+    version = model_version(training_sha256, params)
+    if not args.force and is_up_to_date(args.output, version):
+        print(f"OK: {args.output} (version {version}) is up to date with {args.training}")
+        return 0
+
+    started = time.perf_counter()
+    features, X, labels = load_training_matrix(args.training)
+    try:
+        y, names = encode_labels(labels)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    svc, scores, n_unique = train(features, X, y, params, args.folds, args.jobs, args.seed)
+    accuracy = float((svc.predict(pd.DataFrame(X, columns=features)) == y).mean())
+    elapsed = time.perf_counter() - started
+
+    model_bytes = pickle.dumps(svc, protocol=pickle.HIGHEST_PROTOCOL)
+    _write_atomic(args.output, model_bytes)
+    manifest = {
+        'manifest_version': MANIFEST_VERSION,
+        'version': version,
+        'model_sha256': hashlib.sha256(model_bytes).hexdigest(),
+        'training_sha256': training_sha256,
+        'sklearn': sklearn.__version__,
+        'params': params,
+        'rows': int(len(X)),
+        'unique_rows': int(n_unique),
+        'classes': names,
+        'cv': {'folds': args.folds, 'seed': args.seed, 'accuracy_mean': float(scores.mean()),
+               'accuracy_std': float(scores.std())},
+        'training_accuracy': accuracy,
+    }
+    _write_atomic(manifest_path(args.output), (json.dumps(manifest, indent=2, ensure_ascii=False) + '\n').encode())
+
+    print(f"Trained on {n_unique} unique patterns ({len(X)} rows, {len(names)} classes) in {elapsed:.2f} s")
+    print(f"CV accuracy ({args.folds}-fold, unique patterns): {scores.mean():.4f} ± {scores.std():.4f}; "
+          f"training accuracy {accuracy:.4f}")
+    print(f"Wrote {args.output} (version {version}, sha256 {manifest['model_sha256'][:12]})")
+
+    if args.no_artifacts:
+        return 0
+    if os.path.abspath(args.output) != MODEL_PATH:
+        print("Note: --output is not models/svc.pkl, serving artifacts were not rebuilt.")
+        return 0
+    return rebuild_artifacts(args.output)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
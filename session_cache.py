@@ -0,0 +1,63 @@
+# ============================================================
+# User Session Cache (per process, TTL)
+# ============================================================
+#
+# Flask-Login हर authenticated request पर load_user() चलाता है - बिना cache के हर
+# request पर एक SQLite query। यहाँ user id -> logged-in user की read-only copy
+# ttl seconds तक रखी जाती है। Logout, password change या user row बदलने पर उस
+# process में entry तुरंत हटती है; दूसरे workers में ज़्यादा से ज़्यादा ttl तक पुरानी रह सकती है।
+
+import threading
+import time
+from collections import OrderedDict
+
+
+class UserSessionCache:
+    def __init__(self, ttl=60.0, maxsize=10000):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self):
+        return self.ttl > 0 and self.maxsize > 0
+
+    def get(self, user_id):
+        if not self.enabled:
+            return None
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(user_id)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._data[user_id]
+                self.misses += 1
+                return None
+            self._data.move_to_end(user_id)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, user_id, user):
+        if not self.enabled:
+            return
+        with self._lock:
+            self._data[user_id] = (time.monotonic() + self.ttl, user)
+            self._data.move_to_end(user_id)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, user_id):
+        with self._lock:
+            self._data.pop(user_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self):
+        with self._lock:
+            return {'size': len(self._data), 'maxsize': self.maxsize, 'ttl': self.ttl,
+                    'hits': self.hits, 'misses': self.misses}
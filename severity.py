@@ -0,0 +1,97 @@
+# ============================================================
+# Symptom Severity Weights (datasets/Symptom-severity.csv)
+# ============================================================
+#
+# CSV के नाम symptoms_dict से पूरी तरह मेल नहीं खाते:
+#   'spotting_urination' / 'foul_smell_ofurine' / 'dischromic_patches'  (dict में बीच में spaces हैं)
+#   'fluid_overload' दो बार - दूसरी row dict का 'fluid_overload.1' है (pandas column जैसा नाम)
+#   आख़िरी row 'prognosis' कोई symptom नहीं है
+# इसलिए नाम सिर्फ letters/digits पर मिलाए जाते हैं और दोहराए गए नाम को '.1', '.2' suffix मिलता है।
+#
+# Triage: मौजूद symptoms के weights का जोड़ (severity score) और उससे एक level। सिर्फ जोड़ काफ़ी
+# नहीं - अकेला 'coma' या 'chest_pain' (7) चार हल्के skin symptoms से कम निकलता - इसलिए कोई एक
+# symptom critical weight या उससे ऊपर हो तो level कम से कम 'priority'। Weights symptoms_dict
+# indices पर aligned एक vector में हैं, इसलिए पूरे batch का score एक ही (N, 132) @ (132,) dot
+# product है - कोई extra model call नहीं।
+
+import csv
+
+import numpy as np
+
+# Score thresholds के क्रम में: score < पहला threshold -> 'routine', ...
+TRIAGE_LEVELS = ('routine', 'priority', 'urgent')
+# Critical symptom होने पर कम से कम यह level (TRIAGE_LEVELS में index)
+_CRITICAL_LEVEL = 1
+
+
+def _compact(name):
+    return ''.join(char for char in name.lower() if char.isalnum())
+
+
+def read_severity_weights(path, symptom_keys):
+    # Returns {symptoms_dict key: weight}; CSV में न मिलने वाले symptoms शामिल नहीं होते
+    by_compact = {_compact(key): key for key in symptom_keys}
+    seen = {}
+    weights = {}
+    with open(path, newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            name = row['Symptom'].strip()
+            count = seen.get(name, 0)
+            seen[name] = count + 1
+            if count:
+                name = f"{name}.{count}"
+            key = by_compact.get(_compact(name))
+            if key is not None:
+                weights[key] = int(row['weight'])
+    return weights
+
+
+class TriageScorer:
+    def __init__(self, weights, thresholds, critical_weight=None):
+        # weights: symptoms_dict index -> weight; thresholds: 'priority' और 'urgent' के minimum scores;
+        # critical_weight: इतने या ज़्यादा weight का कोई भी एक symptom -> कम से कम 'priority' (None = बंद)
+        if len(thresholds) != len(TRIAGE_LEVELS) - 1 or list(thresholds) != sorted(thresholds):
+            raise ValueError(f"need {len(TRIAGE_LEVELS) - 1} increasing triage thresholds, got {thresholds!r}")
+        # float32: batch का dot product BLAS में (integer matmul से ~4x तेज़); weights छोटे integers हैं,
+        # इसलिए जोड़ float32 में भी exact रहता है
+        self.weights = np.asarray(weights, dtype=np.float32)
+        self.thresholds = tuple(thresholds)
+        self.critical_weight = critical_weight
+        # Critical symptoms का 0/1 vector - batch में "कोई critical है?" भी एक dot product
+        self._critical = (self.weights >= (np.inf if critical_weight is None else critical_weight)).astype(np.float32)
+        # एक request के 1-17 indices पर plain Python जोड़ numpy call से सस्ता है
+        self._weights = self.weights.astype(int).tolist()
+
+    @classmethod
+    def from_weights(cls, weights, symptom_index, thresholds, critical_weight=None):
+        # weights: read_severity_weights() का {key: weight}; symptom_index: symptoms_dict
+        vector = np.zeros(len(symptom_index), dtype=np.float32)
+        for key, weight in weights.items():
+            vector[symptom_index[key]] = weight
+        return cls(vector, thresholds, critical_weight)
+
+    def level(self, score, peak=0):
+        # peak: सबसे भारी एक symptom का weight
+        rank = len(TRIAGE_LEVELS) - 1
+        for i, threshold in enumerate(self.thresholds):
+            if score < threshold:
+                rank = i
+                break
+        if self.critical_weight is not None and peak >= self.critical_weight:
+            rank = max(rank, _CRITICAL_LEVEL)
+        return TRIAGE_LEVELS[rank]
+
+    def score(self, indices):
+        # एक symptom set (duplicates एक बार) -> (score, level)
+        weights = [self._weights[index] for index in set(indices)]
+        score = sum(weights)
+        return score, self.level(score, max(weights, default=0))
+
+    def score_matrix(self, matrix):
+        # (N, 132) 0/1 matrix -> (scores, levels) arrays, पूरे batch का एक dot product
+        present = matrix.astype(np.float32)
+        scores = (present @ self.weights).astype(np.int32)
+        ranks = np.searchsorted(self.thresholds, scores, side='right')
+        if self.critical_weight is not None:
+            ranks = np.where(present @ self._critical > 0, np.maximum(ranks, _CRITICAL_LEVEL), ranks)
+        return scores, np.asarray(TRIAGE_LEVELS)[ranks]
@@ -0,0 +1,75 @@
+# ============================================================
+# Serving Snapshot (one binary file instead of CSV parsing on import)
+# ============================================================
+#
+# Request path को जो कुछ चाहिए - हर बीमारी का recommendation record और compiled
+# scorer के arrays - वह सब एक versioned file में रहता है:
+#
+#   MAGIC (8 bytes) | version (uint32) | pickle protocol 5 payload
+#
+# Payload में सिर्फ builtins (dict/tuple/str) और NumPy arrays होते हैं, इसलिए
+# load करने पर pandas या sklearn import नहीं होते। हर source file का sha256 भी
+# रखा जाता है; startup पर कोई source बदली हुई मिले तो snapshot stale माना जाता है।
+#
+# Snapshot बनाएँ: python -m scripts.build_snapshot
+
+import hashlib
+import os
+import pickle
+import struct
+
+SNAPSHOT_MAGIC = b'MEDSNAP\x00'
+SNAPSHOT_VERSION = 1
+_HEADER = struct.Struct('<8sI')
+
+
+class SnapshotError(Exception):
+    pass
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _sha256_or_none(path):
+    try:
+        return file_sha256(path)
+    except OSError:
+        return None
+
+
+def source_hashes(sources):
+    # sources: {name: path} -> {name: sha256}; optional files जो मौजूद नहीं हैं उनका None
+    return {name: _sha256_or_none(path) for name, path in sources.items()}
+
+
+def write_snapshot(path, payload):
+    # पहले temp file में लिखें, फिर rename - चलते workers कभी आधी लिखी file नहीं पढ़ते
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION))
+        pickle.dump(payload, f, protocol=5)
+    os.replace(tmp_path, path)
+
+
+def read_snapshot(path):
+    with open(path, 'rb') as f:
+        header = f.read(_HEADER.size)
+        if len(header) != _HEADER.size:
+            raise SnapshotError(f"'{path}' is not a snapshot file.")
+        magic, version = _HEADER.unpack(header)
+        if magic != SNAPSHOT_MAGIC:
+            raise SnapshotError(f"'{path}' is not a snapshot file.")
+        if version != SNAPSHOT_VERSION:
+            raise SnapshotError(f"Snapshot version {version} is not supported (expected {SNAPSHOT_VERSION}).")
+        return pickle.load(f)
+
+
+def stale_sources(payload, sources):
+    # जिन sources का hash snapshot से मेल नहीं खाता (या जो जुड़े/हटे हैं) उनके नाम
+    recorded = payload.get('sources', {})
+    return [name for name, digest in source_hashes(sources).items() if recorded.get(name, '') != digest]
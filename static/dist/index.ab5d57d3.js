@@ -0,0 +1,393 @@
+// Global variable for recognition instance
+let recognition = null;
+
+const symptomCheckboxesDiv = document.getElementById('symptomCheckboxes');
+const symptomSearchInput = document.getElementById('symptomSearch');
+const symptomsInput = document.getElementById('symptoms');
+const submitSymptomsButton = document.getElementById('submitSymptoms');
+const symptomModalElement = document.getElementById('symptomSelectModal');
+const doctorsModalElement = document.getElementById('doctorsModal');
+const micModalElement = document.getElementById('micModal');
+
+// Doctor Suggestion elements
+const suggestedExpert = document.getElementById('suggestedExpert');
+const suggestionDetails = document.getElementById('suggestionDetails');
+
+// Voice UI elements
+const liveTranscription = document.getElementById('liveTranscription');
+const transcriptionDiv = document.getElementById('transcription');
+const bootstrapMicModal = new bootstrap.Modal(micModalElement);
+
+// Doctor's Suggestion Logic (Unchanged)
+const doctorMap = {
+    'Fungal infection': 'Dermatologist (त्वचा विशेषज्ञ)', 'Allergy': 'Allergist / General Physician (एलर्जी विशेषज्ञ / सामान्य चिकित्सक)',
+    'GERD': 'Gastroenterologist (गैस्ट्रोएंटेरोलॉजिस्ट)', 'Chronic cholestasis': 'Hepatologist / Gastroenterologist (हेपेटोलॉजिस्ट / गैस्ट्रोएंटेरोलॉजिस्ट)',
+    'Drug Reaction': 'General Physician (सामान्य चिकित्सक)', 'Peptic ulcer diseae': 'Gastroenterologist (गैस्ट्रोएंटेरोलॉजिस्ट)',
+    'AIDS': 'Immunologist / Infectious Disease Specialist (प्रतिरक्षाविज्ञानी / संक्रामक रोग विशेषज्ञ)', 'Diabetes ': 'Endocrinologist (एंडोक्रिनोलॉजिस्ट)',
+    'Gastroenteritis': 'General Physician (सामान्य चिकित्सक)', 'Bronchial Asthma': 'Pulmonologist (पल्मोनोलॉजिस्ट)',
+    'Hypertension ': 'Cardiologist (कार्डियोलॉजिस्ट) / General Physician', 'Migraine': 'Neurologist (न्यूरोलॉजिस्ट)',
+    'Cervical spondylosis': 'Orthopedic / Physiotherapist (हड्डी रोग विशेषज्ञ / फिजियोथेरेपिस्ट)', 'Paralysis (brain hemorrhage)': 'Neurologist / Neurosurgeon (न्यूरोलॉजिस्ट / न्यूरोसर्जन)',
+    'Jaundice': 'Hepatologist / General Physician (हेपेटोलॉजिस्ट / सामान्य चिकित्सक)', 'Malaria': 'General Physician (सामान्य चिकित्सक)',
+    'Chicken pox': 'General Physician (सामान्य चिकित्सक)', 'Dengue': 'General Physician (सामान्य चिकित्सक)',
+    'Typhoid': 'General Physician (सामान्य चिकित्सक)', 'hepatitis A': 'Hepatologist / General Physician (हेपेटोलॉजिस्ट / सामान्य चिकित्सक)',
+    'Hepatitis B': 'Hepatologist (हेपेटोलॉजिस्ट)', 'Hepatitis C': 'Hepatologist (हेपेटोलॉजिस्ट)',
+    'Hepatitis D': 'Hepatologist (हेपेटोलॉजिस्ट)', 'Hepatitis E': 'Hepatologist (हेपेटोलॉजिस्ट)',
+    'Alcoholic hepatitis': 'Hepatologist / Gastroenterologist (हेपेटोलॉजिस्ट / गैस्ट्रोएंटेरोलॉजिस्ट)', 'Tuberculosis': 'Pulmonologist (पल्मोनोलॉजिस्ट) / Infectious Disease Specialist',
+    'Common Cold': 'General Physician (सामान्य चिकित्सक)', 'Pneumonia': 'Pulmonologist (पल्मोनोलॉजिस्ट)',
+    'Dimorphic hemmorhoids(piles)': 'Proctologist / General Surgeon (प्रोक्टोलॉजिस्ट / सामान्य सर्जन)', 'Heart attack': 'Cardiologist (कार्डियोलॉजिस्ट)',
+    'Varicose veins': 'Vascular Surgeon (वैस्कुलर सर्जन)', 'Hypothyroidism': 'Endocrinologist (एंडोक्रिनोलॉजिस्ट)',
+    'Hyperthyroidism': 'Endocrinologist (एंडोक्रिनोलॉजिस्ट)', 'Hypoglycemia': 'Endocrinologist (एंडोक्रिनोलॉजिस्ट)',
+    'Osteoarthristis': 'Orthopedic (हड्डी रोग विशेषज्ञ)', 'Arthritis': 'Rheumatologist (रूमेटोलॉजिस्ट) / Orthopedic',
+    '(vertigo) Paroymsal  Positional Vertigo': 'ENT Specialist / Neurologist (ईएनटी विशेषज्ञ / न्यूरोलॉजिस्ट)',
+    'Acne': 'Dermatologist (त्वचा विशेषज्ञ)', 'Urinary tract infection': 'Urologist / General Physician (यूरोलॉजिस्ट / सामान्य चिकित्सक)',
+    'Psoriasis': 'Dermatologist (त्वचा विशेषज्ञ)', 'Impetigo': 'Dermatologist (त्वचा विशेषज्ञ)'
+};
+
+function getDoctorSuggestion(disease) {
+    const expert = doctorMap[disease] || 'General Physician (सामान्य चिकित्सक)';
+    let details = `इस बीमारी के लिए आपको **${expert}** से सलाह लेनी चाहिए।`;
+
+    if(expert.includes('Hepatologist') || expert.includes('Gastroenterologist')){
+         details += ` ये डॉक्टर पाचन तंत्र, लीवर, पित्ताशय और अग्न्याशय से संबंधित समस्याओं का इलाज करते हैं।`;
+    } else if (expert.includes('Dermatologist')){
+         details += ` ये डॉक्टर त्वचा, बाल और नाखून से संबंधित समस्याओं के विशेषज्ञ होते हैं।`;
+    } else if (expert.includes('Cardiologist')){
+         details += ` ये डॉक्टर हृदय और रक्त वाहिकाओं से संबंधित समस्याओं का इलाज करते हैं।`;
+    } else if (expert.includes('Pulmonologist')){
+         details += ` ये डॉक्टर फेफड़ों और श्वसन तंत्र से संबंधित समस्याओं का इलाज करते हैं।`;
+    } else if (expert.includes('Neurologist')){
+         details += ` ये डॉक्टर मस्तिष्क, रीढ़ की हड्डी और तंत्रिका तंत्र से संबंधित समस्याओं का इलाज करते हैं।`;
+    } else if (expert.includes('Endocrinologist')){
+         details += ` ये डॉक्टर हार्मोन और ग्रंथियों (जैसे थायरॉइड, मधुमेह) से संबंधित समस्याओं का इलाज करते हैं।`;
+    } else if (expert.includes('Orthopedic')){
+         details += ` ये डॉक्टर हड्डियों, जोड़ों और मांसपेशियों से संबंधित समस्याओं का इलाज करते हैं।`;
+    }
+
+    return { expert: expert, details: details };
+}
+
+// अभी दिख रहे result की बीमारी - fetch से नया result आने पर बदलती है
+// (server-rendered result में template इसे #predictResults के data-disease में देता है)
+let currentDisease = document.getElementById('predictResults').dataset.disease || '';
+
+if (doctorsModalElement) {
+    doctorsModalElement.addEventListener('show.bs.modal', function () {
+        const disease = currentDisease;
+
+        if (disease) {
+            const suggestion = getDoctorSuggestion(disease);
+            suggestedExpert.innerHTML = `Suggested Specialist: <br> <strong>${suggestion.expert}</strong>`;
+            suggestionDetails.textContent = suggestion.details;
+        } else {
+            suggestedExpert.textContent = 'कोई बीमारी अनुमानित नहीं है।';
+            suggestionDetails.textContent = 'कृपया पहले लक्षण दर्ज करके बीमारी का अनुमान लगाएं।';
+        }
+    });
+}
+
+// =================================================================
+// Symptom Search (server-side autocomplete: GET /symptoms/suggest)
+// =================================================================
+
+// Modal में चुने गए symptoms - search बदलने पर भी बने रहते हैं
+const selectedSymptoms = new Set();
+let suggestTimer = null;
+
+function showSearchHint() {
+    symptomCheckboxesDiv.innerHTML = '<p>लक्षण खोजने के लिए टाइप करें। (Start typing to search symptoms.)</p>';
+}
+
+function renderSuggestions(suggestions, title) {
+    symptomCheckboxesDiv.innerHTML = '';
+    if (!suggestions.length) {
+        symptomCheckboxesDiv.innerHTML = '<p>कोई लक्षण नहीं मिला। (No matching symptoms.)</p>';
+        return;
+    }
+    if (title) {
+        const heading = document.createElement('p');
+        heading.className = 'text-muted small mb-2';
+        heading.textContent = title;
+        symptomCheckboxesDiv.appendChild(heading);
+    }
+
+    suggestions.forEach(item => {
+        const div = document.createElement('div');
+        div.className = 'form-check';
+
+        div.innerHTML = `
+            <input class="form-check-input" type="checkbox" value="${item.symptom}" id="check_${item.symptom}" ${selectedSymptoms.has(item.symptom) ? 'checked' : ''}>
+            <label class="form-check-label" for="check_${item.symptom}">
+                ${item.hi} <span style="font-size: 0.8em; color: #555555;">(${item.label})</span>
+            </label>
+        `;
+        div.querySelector('input').addEventListener('change', function () {
+            if (this.checked) {
+                selectedSymptoms.add(item.symptom);
+            } else {
+                selectedSymptoms.delete(item.symptom);
+            }
+            // Search खाली है: नए चुनाव के हिसाब से अगले related symptoms
+            if (!symptomSearchInput.value.trim()) {
+                loadRelated();
+            }
+        });
+        symptomCheckboxesDiv.appendChild(div);
+    });
+}
+
+// Search खाली हो तो: अब तक के symptoms के बाद सबसे काम के अगले symptoms (GET /symptoms/related)
+async function loadRelated() {
+    const current = symptomsInput.value.split(',').map(s => s.trim()).filter(s => s);
+    selectedSymptoms.forEach(symptom => current.push(symptom));
+    if (!current.length) {
+        showSearchHint();
+        return;
+    }
+    const response = await fetch(`/symptoms/related?k=8&symptoms=${encodeURIComponent(current.join(','))}`);
+    if (!response.ok) {
+        showSearchHint();
+        return;
+    }
+    const data = await response.json();
+    if (!symptomSearchInput.value.trim()) {
+        renderSuggestions(data.related, 'इनके साथ अक्सर ये लक्षण भी होते हैं: (Often seen together:)');
+    }
+}
+
+async function loadSuggestions(query) {
+    if (!query.trim()) {
+        loadRelated();
+        return;
+    }
+    const response = await fetch(`/symptoms/suggest?limit=20&q=${encodeURIComponent(query)}`);
+    if (!response.ok) {
+        return;
+    }
+    const data = await response.json();
+    // जवाब आने तक user आगे टाइप कर चुका हो तो पुराना result न दिखाएँ
+    if (symptomSearchInput.value === query) {
+        renderSuggestions(data.suggestions);
+    }
+}
+
+symptomSearchInput.addEventListener('input', function () {
+    clearTimeout(suggestTimer);
+    suggestTimer = setTimeout(() => loadSuggestions(symptomSearchInput.value), 120);
+});
+
+if (symptomModalElement) {
+     symptomModalElement.addEventListener('show.bs.modal', function () {
+        selectedSymptoms.clear();
+        symptomSearchInput.value = '';
+        loadRelated();
+     });
+     symptomModalElement.addEventListener('shown.bs.modal', function () {
+        symptomSearchInput.focus();
+     });
+}
+
+submitSymptomsButton.addEventListener('click', function() {
+    let existingSymptoms = symptomsInput.value.trim();
+    let finalSymptomsArray = [];
+
+    if (existingSymptoms) {
+        finalSymptomsArray = existingSymptoms.split(',').map(s => s.trim()).filter(s => s);
+    }
+
+    const uniqueSymptomsSet = new Set(finalSymptomsArray);
+    selectedSymptoms.forEach(symptom => {
+        uniqueSymptomsSet.add(symptom);
+    });
+
+    const finalSymptomsString = Array.from(uniqueSymptomsSet).join(', ');
+    symptomsInput.value = finalSymptomsString;
+});
+
+
+// =================================================================
+// UPDATED: Speech Recognition Logic with IMPROVED Mapping
+// =================================================================
+
+// Hindi/English phrase matching server पर होती है (POST /symptoms/parse)
+async function mapToValidSymptoms(spokenText) {
+    const response = await fetch('/symptoms/parse', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ text: spokenText })
+    });
+    const result = response.ok ? await response.json() : { symptoms: [], names: [] };
+
+    // Return unique system keys and their display names (Hindi नाम server से आते हैं)
+    return {
+        keys: result.symptoms,
+        display: Array.from(new Set(result.names)).join(', ')
+    };
+}
+
+
+const startSpeechRecognitionButton = document.getElementById('startSpeechRecognition');
+
+startSpeechRecognitionButton.addEventListener('click', startSpeechRecognition);
+
+function stopRecognitionManually() {
+    if(recognition) {
+        recognition.stop();
+    }
+}
+
+function startSpeechRecognition() {
+    if (!('webkitSpeechRecognition' in window)) {
+        alert("Speech recognition is not supported in this browser. Please use Chrome.");
+        return;
+    }
+
+    // Hide old transcription and show modal
+    transcriptionDiv.textContent = '';
+    liveTranscription.textContent = 'सुन रहा हूँ... (Listening...)';
+    bootstrapMicModal.show();
+
+
+    recognition = new webkitSpeechRecognition();
+    recognition.lang = 'hi-IN'; // Set to Hindi for better Hindi/Hinglish recognition
+    recognition.interimResults = true;
+
+    recognition.onstart = function () {
+        liveTranscription.textContent = 'बोलना शुरू करें...';
+    };
+
+    recognition.onresult = async function (event) {
+        let interimTranscript = '';
+        let finalTranscript = '';
+
+        for (let i = event.resultIndex; i < event.results.length; ++i) {
+            if (event.results[i].isFinal) {
+                finalTranscript += event.results[i][0].transcript;
+            } else {
+                interimTranscript += event.results[i][0].transcript;
+            }
+        }
+
+        // Show live transcription in the modal
+        liveTranscription.textContent = interimTranscript || finalTranscript;
+
+        if (finalTranscript) {
+            const mappingResult = await mapToValidSymptoms(finalTranscript);
+
+            const systemSymptoms = mappingResult.keys.join(', ');
+            const readableSymptoms = mappingResult.display;
+
+            // Display the mapped symptoms to the user
+            if (systemSymptoms) {
+                transcriptionDiv.innerHTML = `✅ **Recognized Symptoms (System Keys):** ${systemSymptoms} <br> 🗣️ **Translated/Mapped Symptoms (User View):** ${readableSymptoms}`;
+            } else {
+                transcriptionDiv.textContent = `❌ Recognized Text: "${finalTranscript}". No matching symptoms found in the system database.`;
+            }
+
+            // Add result to symptoms input box (Only add valid keys)
+            if (systemSymptoms) {
+                let existingSymptoms = symptomsInput.value.trim();
+                let finalSymptomsSet = new Set();
+
+                // Add existing symptoms
+                if (existingSymptoms) {
+                    existingSymptoms.split(',').map(s => s.trim()).filter(s => s).forEach(s => finalSymptomsSet.add(s));
+                }
+
+                // Add new mapped symptoms
+                mappingResult.keys.forEach(key => finalSymptomsSet.add(key));
+
+                // Update the input field
+                symptomsInput.value = Array.from(finalSymptomsSet).join(', ');
+            }
+        }
+    };
+
+    recognition.onerror = function (event) {
+        console.error('Speech recognition error:', event.error);
+        liveTranscription.textContent = `🎙️ Error: ${event.error}. कृपया पुन: प्रयास करें।`;
+        bootstrapMicModal.hide();
+    };
+
+    recognition.onend = function () {
+        console.log('Speech recognition ended.');
+        bootstrapMicModal.hide();
+    };
+
+    recognition.start();
+}
+
+// =================================================================
+// Prediction (JSON API: POST /api/v1/predict, पूरा page reload नहीं)
+// =================================================================
+
+const predictForm = document.getElementById('predictForm');
+const apiToken = predictForm.dataset.apiToken;
+const predictMessage = document.getElementById('predictMessage');
+const predictResults = document.getElementById('predictResults');
+
+function fillList(id, items) {
+    const list = document.getElementById(id);
+    list.replaceChildren(...items.map(item => {
+        const li = document.createElement('li');
+        li.textContent = item;
+        return li;
+    }));
+}
+
+function showPrediction(result) {
+    currentDisease = result.disease;
+    document.getElementById('diseaseText').textContent = result.disease;
+    document.getElementById('descriptionText').textContent = result.description;
+    fillList('precautionList', result.precautions);
+    fillList('medicationsList', result.medications);
+    fillList('workoutsList', result.workouts);
+    fillList('dietsList', result.diets);
+    predictMessage.hidden = true;
+    predictResults.hidden = false;
+    predictResults.scrollIntoView({ behavior: 'smooth' });
+}
+
+function showPredictMessage(message) {
+    currentDisease = '';
+    predictMessage.textContent = message;
+    predictMessage.hidden = false;
+    predictResults.hidden = true;
+}
+
+predictForm.addEventListener('submit', async function (event) {
+    if (!apiToken || !window.fetch) {
+        return; // पुराना तरीका: form POST /predict
+    }
+    event.preventDefault();
+
+    const symptoms = symptomsInput.value.trim();
+    if (!symptoms) {
+        showPredictMessage('कृपया बीमारी का अनुमान लगाने के लिए कम से कम एक लक्षण चुनें।');
+        return;
+    }
+
+    let response;
+    try {
+        response = await fetch('/api/v1/predict', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json', 'Authorization': `Bearer ${apiToken}` },
+            body: JSON.stringify({ symptoms: symptoms })
+        });
+    } catch (error) {
+        console.error('Prediction API error:', error);
+        predictForm.submit();
+        return;
+    }
+
+    if (response.status === 401) {
+        // Token expired (page बहुत देर खुला रहा) - server-rendered path login भी संभालता है
+        predictForm.submit();
+        return;
+    }
+    const result = await response.json();
+    if (response.ok) {
+        showPrediction(result);
+    } else {
+        showPredictMessage(result.message || result.error);
+    }
+});
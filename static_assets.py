@@ -0,0 +1,63 @@
+# ============================================================
+# Static Assets (fingerprinted files, python -m scripts.build_assets)
+# ============================================================
+#
+# Build step static/ की images के छोटे WebP/JPEG variants और static/src/ की CSS/JS को
+# static/dist/ में content-hash वाले नामों से लिखता है (index.3f9a1c2e.css), साथ में
+# .br/.gz versions और manifest.json। नाम content से बनता है, इसलिए file कभी बदलती नहीं
+# और browser उसे एक साल तक बिना पूछे cache रख सकता है (Cache-Control: immutable)।
+#
+# Manifest न हो (build नहीं चला) तो हर asset पुराने /static/<name> URL पर ही मिलता है।
+
+import json
+import os
+
+from markupsafe import Markup
+
+MANIFEST_NAME = 'manifest.json'
+
+# Accept-Encoding में पहले वाला बेहतर
+ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+
+
+class AssetManifest:
+    def __init__(self, directory, manifest=None):
+        self.directory = directory
+        manifest = manifest or {}
+        # static/ के सापेक्ष source name -> dist में hashed file
+        self.files = manifest.get('files', {})
+        # image name -> {'width', 'height', 'src', 'srcset', 'webp'}
+        self.images = manifest.get('images', {})
+        # hashed file -> उसके precompressed encodings
+        self.encodings = {path: tuple(encodings) for path, encodings in manifest.get('encodings', {}).items()}
+
+    @classmethod
+    def load(cls, directory):
+        try:
+            with open(os.path.join(directory, MANIFEST_NAME), encoding='utf-8') as f:
+                return cls(directory, json.load(f))
+        except (OSError, ValueError):
+            return cls(directory)
+
+    def __bool__(self):
+        return bool(self.files)
+
+    def resolve(self, filename, accept_encodings):
+        # Hashed file -> (dist में भेजी जाने वाली file, Content-Encoding या None)
+        for encoding, suffix in ENCODINGS:
+            if encoding in self.encodings.get(filename, ()) and encoding in accept_encodings:
+                return filename + suffix, encoding
+        return filename, None
+
+
+def picture_html(image, prefix, alt='', css_class='', sizes=''):
+    # <picture>: WebP variants, और उन browsers के लिए JPEG/PNG variants जो WebP नहीं पढ़ते
+    def srcset(variants):
+        return ', '.join(f"{prefix}{path} {width}w" for width, path in variants)
+
+    return Markup(
+        '<picture><source type="image/webp" srcset="{webp}" sizes="{sizes}">'
+        '<img src="{src}" srcset="{srcset}" sizes="{sizes}" width="{width}" height="{height}" alt="{alt}" '
+        'class="{css_class}" decoding="async"></picture>'
+    ).format(webp=srcset(image['webp']), srcset=srcset(image['srcset']), src=prefix + image['src'],
+             sizes=sizes, width=image['width'], height=image['height'], alt=alt, css_class=css_class)
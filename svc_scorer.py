@@ -0,0 +1,164 @@
+# ============================================================
+# Compiled Linear SVC Scorer (pure NumPy - sklearn/scipy की ज़रूरत नहीं)
+# ============================================================
+#
+# models/svc.pkl एक linear-kernel, one-vs-one SVC है (41 classes -> 820 pairs)।
+# यह scorer libsvm का predict हूबहू दोहराता है:
+#   - kernel value K(x, sv) = साझा symptoms की गिनती (binary vectors -> exact integer)
+#   - हर pair का decision value libsvm के उसी क्रम में जोड़ा जाता है (sequential cumsum)
+#   - vote: dec > 0 ? class i : class j, और ties में सबसे छोटा class index
+#
+# coef_ (820 x 132) से सीधा dot product करने पर कई pairs का decision value
+# ±1e-16 के noise पर 0 के आसपास आता है और vote पलट जाता है, इसलिए artifact
+# में dual coefficients और support vectors रखे जाते हैं।
+
+import numpy as np
+
+ARTIFACT_VERSION = 1
+
+# Matrix predict में इतनी rows एक साथ (terms array = rows x 820 x max_terms)
+_PREDICT_CHUNK_ROWS = 64
+
+
+class LinearSVCScorer:
+    def __init__(self, classes, support_vectors, pair_sv, pair_coef, intercept, feature_names=(), model_sha256=''):
+        # model_sha256: जिस svc.pkl से export हुआ उसका hash (पुराने artifacts में खाली)
+        self.classes = np.asarray(classes)
+        self.support_vectors = np.asarray(support_vectors, dtype=np.uint8)
+        self.pair_sv = np.asarray(pair_sv, dtype=np.int32)
+        self.pair_coef = np.asarray(pair_coef, dtype=np.float64)
+        self.intercept = np.asarray(intercept, dtype=np.float64)
+        self.feature_names = tuple(str(name) for name in np.asarray(feature_names).tolist())
+        self.model_sha256 = str(np.asarray(model_sha256))
+
+        n_classes = len(self.classes)
+        self.n_features = self.support_vectors.shape[1]
+        pairs = [(i, j) for i in range(n_classes) for j in range(i + 1, n_classes)]
+        self.pair_i = np.array([i for i, _ in pairs], dtype=np.int32)
+        self.pair_j = np.array([j for _, j in pairs], dtype=np.int32)
+
+        # Active symptom rows का sum सीधे kernel values देता है
+        self._sv_by_feature = np.ascontiguousarray(self.support_vectors.T, dtype=np.float64)
+        # (max_terms, 820) layout: हर step पर सभी 820 pairs का एक term एक साथ जुड़ता है
+        self._term_sv = np.ascontiguousarray(self.pair_sv.T, dtype=np.intp)
+        self._term_coef = np.ascontiguousarray(self.pair_coef.T)
+        # (820, 41): pair की confidence class i में जुड़ती है और class j से घटती है
+        self._pair_sign = np.zeros((len(pairs), n_classes))
+        self._pair_sign[np.arange(len(pairs)), self.pair_i] = 1
+        self._pair_sign[np.arange(len(pairs)), self.pair_j] = -1
+
+    # --------------------------------------------------------
+    # Export (sklearn SVC object -> arrays)
+    # --------------------------------------------------------
+
+    @classmethod
+    def from_svc(cls, svc, model_sha256=''):
+        if getattr(svc, 'kernel', None) != 'linear':
+            raise ValueError(f"Only linear-kernel SVC can be compiled, got kernel={getattr(svc, 'kernel', None)!r}.")
+
+        support_vectors = np.asarray(svc.support_vectors_)
+        if not np.isin(support_vectors, (0, 1)).all():
+            raise ValueError("Support vectors must be binary symptom vectors.")
+
+        n_support = np.asarray(svc.n_support_)
+        start = np.concatenate([[0], np.cumsum(n_support)[:-1]])
+        dual_coef = np.asarray(svc._dual_coef_)
+        n_classes = len(n_support)
+        max_terms = int(np.sort(n_support)[-2:].sum())
+
+        pair_sv = []
+        pair_coef = []
+        for i in range(n_classes):
+            for j in range(i + 1, n_classes):
+                # libsvm: पहले class i के SVs (sv_coef[j-1]), फिर class j के (sv_coef[i])
+                sv_i = np.arange(start[i], start[i] + n_support[i])
+                sv_j = np.arange(start[j], start[j] + n_support[j])
+                sv = np.concatenate([sv_i, sv_j])
+                coef = np.concatenate([dual_coef[j - 1, sv_i], dual_coef[i, sv_j]])
+                # Padding के 0.0 terms sequential sum को नहीं बदलते
+                pad = max_terms - len(sv)
+                pair_sv.append(np.pad(sv, (0, pad)))
+                pair_coef.append(np.pad(coef, (0, pad)))
+
+        return cls(classes=svc.classes_, support_vectors=support_vectors, pair_sv=np.array(pair_sv),
+                   pair_coef=np.array(pair_coef), intercept=svc._intercept_,
+                   feature_names=getattr(svc, 'feature_names_in_', ()), model_sha256=model_sha256)
+
+    def arrays(self):
+        # Artifact/snapshot में रखे जाने वाले arrays - LinearSVCScorer(**arrays) से वापस बनता है
+        return {'classes': self.classes, 'support_vectors': self.support_vectors,
+                'pair_sv': self.pair_sv.astype(np.int16), 'pair_coef': self.pair_coef,
+                'intercept': self.intercept, 'feature_names': np.array(self.feature_names),
+                'model_sha256': np.array(self.model_sha256)}
+
+    def save(self, path):
+        np.savez_compressed(path, version=ARTIFACT_VERSION, **self.arrays())
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path, allow_pickle=False) as data:
+            version = int(data['version'])
+            if version != ARTIFACT_VERSION:
+                raise ValueError(f"Unsupported scorer artifact version {version} (expected {ARTIFACT_VERSION}).")
+            return cls(**{name: data[name] for name in data.files if name != 'version'})
+
+    # --------------------------------------------------------
+    # Scoring
+    # --------------------------------------------------------
+
+    def _pair_decisions(self, kernel_values):
+        # kernel_values: (..., n_SV) -> (..., 820)
+        terms = self._term_coef * np.take(kernel_values, self._term_sv, axis=-1)
+        # libsvm की तरह terms एक-एक करके जोड़ें (np.sum pairwise जोड़ता है और ±1e-16 का फ़र्क लाता है)
+        decisions = terms[..., 0, :].copy()
+        for k in range(1, terms.shape[-2]):
+            decisions += terms[..., k, :]
+        return decisions + self.intercept
+
+    def _vote_counts(self, decisions):
+        # libsvm: dec > 0 ? class i : class j
+        winners = np.where(decisions > 0, self.pair_i, self.pair_j)
+        n_classes = len(self.classes)
+        if winners.ndim == 1:
+            return np.bincount(winners, minlength=n_classes)
+        offsets = np.arange(len(winners))[:, None] * n_classes
+        votes = np.bincount((winners + offsets).ravel(), minlength=len(winners) * n_classes)
+        return votes.reshape(len(winners), n_classes)
+
+    def _vote(self, decisions):
+        # Ties में सबसे छोटा class index (libsvm जैसा)
+        return self._vote_counts(decisions).argmax(axis=-1)
+
+    def decision_indices(self, indices):
+        # Sparse path: सिर्फ active symptom indices पर dot product
+        kernel_values = self._sv_by_feature[indices].sum(axis=0)
+        return self._pair_decisions(kernel_values)
+
+    def predict_indices(self, indices):
+        return self.classes[self._vote(self.decision_indices(indices))]
+
+    def decision_matrix(self, X):
+        X = np.asarray(X, dtype=np.float64)
+        # Binary X के लिए X @ SV.T exact integers देता है, इसलिए BLAS का क्रम मायने नहीं रखता
+        kernel_values = X @ self._sv_by_feature
+        out = np.empty((len(X), len(self.intercept)))
+        for start in range(0, len(X), _PREDICT_CHUNK_ROWS):
+            stop = start + _PREDICT_CHUNK_ROWS
+            out[start:stop] = self._pair_decisions(kernel_values[start:stop])
+        return out
+
+    def class_scores(self, decisions):
+        # sklearn के decision_function_shape='ovr' जैसा: votes + (-1/3, 1/3) में squash की गई confidence।
+        # Votes predict() वाले नियम (dec > 0) से गिने जाते हैं, ताकि ranking model के जवाब से मेल खाए।
+        # decisions: (820,) या (N, 820) -> (41,) या (N, 41)
+        confidence = decisions @ self._pair_sign
+        return self._vote_counts(decisions) + confidence / (3 * (np.abs(confidence) + 1))
+
+    def predict(self, X):
+        # svc.predict(X) का drop-in replacement
+        X = np.asarray(X)
+        if X.ndim != 2 or X.shape[1] != self.n_features:
+            raise ValueError(f"Expected a 2D array with {self.n_features} features, got shape {X.shape}.")
+        if len(X) == 0:
+            return self.classes[:0]
+        return self.classes[self._vote(self.decision_matrix(X))]
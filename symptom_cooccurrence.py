@@ -0,0 +1,148 @@
+# ============================================================
+# Symptom Co-occurrence Index ("साथ में और कौन-से symptoms?")
+# ============================================================
+#
+# Offline (python -m scripts.build_cooccurrence) datasets/Training.csv और datasets/symtoms_df.csv
+# के हर record (एक बीमारी + उसके symptoms) से बनता है:
+#   - 132 x 132 co-occurrence counts और lift, sparse (CSR: indptr/indices) - ज़्यादातर pairs कभी
+#     साथ नहीं दिखते
+#   - हर बीमारी के symptoms का bitset (Python int, bit i = symptoms_dict index i)
+#
+# Query: चुने गए symptoms जिन बीमारियों में साथ दिखे हैं वे candidates हैं (हर symptom के
+# disease bitset का AND)। अगला symptom वह जो candidates को सबसे बराबर दो हिस्सों में बाँटे -
+# उसका जवाब (हाँ/नहीं) सबसे ज़्यादा बीमारियाँ हटाता है। बराबरी पर ज़्यादा co-occurrence वाला पहले।
+# सारा काम int AND/OR और bit_count() पर, कोई model call नहीं।
+
+import heapq
+import json
+
+import numpy as np
+
+COOCCURRENCE_VERSION = 1
+
+
+def iter_bits(mask):
+    # Set bits के indices, छोटे से बड़े
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class CooccurrenceIndex:
+    def __init__(self, symptoms, diseases, totals, indptr, indices, counts, lift, disease_bits, records, sources=None):
+        # symptoms: index -> symptoms_dict key; diseases: bit -> disease name
+        self.symptoms = [str(name) for name in symptoms]
+        self.diseases = [str(name) for name in diseases]
+        self.totals = np.asarray(totals, dtype=np.int32)
+        self.indptr = np.asarray(indptr, dtype=np.int32)
+        self.indices = np.asarray(indices, dtype=np.int16)
+        self.counts = np.asarray(counts, dtype=np.int32)
+        self.lift = np.asarray(lift, dtype=np.float32)
+        self.disease_bits = np.asarray(disease_bits, dtype=np.uint8)
+        self.records = int(records)
+        self.sources = dict(sources or {})
+
+        # Query के लिए Python structures: sparse rows -> {j: (count, lift)}, bitsets -> ints
+        self._rows = []
+        for start, end in zip(self.indptr[:-1].tolist(), self.indptr[1:].tolist()):
+            pairs = zip(self.counts[start:end].tolist(), [round(x, 3) for x in self.lift[start:end].tolist()])
+            self._rows.append(dict(zip(self.indices[start:end].tolist(), pairs)))
+        self.disease_masks = [int.from_bytes(row.tobytes(), 'little') for row in self.disease_bits]
+        # हर symptom -> जिन बीमारियों में वह दिखता है उनका bitset
+        self.symptom_masks = [0] * len(self.symptoms)
+        for disease, mask in enumerate(self.disease_masks):
+            for index in iter_bits(mask):
+                self.symptom_masks[index] |= 1 << disease
+        self._all_diseases = (1 << len(self.diseases)) - 1
+        self._totals = self.totals.tolist()
+
+    @classmethod
+    def build(cls, records, symptoms, diseases, sources=None):
+        # records: (disease name, symptom indices) pairs
+        diseases = sorted(diseases)
+        disease_ids = {name: i for i, name in enumerate(diseases)}
+        matrix = np.zeros((len(records), len(symptoms)), dtype=np.int32)
+        present = np.zeros((len(diseases), len(symptoms)), dtype=bool)
+        for row, (disease, indices) in enumerate(records):
+            matrix[row, list(indices)] = 1
+            present[disease_ids[disease], list(indices)] = True
+
+        cooccurrence = matrix.T @ matrix
+        totals = np.diag(cooccurrence).copy()
+        np.fill_diagonal(cooccurrence, 0)
+        rows, cols = np.nonzero(cooccurrence)
+        counts = cooccurrence[rows, cols]
+        # lift > 1: दोनों अकेले-अकेले जितना अनुमान देते हैं उससे ज़्यादा बार साथ
+        lift = counts * len(records) / (totals[rows].astype(np.float64) * totals[cols])
+        indptr = np.concatenate([[0], np.cumsum(np.bincount(rows, minlength=len(symptoms)))])
+        disease_bits = np.packbits(present, axis=1, bitorder='little')
+        return cls(symptoms, diseases, totals, indptr, cols, counts, lift, disease_bits, len(records), sources)
+
+    def arrays(self):
+        return {'symptoms': np.array(self.symptoms), 'diseases': np.array(self.diseases), 'totals': self.totals,
+                'indptr': self.indptr, 'indices': self.indices, 'counts': self.counts, 'lift': self.lift,
+                'disease_bits': self.disease_bits, 'records': np.array(self.records),
+                'sources': np.array(json.dumps(self.sources, sort_keys=True))}
+
+    def save(self, path):
+        np.savez_compressed(path, version=COOCCURRENCE_VERSION, **self.arrays())
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path, allow_pickle=False) as data:
+            version = int(data['version'])
+            if version != COOCCURRENCE_VERSION:
+                raise ValueError(f"Unsupported co-occurrence index version {version} "
+                                 f"(expected {COOCCURRENCE_VERSION}).")
+            return cls(data['symptoms'].tolist(), data['diseases'].tolist(), data['totals'], data['indptr'],
+                       data['indices'], data['counts'], data['lift'], data['disease_bits'], data['records'].item(),
+                       json.loads(data['sources'].item()))
+
+    def candidates(self, indices):
+        # जिन बीमारियों में सारे चुने गए symptoms दिखे हैं; कोई न हो तो जिनमें सबसे ज़्यादा
+        candidates = self._all_diseases
+        for index in indices:
+            candidates &= self.symptom_masks[index]
+        if candidates or not indices:
+            return candidates
+        selected = 0
+        for index in indices:
+            selected |= 1 << index
+        overlaps = [(mask & selected).bit_count() for mask in self.disease_masks]
+        best = max(overlaps)
+        if not best:
+            return self._all_diseases
+        return sum(1 << disease for disease, overlap in enumerate(overlaps) if overlap == best)
+
+    def related(self, indices, k=5):
+        # Returns (candidate disease names, top-k अगले symptoms - हर एक का split और co-occurrence)
+        indices = set(indices)
+        candidates = self.candidates(indices)
+        total = candidates.bit_count()
+
+        # सिर्फ वे symptoms जो किसी candidate में दिखते हैं और अभी चुने नहीं गए
+        pool = 0
+        for disease in iter_bits(candidates):
+            pool |= self.disease_masks[disease]
+        for index in indices:
+            pool &= ~(1 << index)
+
+        ranked = []
+        for index in iter_bits(pool):
+            with_symptom = (self.symptom_masks[index] & candidates).bit_count()
+            count = 0
+            lift = 0.0
+            for selected in indices:
+                pair = self._rows[selected].get(index)
+                if pair is not None:
+                    count += pair[0]
+                    lift = max(lift, pair[1])
+            # बराबर बँटवारा पहले, फिर ज़्यादा co-occurrence, फिर ज़्यादा records में दिखने वाला
+            ranked.append((-min(with_symptom, total - with_symptom), -count, -self._totals[index], index,
+                           with_symptom, lift))
+
+        related = [{'symptom': self.symptoms[index], 'diseases_with': with_symptom,
+                    'diseases_without': total - with_symptom, 'cooccurrence': -count, 'lift': lift}
+                   for _, count, _, index, with_symptom, lift in heapq.nsmallest(max(0, k), ranked)]
+        return [self.diseases[disease] for disease in iter_bits(candidates)], related
@@ -0,0 +1,72 @@
+# ============================================================
+# Precomputed Lookup Table for Small Symptom Sets
+# ============================================================
+#
+# ज़्यादातर users 1-4 symptoms चुनते हैं। इन सभी combinations का जवाब offline
+# (python -m scripts.build_lookup) पहले से निकालकर एक sorted uint64 array में रखा जाता है:
+#
+#   entry = key << 8 | class_id
+#   key   = sorted symptom indices, हर index (+1) एक byte में: i0+1 | (i1+1) << 8 | ...
+#
+# 132 symptoms का पूरा bitmask 64 bits में नहीं आता, जबकि 7 तक indices का packed key
+# आ जाता है और class_id उसी entry के आख़िरी byte में रहता है - एक ही array, एक ही
+# binary search। File को mmap किया जाता है, इसलिए सभी gunicorn workers एक ही
+# page cache share करते हैं।
+
+import json
+
+import numpy as np
+
+from snapshot import file_sha256
+
+LOOKUP_VERSION = 1
+# 7 indices x 8 bits + 8 bits class_id = 64 bits
+MAX_PACKED_SYMPTOMS = 7
+
+
+def pack_key(indices):
+    key = 0
+    for shift, index in enumerate(sorted(indices)):
+        key |= (index + 1) << (8 * shift)
+    return key
+
+
+def pack_keys(combos):
+    # combos: (n, k) sorted index rows -> uint64 keys (vectorized pack_key)
+    combos = np.asarray(combos, dtype=np.uint64)
+    keys = np.zeros(len(combos), dtype=np.uint64)
+    for shift in range(combos.shape[1]):
+        keys |= (combos[:, shift] + np.uint64(1)) << np.uint64(8 * shift)
+    return keys
+
+
+class SymptomLookup:
+    def __init__(self, entries, max_size):
+        self.entries = entries
+        self.max_size = max_size
+
+    @classmethod
+    def load(cls, table_path, meta_path, scorer_path):
+        with open(meta_path, encoding='utf-8') as f:
+            meta = json.load(f)
+        if meta.get('version') != LOOKUP_VERSION:
+            raise ValueError(f"Unsupported lookup table version {meta.get('version')} (expected {LOOKUP_VERSION}).")
+        # पुराने model से बना table गलत जवाब देगा - scorer artifact का hash मिलना ज़रूरी है
+        if meta.get('scorer_sha256') != file_sha256(scorer_path):
+            raise ValueError("Lookup table was built from a different model. Rebuild it: python -m scripts.build_lookup")
+        entries = np.load(table_path, mmap_mode='r')
+        if entries.dtype != np.uint64 or len(entries) != meta.get('entries'):
+            raise ValueError("Lookup table file does not match its metadata.")
+        return cls(entries, int(meta['max_size']))
+
+    def get(self, indices):
+        # indices: unique symptom indices; table में न हो तो None
+        if not indices or len(indices) > self.max_size:
+            return None
+        query = np.uint64(pack_key(indices) << 8)
+        pos = int(np.searchsorted(self.entries, query))
+        if pos < len(self.entries):
+            entry = int(self.entries[pos])
+            if entry >> 8 == int(query) >> 8:
+                return entry & 0xFF
+        return None
@@ -0,0 +1,157 @@
+# ============================================================
+# Symptom Parser (free text / Hindi / टूटे keys -> symptoms_dict keys)
+# ============================================================
+#
+# हर symptom के phrases (English key, Hindi नाम और synonyms - datasets/symptom_phrases.json)
+# से एक Aho-Corasick automaton बनता है। पूरा text एक ही linear pass में scan होता है,
+# phrases की गिनती चाहे जितनी हो:
+#
+#   "मुझे तेज बुखार है, सर दर्द और खांसी"  ->  ['high_fever', 'headache', 'cough']
+#
+# - Text और phrases दोनों एक ही normalize() से गुज़रते हैं: lowercase, '_' और punctuation
+#   -> space, ँ -> ं। इसलिए 'spotting_ urination', 'spotting urination' और
+#   'Spotting-Urination' तीनों एक ही phrase हैं।
+# - Match सिर्फ पूरे शब्दों पर (सरदर्द के अंदर 'दर्द' नहीं)।
+# - Overlap होने पर सबसे लंबा phrase जीतता है: 'तेज बुखार' -> high_fever, सिर्फ 'बुखार' नहीं।
+# - एक phrase दो symptoms पर हो ('पेट दर्द') तो पहले जोड़ा गया जीतता है; क्रम:
+#   synonyms, फिर Hindi नाम, फिर English keys।
+
+import json
+import re
+import unicodedata
+
+# Comma, semicolon, newline, danda - इनसे text segments में बँटता है (unknown parts बताने के लिए)
+_SEGMENT_BREAK = re.compile(r'[,;|\n\r।॥]+')
+# Latin/digits, Devanagari (danda छोड़कर) और segment marker '|' के अलावा सब कुछ space; '_' भी
+_NON_WORD = re.compile(r'[^0-9a-zÀ-ɏऀ-ॣ०-ॿ|]+')
+
+
+def normalize(text):
+    text = str(text)
+    if not unicodedata.is_normalized('NFC', text):
+        text = unicodedata.normalize('NFC', text)
+    text = _SEGMENT_BREAK.sub(' | ', text.lower().replace('ँ', 'ं'))
+    # Segments ' | ' से जुड़ते हैं - '|' किसी phrase में नहीं होता, इसलिए कोई match segment पार नहीं करता
+    return ' '.join(_NON_WORD.sub(' ', text).split())
+
+
+class SymptomParser:
+    def __init__(self, phrases):
+        # phrases: {phrase: symptom key}; phrase पहले से normalize() किया हुआ
+        # Automaton शब्दों पर चलता है, characters पर नहीं: match वैसे भी पूरे शब्दों पर ही चाहिए,
+        # और Python loop के steps ~5 गुना कम हो जाते हैं
+        self.phrases = dict(phrases)
+        goto = [{}]
+        output = [None]
+        for phrase, key in self.phrases.items():
+            node = 0
+            for word in phrase.split(' '):
+                nxt = goto[node].get(word)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[node][word] = nxt
+                    goto.append({})
+                    output.append(None)
+                node = nxt
+            output[node] = (len(phrase.split(' ')), key)
+
+        # BFS से failure links; dict_link = fail chain पर अगला node जिस पर कोई phrase खत्म होता है
+        fail = [0] * len(goto)
+        dict_link = [0] * len(goto)
+        queue = list(goto[0].values())
+        for node in queue:
+            for word, child in goto[node].items():
+                queue.append(child)
+                state = fail[node]
+                while state and word not in goto[state]:
+                    state = fail[state]
+                fail[child] = goto[state].get(word, 0)
+                dict_link[child] = fail[child] if output[fail[child]] is not None else dict_link[fail[child]]
+
+        self._goto = goto
+        self._fail = fail
+        self._output = output
+        self._dict_link = dict_link
+        # किसी phrase में न आने वाला शब्द automaton को सीधे root पर भेज देता है
+        self._vocabulary = frozenset(word for edges in goto for word in edges)
+
+    @classmethod
+    def from_phrase_table(cls, symptom_keys, phrase_table):
+        # phrase_table: {key: {"hi": ..., "synonyms": [...]}} (datasets/symptom_phrases.json)
+        unknown = sorted(set(phrase_table) - set(symptom_keys))
+        if unknown:
+            raise ValueError(f"Phrase table has symptoms that are not in symptoms_dict: {', '.join(unknown)}")
+
+        phrases = {}
+
+        def add(phrase, key):
+            phrase = normalize(phrase)
+            if phrase and '|' not in phrase:
+                phrases.setdefault(phrase, key)
+
+        for key, entry in phrase_table.items():
+            for phrase in entry.get('synonyms', ()):
+                add(phrase, key)
+        for key, entry in phrase_table.items():
+            if entry.get('hi'):
+                add(entry['hi'], key)
+        for key in symptom_keys:
+            add(key, key)
+        return cls(phrases)
+
+    @classmethod
+    def load(cls, path, symptom_keys):
+        with open(path, encoding='utf-8') as f:
+            return cls.from_phrase_table(symptom_keys, json.load(f))
+
+    def _matches(self, words):
+        # (start, end, key) word positions पर - हर match, एक ही pass में
+        goto, fail, output, dict_link = self._goto, self._fail, self._output, self._dict_link
+        vocabulary = self._vocabulary
+        node = 0
+        for end, word in enumerate(words, 1):
+            if word not in vocabulary:
+                node = 0
+                continue
+            while node and word not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(word, 0)
+
+            hit = node if output[node] is not None else dict_link[node]
+            while hit:
+                length, key = output[hit]
+                yield end - length, end, key
+                hit = dict_link[hit]
+
+    def parse(self, text):
+        # Returns (symptom keys क्रम से और बिना duplicates के, वे segments जिनमें कोई symptom नहीं मिला)
+        text = normalize(text)
+        words = text.split(' ')
+        # Leftmost-longest: start पर sort, फिर सबसे लंबा; overlap वाले छोटे matches छोड़ें
+        matches = sorted(self._matches(words), key=lambda m: (m[0], -m[1]))
+
+        keys = {}
+        starts = []
+        covered = 0
+        for start, end, key in matches:
+            if start < covered:
+                continue
+            covered = end
+            starts.append(start)
+            keys.setdefault(key)
+
+        # जिन segments में एक भी match शुरू नहीं हुआ
+        unknown = []
+        offset = 0
+        i = 0
+        for segment in text.split('|'):
+            segment = segment.strip()
+            stop = offset + (segment.count(' ') + 1 if segment else 0)
+            found = False
+            while i < len(starts) and starts[i] < stop:
+                found = True
+                i += 1
+            if segment and not found:
+                unknown.append(segment)
+            offset = stop + 1
+        return list(keys), unknown
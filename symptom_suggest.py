@@ -0,0 +1,72 @@
+# ============================================================
+# Symptom Autocomplete (in-memory prefix index)
+# ============================================================
+#
+# /symptoms/suggest?q= हर keystroke पर आता है, इसलिए सारा काम startup पर होता है:
+# हर phrase (English नाम, Hindi नाम, synonyms) के हर शब्द से शुरू होने वाले हिस्से का
+# हर prefix -> पहले से ranked symptom ids। Request पर सिर्फ एक dict lookup और पहले से
+# बने JSON टुकड़ों को जोड़ना बचता है।
+#
+# Ranking: phrase की शुरुआत से match ('back' -> back_pain) बीच के शब्द वाले match
+# ('pain' -> back_pain) से पहले; symptom का अपना नाम synonym से पहले; फिर ज़्यादा
+# severity weight; फिर छोटा नाम।
+
+import json
+
+from symptom_parser import normalize
+
+# हर prefix के लिए इतने suggestions रखे जाते हैं (limit इससे ज़्यादा नहीं हो सकता)
+MAX_SUGGESTIONS = 20
+
+
+class SuggestIndex:
+    def __init__(self, symptom_keys, phrase_table, weights):
+        # phrase_table: datasets/symptom_phrases.json; weights: severity.read_severity_weights()
+        self.keys = list(symptom_keys)
+        self._items = []
+        prefixes = {}
+        for sid, key in enumerate(self.keys):
+            entry = phrase_table.get(key, {})
+            label = normalize(key)
+            weight = weights.get(key, 0)
+            self._items.append(json.dumps({'symptom': key, 'label': label, 'hi': entry.get('hi', label),
+                                           'weight': weight}, ensure_ascii=False))
+
+            # (phrase, synonym है या नहीं)
+            phrases = [(label, False), (normalize(entry.get('hi', '')), False)]
+            phrases.extend((normalize(phrase), True) for phrase in entry.get('synonyms', ()))
+            for phrase, is_synonym in phrases:
+                words = phrase.split(' ')
+                if not phrase or '|' in words:
+                    continue
+                for position in range(len(words)):
+                    term = ' '.join(words[position:])
+                    rank = (position > 0, is_synonym, -weight, len(label), sid)
+                    for end in range(1, len(term) + 1):
+                        best = prefixes.setdefault(term[:end], {})
+                        if sid not in best or rank < best[sid]:
+                            best[sid] = rank
+
+        # prefix -> top MAX_SUGGESTIONS symptom ids, ranked
+        self._index = {prefix: tuple(sorted(best, key=best.get)[:MAX_SUGGESTIONS])
+                       for prefix, best in prefixes.items()}
+
+    def __len__(self):
+        return len(self._index)
+
+    @staticmethod
+    def query_prefix(text):
+        # "itching, skin ra" -> "skin ra": comma-separated input में सिर्फ आख़िरी हिस्सा complete होता है
+        return normalize(text).rsplit('|', 1)[-1].strip()
+
+    def suggest(self, text, limit=10):
+        # Ranked symptom keys
+        ids = self._index.get(self.query_prefix(text), ())[:max(0, limit)]
+        return [self.keys[sid] for sid in ids]
+
+    def suggest_json(self, text, limit=10):
+        # Response body सीधे पहले से serialized items से: {"query": ..., "suggestions": [...]}
+        prefix = self.query_prefix(text)
+        ids = self._index.get(prefix, ())[:max(0, limit)]
+        return '{"query": %s, "suggestions": [%s]}' % (json.dumps(prefix, ensure_ascii=False),
+                                                        ', '.join(self._items[sid] for sid in ids))
@@ -0,0 +1,39 @@
+import os
+import tempfile
+
+import pytest
+
+# main import होने से पहले: अलग SQLite file, और tests में कोई reload watcher नहीं
+_tmpdir = tempfile.mkdtemp(prefix='medassist_tests_')
+os.environ.setdefault('DATABASE_URL', f"sqlite:///{os.path.join(_tmpdir, 'test.db')}")
+os.environ.setdefault('MODEL_RELOAD_INTERVAL', '0')
+os.environ.setdefault('PASSWORD_HASH_METHOD', 'pbkdf2:sha256:1000')
+
+TEST_EMAIL = 'tester@example.com'
+TEST_PASSWORD = 'password'
+
+
+@pytest.fixture(scope='session')
+def app_module():
+    import main
+
+    with main.main.app_context():
+        main.db.create_all()
+        if main.User.query.filter_by(email=TEST_EMAIL).first() is None:
+            user = main.User(username='tester', email=TEST_EMAIL)
+            user.set_password(TEST_PASSWORD)
+            main.db.session.add(user)
+            main.db.session.commit()
+    return main
+
+
+@pytest.fixture
+def client(app_module):
+    return app_module.main.test_client()
+
+
+@pytest.fixture
+def logged_in_client(client):
+    response = client.post('/login', data={'email': TEST_EMAIL, 'password': TEST_PASSWORD})
+    assert response.status_code == 302
+    return client
@@ -0,0 +1,44 @@
+import pytest
+
+from conftest import TEST_EMAIL, TEST_PASSWORD
+
+
+@pytest.mark.parametrize('body', [["itching"], "itching", 3])
+def test_differential_rejects_non_object_body(logged_in_client, body):
+    response = logged_in_client.post('/predict/differential', json=body)
+    assert response.status_code == 400
+    assert 'symptoms' in response.get_json()['error']
+
+
+def test_differential_returns_candidates(logged_in_client):
+    response = logged_in_client.post('/predict/differential', json={'symptoms': ['itching', 'skin_rash'], 'k': 3})
+    assert response.status_code == 200
+    assert len(response.get_json()['differential']) == 3
+
+
+@pytest.mark.parametrize('body', [["fever"], "fever", {'text': ["fever"]}])
+def test_parse_rejects_bodies_without_text(logged_in_client, body):
+    response = logged_in_client.post('/symptoms/parse', json=body)
+    assert response.status_code == 400
+    assert 'text' in response.get_json()['error']
+
+
+def test_parse_returns_symptoms(logged_in_client):
+    response = logged_in_client.post('/symptoms/parse', json={'text': 'itching and skin rash'})
+    assert response.status_code == 200
+    assert response.get_json()['symptoms'] == ['itching', 'skin_rash']
+
+
+@pytest.mark.parametrize('body', [["x"], "x", {}, {'email': ["tester@example.com"], 'password': 'password'},
+                                  {'email': 'tester@example.com', 'password': 1}, {'email': 'tester@example.com'}])
+def test_token_rejects_malformed_credentials(client, body):
+    response = client.post('/api/v1/token', json=body)
+    assert response.status_code == 400
+
+
+def test_token_checks_password(client):
+    response = client.post('/api/v1/token', json={'email': TEST_EMAIL, 'password': 'wrong'})
+    assert response.status_code == 401
+    response = client.post('/api/v1/token', json={'email': TEST_EMAIL, 'password': TEST_PASSWORD})
+    assert response.status_code == 200
+    assert response.get_json()['token']
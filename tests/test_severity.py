@@ -0,0 +1,50 @@
+import os
+
+os.environ.setdefault('MODEL_RELOAD_INTERVAL', '0')
+
+import numpy as np
+
+import main
+from severity import TriageScorer
+
+
+def triage_scorer():
+    return main.model_registry.current.triage_scorer
+
+
+def indices(*names):
+    return [main.symptoms_dict[name] for name in names]
+
+
+def test_single_critical_symptom_is_priority():
+    for name in ('coma', 'chest_pain', 'weakness_in_limbs'):
+        score, level = triage_scorer().score(indices(name))
+        assert score == 7
+        assert level == 'priority'
+
+
+def test_critical_symptoms_outrank_mild_ones_with_similar_sum():
+    mild = indices('itching', 'skin_rash', 'nodal_skin_eruptions', 'dischromic _patches')
+    critical = indices('coma', 'chest_pain', 'altered_sensorium')
+    assert triage_scorer().score(mild)[1] == 'routine'
+    assert triage_scorer().score(critical)[1] == 'priority'
+
+
+def test_score_threshold_still_reaches_urgent():
+    assert triage_scorer().score(indices('coma', 'chest_pain', 'high_fever'))[1] == 'urgent'
+
+
+def test_critical_weight_can_be_disabled():
+    scorer = TriageScorer(triage_scorer().weights, triage_scorer().thresholds)
+    assert scorer.score(indices('coma')) == (7, 'routine')
+
+
+def test_score_matrix_matches_score():
+    rows = [indices('coma'), indices('itching', 'skin_rash'), indices('coma', 'chest_pain', 'altered_sensorium'),
+            indices('coma', 'chest_pain', 'high_fever'), []]
+    matrix = np.zeros((len(rows), len(main.symptoms_dict)), dtype=np.uint8)
+    for row, row_indices in enumerate(rows):
+        matrix[row, row_indices] = 1
+    scores, levels = triage_scorer().score_matrix(matrix)
+    assert [(int(score), str(level)) for score, level in zip(scores, levels)] == \
+        [triage_scorer().score(row_indices) for row_indices in rows]
@@ -0,0 +1,44 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from scripts.export_model import ARTIFACT_PATH, MODEL_PATH, load_training_features
+from svc_scorer import LinearSVCScorer
+
+
+@pytest.fixture(scope='module')
+def svc():
+    with open(MODEL_PATH, 'rb') as f:
+        return pickle.load(f)
+
+
+@pytest.fixture(scope='module')
+def training(svc):
+    # Training.csv की हर row और उस पर svc.predict
+    features = load_training_features()
+    return features.to_numpy(dtype=np.float64), svc.predict(features)
+
+
+@pytest.fixture(scope='module', params=['compiled', 'artifact'])
+def scorer(request, svc):
+    if request.param == 'compiled':
+        return LinearSVCScorer.from_svc(svc)
+    return LinearSVCScorer.load(ARTIFACT_PATH)
+
+
+def test_predict_matches_svc_on_every_training_row(scorer, training):
+    X, expected = training
+    mismatches = np.flatnonzero(scorer.predict(X) != expected)
+    assert not len(mismatches), f"{len(mismatches)} rows differ, first row {mismatches[:1]}"
+
+
+def test_predict_indices_matches_svc_on_every_training_row(scorer, training):
+    X, expected = training
+    got = np.array([scorer.predict_indices(np.flatnonzero(vector)) for vector in X])
+    mismatches = np.flatnonzero(got != expected)
+    assert not len(mismatches), f"{len(mismatches)} rows differ, first row {mismatches[:1]}"
+
+
+def test_feature_names_match_training_columns(scorer):
+    assert list(scorer.feature_names) == list(load_training_features().columns)